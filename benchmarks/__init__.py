@@ -0,0 +1,8 @@
+"""
+Micro-benchmarks do bot. Rode cada um como módulo, a partir da raiz do projeto (ex: `python -m benchmarks.bench_models`).
+"""
+import os
+
+# `database` e `src.core` importam o `env`, que exige estas variáveis; os benchmarks não se conectam a nada.
+for name, value in (('TOKEN', 'benchmark'), ('OWNER_IDS', '0'), ('MONGO', 'mongodb://localhost'), ('INTERNAL_API', 'http://localhost')):
+    os.environ.setdefault(name, value)
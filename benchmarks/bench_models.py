@@ -0,0 +1,73 @@
+"""
+Micro-benchmark da conversão entre documentos do MongoDB e os modelos do banco de dados.
+
+Compara, por documento, a criação com validação completa (`Model(**data)`) contra `Model.from_document`.
+
+Uso:
+    python -m benchmarks.bench_models [quantidade]
+"""
+import sys
+import timeit
+from datetime import datetime
+
+from database.models.user import UserData
+from database.models.skin import ProfileSkin
+
+USER_DOCUMENT = {
+    '_id': 123456789012345678,
+    'pearls': 15320,
+    'experience': 812.5,
+    'reputation': 14,
+    'acceptedTerms': True,
+    'caiUUID': None,
+    'profile': {'skinNow': 'ocean', 'skins': ['default', 'ocean', 'sunset', 'pearl'], 'aboutMe': 'Olá!'},
+    'cooldowns': { # Datas sem fuso, em UTC, como o Motor as retorna
+        'daily': datetime(2024, 5, 1, 12, 0),
+        'reputation': datetime(2024, 5, 1, 9, 30),
+        'married': None,
+        'premiumExpiration': None,
+    },
+    'marriedStatus': {
+        'divisionOfAssets': True,
+        'marriedWith': 876543210987654321,
+        'since': datetime(2024, 2, 14),
+        'sharedPearls': 30000,
+    },
+    'banStatus': None,
+}
+
+SKIN_DOCUMENT = {
+    '_id': 'ocean',
+    'name': 'Oceano',
+    'price': 5000,
+    'rarity': 3,
+    'description': 'Uma skin azul.',
+    'author': 'nanyuss',
+    'url': 'https://example.com/ocean.png',
+}
+
+def _report(label: str, before: float, after: float, number: int) -> None:
+    before_us = before / number * 1e6
+    after_us = after / number * 1e6
+    print(f'{label:<28} {before_us:>9.2f} µs {after_us:>9.2f} µs {before_us / after_us:>7.1f}x')
+
+def main(number: int = 20_000) -> None:
+    assert UserData.from_document(USER_DOCUMENT) == UserData(**USER_DOCUMENT)
+    assert ProfileSkin.from_document(SKIN_DOCUMENT) == ProfileSkin(**SKIN_DOCUMENT)
+
+    print(f'{"por documento":<28} {"antes":>12} {"depois":>12} {"ganho":>8}')
+    _report(
+        'UserData (leitura)',
+        timeit.timeit(lambda: UserData(**USER_DOCUMENT), number=number),
+        timeit.timeit(lambda: UserData.from_document(USER_DOCUMENT), number=number),
+        number,
+    )
+    _report(
+        'ProfileSkin (leitura)',
+        timeit.timeit(lambda: ProfileSkin(**SKIN_DOCUMENT), number=number),
+        timeit.timeit(lambda: ProfileSkin.from_document(SKIN_DOCUMENT), number=number),
+        number,
+    )
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,84 @@
+"""
+Micro-benchmark da lista de palavras: `set` de `str` contra o `WordStore` compacto.
+
+Compara a memória ocupada pela lista e por todos os índices do `WordManager` (lista, formas sem acento
+e prefixos do Shiritori), o custo de pertinência (palavras existentes e inexistentes) e o de percorrer as
+palavras de um prefixo. Sem um arquivo, usa uma lista sintética do mesmo tamanho da
+lista completa em português (uma palavra por linha, como `words/all/pt.txt`).
+
+Uso:
+    python -m benchmarks.bench_words [arquivo] [quantidade]
+"""
+import random
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, List, Set, Tuple
+
+from src.core.word_manager import WordManager
+from src.core.word_store import WordStore
+
+SYLLABLES = [consonant + vowel for consonant in ('', 'b', 'c', 'd', 'f', 'g', 'l', 'm', 'n', 'p', 'r', 's', 't', 'v', 'ch', 'lh', 'nh') for vowel in 'aeiouãáéêíóõú']
+
+def _synthetic_words(amount: int) -> Set[str]:
+    rng = random.Random(42)
+    words: Set[str] = set()
+    while len(words) < amount:
+        words.add(''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5))))
+    return words
+
+def _measure(build: Callable[[], object]) -> Tuple[object, int]:
+    tracemalloc.start()
+    container = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return container, size
+
+def main(path: str = None, number: int = 200_000) -> None:
+    if path:
+        with open(path, encoding='utf-8') as file:
+            text = file.read()
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+    else:
+        lines = sorted(_synthetic_words(300_000))
+
+    # Cada estrutura recebe cópias novas das strings, como na leitura da resposta da API.
+    words_set, set_bytes = _measure(lambda: {line.encode().decode() for line in lines})
+    store, store_bytes = _measure(lambda: WordStore(line.encode().decode() for line in lines))
+    assert len(store) == len(words_set)
+    _, indexes_set_bytes = _measure(lambda: WordManager()._build_indexes({line.encode().decode() for line in lines}, False))
+    _, indexes_store_bytes = _measure(lambda: WordManager()._build_indexes({line.encode().decode() for line in lines}, True))
+
+    rng = random.Random(7)
+    hits: List[str] = rng.sample(lines, 1000)
+    misses: List[str] = [word + 'zq' for word in hits]
+    prefixes: List[str] = [word[:2] for word in hits]
+
+    def lookups(container) -> Callable[[], None]:
+        def run() -> None:
+            for word in hits:
+                word in container
+            for word in misses:
+                word in container
+        return run
+
+    print(f'{len(lines)} palavras')
+    print(f'{"":<28} {"set":>12} {"WordStore":>12}')
+    print(f'{"memória":<28} {set_bytes / 2**20:>9.1f} MiB {store_bytes / 2**20:>9.1f} MiB')
+    print(f'{"memória (todos os índices)":<28} {indexes_set_bytes / 2**20:>9.1f} MiB {indexes_store_bytes / 2**20:>9.1f} MiB')
+
+    rounds = max(number // 2000, 1)
+    set_time = timeit.timeit(lookups(words_set), number=rounds) / (rounds * 2000) * 1e6
+    store_time = timeit.timeit(lookups(store), number=rounds) / (rounds * 2000) * 1e6
+    print(f'{"pertinência":<28} {set_time:>9.2f} µs {store_time:>9.2f} µs')
+
+    prefix_rounds = max(rounds // 10, 1)
+    set_prefix = timeit.timeit(lambda: [[word for word in words_set if word.startswith(prefix)] for prefix in prefixes[:10]], number=prefix_rounds)
+    store_prefix = timeit.timeit(lambda: [list(store.prefix(prefix)) for prefix in prefixes[:10]], number=prefix_rounds)
+    print(f'{"prefixo (lista completa)":<28} {set_prefix / (prefix_rounds * 10) * 1e3:>9.2f} ms {store_prefix / (prefix_rounds * 10) * 1e3:>9.2f} ms')
+
+if __name__ == '__main__':
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else None,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200_000,
+    )
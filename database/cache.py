@@ -0,0 +1,136 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+__all__ = ('TTLCache',)
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+class TTLCache(Generic[K, V]):
+    """
+    Cache em memória com limite de tamanho (LRU) e tempo de expiração (TTL) por item.
+
+    Args:
+        maxsize (`int`): Quantidade máxima de itens. Se for `0`, o cache fica desativado.
+        ttl (`float`): Tempo, em segundos, que cada item permanece válido.
+    """
+    def __init__(self, maxsize: int = 10_000, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._data: OrderedDict[K, tuple] = OrderedDict()
+        self._reservations: Dict[K, object] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: K) -> bool:
+        return self._get(key) is not None
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Obtém um item do cache, contabilizando o acerto ou a falha.
+
+        Args:
+            key (`K`): A chave do item.
+
+        Returns:
+            Optional[V]: O item, ou `None` se não estiver no cache ou tiver expirado.
+        """
+        entry = self._get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def reserve(self, key: K) -> object:
+        """
+        Reserva a chave antes de uma leitura no banco de dados.
+
+        Se a chave for alterada ou removida enquanto a leitura acontece, a reserva é cancelada e o
+        `set` com o token retornado é ignorado, evitando guardar um valor desatualizado.
+
+        Returns:
+            object: O token da reserva, a ser passado para `set`.
+        """
+        token = object()
+        self._reservations[key] = token
+        return token
+
+    def set(self, key: K, value: V, token: Optional[object] = None) -> None:
+        """
+        Adiciona ou substitui um item no cache.
+
+        Args:
+            key (`K`): A chave do item.
+            value (`V`): O item.
+            token (`Optional[object]`): O token retornado por `reserve`, se houver.
+        """
+        if token is not None and self._reservations.pop(key, None) is not token:
+            return
+        if self.maxsize <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def patch(self, key: K, func: Callable[[V], V]) -> None:
+        """
+        Atualiza um item do cache no lugar, sem renovar o tempo de expiração.
+
+        Se `func` lançar uma exceção, o item é removido do cache.
+
+        Args:
+            key (`K`): A chave do item.
+            func (`Callable[[V], V]`): Função que recebe o item atual e retorna o novo.
+        """
+        self._reservations.pop(key, None)
+        entry = self._get(key)
+        if entry is None:
+            return
+        try:
+            self._data[key] = (entry[0], func(entry[1]))
+        except Exception:
+            self._data.pop(key, None)
+
+    def pop(self, key: K) -> None:
+        """Remove um item do cache (e cancela leituras em andamento para a chave)."""
+        self._reservations.pop(key, None)
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove todos os itens do cache."""
+        self._reservations.clear()
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retorna as estatísticas do cache.
+
+        Returns:
+            Dict[str, Any]: Tamanho, limite, acertos, falhas e taxa de acerto.
+        """
+        total = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def _get(self, key: K) -> Optional[tuple]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._data[key]
+            return None
+        return entry
@@ -1,39 +1,131 @@
 import logging
+from typing import Any, Dict, Optional
 from motor.motor_asyncio import AsyncIOMotorClient
 
 from env import ENV
 from database.user_db import UsersDB
 from database.skin_db import SkinsDB
 from database.settings_db import SettingsDB
+from database.leaderboard import Leaderboard
+from database.cooldowns import CooldownEngine
+from database.ledger import PearlLedger
+from database.migrations import run_migrations
+from database.monitoring import CommandMonitor
+from database.storage import StorageClient
+from database.sqlite_storage import SQLiteClient
 
 log = logging.getLogger(__name__)
 
+def create_storage_client(monitor: Optional[CommandMonitor] = None) -> StorageClient:
+    """
+    Cria o cliente de armazenamento escolhido em `DATABASE_BACKEND`.
+
+    Args:
+        monitor (`Optional[CommandMonitor]`): Monitor dos comandos do MongoDB (ignorado no SQLite).
+
+    Returns:
+        StorageClient: `SQLiteClient` ou `AsyncIOMotorClient`.
+    """
+    if ENV.DATABASE_BACKEND == 'sqlite':
+        return SQLiteClient(ENV.SQLITE_PATH)
+    return AsyncIOMotorClient(ENV.MONGO, event_listeners=[monitor] if monitor is not None else [])
+
 class DatabaseClient:
     """
-    Gerencia a conexão com o banco de dados MongoDB.
+    Gerencia a conexão com o banco de dados (MongoDB ou SQLite, conforme `DATABASE_BACKEND`).
     """
     def __init__(self, **kwargs):
+        self.client: StorageClient = kwargs.get('client')
+        self.monitor: CommandMonitor = kwargs.get('monitor')
         self.users: UsersDB = kwargs.get('users')
         self.skin: SkinsDB = kwargs.get('skin')
         self.settings: SettingsDB = kwargs.get('settings')
+        self.leaderboard: Leaderboard = kwargs.get('leaderboard')
+        self.cooldowns: CooldownEngine = kwargs.get('cooldowns')
+        self.ledger: PearlLedger = kwargs.get('ledger')
 
 
     @classmethod
     async def connect(cls) -> 'DatabaseClient':
         """
-        Conecta ao banco de dados MongoDB.
+        Conecta ao banco de dados escolhido em `DATABASE_BACKEND`.
 
         Returns:
             DatabaseClient: Uma instância da classe DatabaseClient.
         """
         try:
-            client = AsyncIOMotorClient(ENV.MONGO)
-            return cls(
-                users=UsersDB(client),
-                skins=SkinsDB(client),
-                settings=SettingsDB(client)
+            monitor = CommandMonitor()
+            client = create_storage_client(monitor)
+            users = UsersDB(
+                client,
+                write_behind=ENV.USERS_WRITE_BEHIND,
+                flush_interval=ENV.USERS_FLUSH_INTERVAL,
+                flush_size=ENV.USERS_FLUSH_SIZE,
+                cache_size=ENV.USERS_CACHE_SIZE,
+                cache_ttl=ENV.USERS_CACHE_TTL
             )
-            log.debug('Conectado ao MongoDB com sucesso.')
+            db = cls(
+                client=client,
+                monitor=monitor,
+                users=users,
+                skin=SkinsDB(client),
+                settings=SettingsDB(client),
+                leaderboard=Leaderboard(users),
+                cooldowns=CooldownEngine(users),
+                ledger=PearlLedger(client, users, flush_interval=ENV.USERS_FLUSH_INTERVAL)
+            )
+            for collection in (db.users, db.skin, db.settings, db.ledger):
+                await collection.ensure_indexes()
+            await run_migrations(client, db.settings.collection)
+
+            await db.users.load_ban_index()
+            await db.settings.get_settings()
+            await db.skin.load_catalog()
+            await db.leaderboard.load()
+            db.cooldowns.start()
+            log.debug('Conectado ao banco de dados (%s) com sucesso.', ENV.DATABASE_BACKEND)
+            return db
         except Exception:
-            log.critical('Não foi possível conectar ao MongoDB.', exc_info=True)
-            raise ConnectionError('Não foi possível conectar ao MongoDB.')
\ No newline at end of file
+            log.critical('Não foi possível conectar ao banco de dados (%s).', ENV.DATABASE_BACKEND, exc_info=True)
+            raise ConnectionError('Não foi possível conectar ao banco de dados.')
+
+    def stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retorna as estatísticas do banco de dados: latência por comando e coleção, consultas lentas e caches.
+
+        Args:
+            namespace (`Optional[str]`): Filtra as estatísticas de comandos por `banco.coleção` (ex: `global.users`).
+
+        Returns:
+            Dict[str, Any]: As estatísticas coletadas desde a conexão (ou o último `reset`).
+        """
+        stats = self.monitor.stats(namespace)
+        stats['users_cache'] = self.users.cache_stats()
+        stats['users_pending_writes'] = len(self.users.buffer) if self.users.buffer is not None else 0
+        stats['active_cooldowns'] = len(self.cooldowns)
+        stats['ledger_queue'] = len(self.ledger)
+        return stats
+
+    async def reload(self) -> None:
+        """
+        Descarta os caches e índices em memória e os recarrega do banco de dados.
+
+        Usado depois de alterações feitas fora dos bancos de dados do bot (ex: `database.transfer`).
+        """
+        self.users.cache.clear()
+        self.cooldowns.reset()
+        self.settings.invalidate()
+        await self.users.load_ban_index()
+        await self.settings.get_settings()
+        await self.skin.load_catalog()
+        await self.leaderboard.load()
+
+    async def close(self) -> None:
+        """
+        Envia os updates pendentes e encerra a conexão com o banco de dados.
+        """
+        await self.cooldowns.close()
+        await self.ledger.close()
+        await self.users.close()
+        self.client.close()
+        log.debug('Conexão com o banco de dados encerrada.')
@@ -0,0 +1,201 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Dict, List, Literal, Optional, Tuple, Union
+
+import discord
+
+from database.models.user import Cooldowns
+from database.timer_wheel import TimerWheel
+
+if TYPE_CHECKING:
+    from database.user_db import UsersDB
+
+log = logging.getLogger(__name__)
+
+__all__ = ('CooldownEngine',)
+
+Kind = Literal['daily', 'reputation', 'married', 'premium_expiration']
+
+def _to_timestamp(value: Optional[datetime]) -> Optional[float]:
+    """Converte uma data do banco de dados (sem fuso, em UTC) ou com fuso para timestamp."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+class CooldownEngine:
+    """
+    Controla os cooldowns dos usuários (`UserData.cooldowns`) em memória.
+
+    Cada valor de `Cooldowns` é tratado como o momento em que o cooldown termina. Os cooldowns dos
+    usuários com algum cooldown ativo ficam em um dicionário, então `remaining` é O(1) e não consulta o
+    banco de dados; os demais são lidos do cache de `UsersDB`. Uma roda de temporizadores (`TimerWheel`)
+    descarta os cooldowns vencidos e avisa os ouvintes em `listeners` (ex: para encerrar o premium).
+
+    Cada `set` vira um `$set` no campo `cooldowns.<campo>` gravado por `UsersDB`, então segue o mesmo
+    caminho (e o mesmo buffer do modo write-behind) que os demais updates do usuário.
+
+    Args:
+        users (`UsersDB`): O banco de dados dos usuários.
+        resolution (`float`): Precisão, em segundos, da roda de temporizadores.
+    """
+    KINDS: Tuple[Kind, ...] = ('daily', 'reputation', 'married', 'premium_expiration')
+
+    def __init__(self, users: 'UsersDB', *, resolution: float = 1.0):
+        self.users = users
+        self.listeners: List[Callable[[int, Kind], None]] = []
+        self._paths: Dict[Kind, str] = {kind: f'cooldowns.{Cooldowns.field_alias(kind)}' for kind in self.KINDS}
+        self._kinds: Dict[str, Kind] = {path: kind for kind, path in self._paths.items()}
+        self._expiries: Dict[int, Dict[Kind, float]] = {}
+        self._wheel = TimerWheel(resolution, now=time.time())
+        self._task: Optional[asyncio.Task] = None
+        users.listeners.append(self.on_write)
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    async def remaining(self, user: Union[discord.Member, discord.User], kind: Kind) -> float:
+        """
+        Obtém quanto tempo falta para um cooldown terminar.
+
+        Args:
+            user (`Union[discord.Member, discord.User]`): O usuário.
+            kind (`Kind`): O cooldown.
+
+        Returns:
+            float: Os segundos restantes, ou `0.0` se o cooldown já terminou.
+        """
+        expiries = self._expiries.get(user.id)
+        if expiries is None:
+            expiries = await self._load(user)
+        expires_at = expiries.get(kind)
+        if expires_at is None:
+            return 0.0
+        return max(expires_at - time.time(), 0.0)
+
+    async def is_ready(self, user: Union[discord.Member, discord.User], kind: Kind) -> bool:
+        """Verifica se o cooldown do usuário já terminou."""
+        return await self.remaining(user, kind) == 0.0
+
+    async def expires_at(self, user: Union[discord.Member, discord.User], kind: Kind) -> Optional[datetime]:
+        """Obtém o momento em que o cooldown termina, ou `None` se ele já terminou."""
+        remaining = await self.remaining(user, kind)
+        if not remaining:
+            return None
+        return datetime.fromtimestamp(time.time() + remaining, tz=timezone.utc)
+
+    async def set(self, user: Union[discord.Member, discord.User], kind: Kind, duration: Union[timedelta, datetime, None]) -> None:
+        """
+        Inicia (ou encerra) um cooldown.
+
+        A alteração vale imediatamente para `remaining` e é gravada com `UsersDB`, que também atualiza
+        o cache de leitura.
+
+        Args:
+            user (`Union[discord.Member, discord.User]`): O usuário.
+            kind (`Kind`): O cooldown.
+            duration (`Union[timedelta, datetime, None]`): A duração a partir de agora, o momento em que o
+                cooldown termina, ou `None` para encerrá-lo.
+        """
+        if user.id not in self._expiries:
+            await self._load(user)
+
+        if isinstance(duration, timedelta):
+            expires_at = datetime.now(tz=timezone.utc) + duration
+        else:
+            expires_at = duration
+
+        self._put(user.id, kind, _to_timestamp(expires_at))
+        await self.users.update_user(user, query={'$set': {self._paths[kind]: expires_at}})
+
+    def on_write(self, user_id: int, update: Optional[dict]) -> None:
+        """
+        Mantém os cooldowns em memória coerentes com os updates feitos em `UsersDB` (inclusive os de `set`).
+
+        Args:
+            user_id (`int`): ID do usuário alterado.
+            update (`Optional[dict]`): O update aplicado, ou `None` se o usuário foi excluído.
+        """
+        if update is None:
+            self._forget(user_id)
+            return
+        if user_id not in self._expiries:
+            return
+
+        fields = update.get('$set', {})
+        if 'cooldowns' in fields:
+            self._forget(user_id) # O objeto inteiro foi substituído; recarrega na próxima consulta
+            return
+        for path, value in fields.items():
+            kind = self._kinds.get(path)
+            if kind is not None:
+                self._put(user_id, kind, _to_timestamp(value))
+
+    def start(self) -> None:
+        """Inicia a tarefa que avança a roda de temporizadores."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def reset(self) -> None:
+        """Descarta os cooldowns em memória; eles são recarregados do cache de `UsersDB` na próxima consulta."""
+        for user_id in list(self._expiries):
+            self._forget(user_id)
+
+    async def close(self) -> None:
+        """Interrompe a roda de temporizadores."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _load(self, user: Union[discord.Member, discord.User]) -> Dict[Kind, float]:
+        """Carrega os cooldowns ativos de um usuário a partir de `UsersDB.get_user` (que usa o cache de leitura)."""
+        user_data = await self.users.get_user(user)
+        expiries = self._expiries.get(user.id)
+        if expiries is not None: # Carregado por outra tarefa enquanto esta aguardava
+            return expiries
+
+        cooldowns = user_data.cooldowns.to_dict() if user_data.cooldowns is not None else {}
+        for kind in self.KINDS:
+            self._put(user.id, kind, _to_timestamp(cooldowns.get(Cooldowns.field_alias(kind))))
+        return self._expiries.get(user.id, {})
+
+    def _put(self, user_id: int, kind: Kind, expires_at: Optional[float]) -> None:
+        if expires_at is not None and expires_at > time.time():
+            self._expiries.setdefault(user_id, {})[kind] = expires_at
+            self._wheel.schedule((user_id, kind), expires_at)
+            return
+
+        self._wheel.cancel((user_id, kind))
+        expiries = self._expiries.get(user_id)
+        if expiries is not None:
+            expiries.pop(kind, None)
+            if not expiries:
+                del self._expiries[user_id]
+
+    def _forget(self, user_id: int) -> None:
+        for kind in self._expiries.pop(user_id, {}):
+            self._wheel.cancel((user_id, kind))
+
+    def _expire(self, keys: List[Tuple[int, Kind]]) -> None:
+        """Remove os cooldowns vencidos, descartando da memória os usuários sem nenhum cooldown ativo."""
+        for user_id, kind in keys:
+            expiries = self._expiries.get(user_id)
+            if expiries is None or expiries.pop(kind, None) is None:
+                continue
+            if not expiries:
+                del self._expiries[user_id]
+            for listener in self.listeners:
+                try:
+                    listener(user_id, kind)
+                except Exception:
+                    log.error('Erro ao notificar o fim do cooldown %s do usuário %s.', kind, user_id, exc_info=True)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._wheel.resolution)
+            self._expire(self._wheel.advance(time.time()))
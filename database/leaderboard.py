@@ -0,0 +1,160 @@
+import logging
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Set, Tuple, Union
+
+from sortedcontainers import SortedList
+
+if TYPE_CHECKING:
+    from database.user_db import UsersDB
+
+log = logging.getLogger(__name__)
+
+Metric = Literal['pearls', 'experience', 'reputation']
+Entry = Tuple[int, Union[int, float]]
+
+class Leaderboard:
+    """
+    Ranking em memória dos usuários por pérolas, experiência e reputação.
+
+    Cada métrica é mantida em uma lista ordenada (`SortedList`), então a posição de um usuário é
+    encontrada em O(log n). O ranking é carregado uma vez na inicialização e depois atualizado
+    incrementalmente pelos updates feitos em `UsersDB`, sem novas consultas ao banco de dados.
+
+    Args:
+        users (`UsersDB`): O banco de dados dos usuários.
+        page_size (`int`): Quantidade de usuários na página do topo mantida em cache.
+    """
+    METRICS: Tuple[Metric, ...] = ('pearls', 'experience', 'reputation')
+
+    def __init__(self, users: 'UsersDB', page_size: int = 10):
+        self.users = users
+        self.page_size = page_size
+        self._values: Dict[Metric, Dict[int, Union[int, float]]] = {metric: {} for metric in self.METRICS}
+        self._ranking: Dict[Metric, SortedList] = {metric: SortedList() for metric in self.METRICS}
+        self._pages: Dict[Metric, Optional[List[Entry]]] = dict.fromkeys(self.METRICS)
+        self._loading: bool = False
+        self._touched: Set[int] = set()
+        users.listeners.append(self.on_write)
+
+    async def load(self) -> None:
+        """
+        Carrega o ranking a partir de todos os usuários do banco de dados.
+
+        Usuários alterados durante o carregamento são lidos novamente no final, para não ficarem desatualizados.
+        """
+        self._loading = True
+        self._touched.clear()
+        try:
+            projection = dict.fromkeys(self.METRICS, 1)
+            async for page in self.users.get_all_users(500, projection=projection):
+                for document in page:
+                    self._load_document(document)
+
+            touched, self._touched = list(self._touched), set()
+            if touched:
+                async for document in self.users.collection.find({'_id': {'$in': touched}}, projection):
+                    self._load_document(document)
+        finally:
+            self._loading = False
+        log.debug('Ranking carregado com %s usuários.', len(self._values['pearls']))
+
+    def on_write(self, user_id: int, update: Optional[dict]) -> None:
+        """
+        Atualiza o ranking a partir de um update feito em `UsersDB`.
+
+        Args:
+            user_id (`int`): ID do usuário alterado.
+            update (`Optional[dict]`): O update aplicado, ou `None` se o usuário foi excluído.
+        """
+        if self._loading:
+            self._touched.add(user_id)
+
+        if update is None:
+            for metric in self.METRICS:
+                self._remove(metric, user_id)
+            return
+
+        for metric in self.METRICS:
+            if metric in update.get('$set', {}):
+                self._set(metric, user_id, update['$set'][metric])
+            elif metric in update.get('$inc', {}):
+                self._set(metric, user_id, self._values[metric].get(user_id, 0) + update['$inc'][metric])
+
+    def rank(self, user_id: int, metric: Metric) -> Optional[int]:
+        """
+        Obtém a posição de um usuário no ranking em O(log n).
+
+        Args:
+            user_id (`int`): ID do usuário.
+            metric (`Metric`): A métrica do ranking.
+
+        Returns:
+            Optional[int]: A posição do usuário (começando em 1), ou `None` se ele não estiver no ranking.
+        """
+        value = self._values[metric].get(user_id)
+        if value is None:
+            return None
+        return self._ranking[metric].index((-value, user_id)) + 1
+
+    def value(self, user_id: int, metric: Metric) -> Optional[Union[int, float]]:
+        """Obtém o valor de um usuário na métrica, ou `None` se ele não estiver no ranking."""
+        return self._values[metric].get(user_id)
+
+    def top(self, metric: Metric) -> List[Entry]:
+        """
+        Obtém a página do topo do ranking (`page_size` usuários), mantida em cache até ser alterada.
+
+        Args:
+            metric (`Metric`): A métrica do ranking.
+
+        Returns:
+            List[Entry]: Lista de `(user_id, valor)` do primeiro para o último.
+        """
+        page = self._pages[metric]
+        if page is None:
+            page = self._pages[metric] = self.page(metric, 0, self.page_size)
+        return page
+
+    def page(self, metric: Metric, page: int, per_page: int = 10) -> List[Entry]:
+        """
+        Obtém uma página qualquer do ranking.
+
+        Args:
+            metric (`Metric`): A métrica do ranking.
+            page (`int`): O número da página (começando em 0).
+            per_page (`int`): Quantidade de usuários por página.
+
+        Returns:
+            List[Entry]: Lista de `(user_id, valor)` da página.
+        """
+        start = page * per_page
+        return [(user_id, -value) for value, user_id in self._ranking[metric].islice(start, start + per_page)]
+
+    def __len__(self) -> int:
+        return len(self._values['pearls'])
+
+    def _load_document(self, document: dict) -> None:
+        for metric in self.METRICS:
+            self._set(metric, document['_id'], document.get(metric, 0))
+
+    def _set(self, metric: Metric, user_id: int, value: Union[int, float]) -> None:
+        self._remove(metric, user_id)
+        key = (-value, user_id)
+        self._ranking[metric].add(key)
+        self._values[metric][user_id] = value
+        self._invalidate_page(metric, key)
+
+    def _remove(self, metric: Metric, user_id: int) -> None:
+        old_value = self._values[metric].pop(user_id, None)
+        if old_value is None:
+            return
+        key = (-old_value, user_id)
+        self._ranking[metric].remove(key)
+        self._invalidate_page(metric, key)
+
+    def _invalidate_page(self, metric: Metric, key: tuple) -> None:
+        """Descarta a página do topo em cache se a chave alterada estiver dentro dela."""
+        page = self._pages[metric]
+        if page is None:
+            return
+        if len(page) < self.page_size or key <= (-page[-1][1], page[-1][0]):
+            self._pages[metric] = None
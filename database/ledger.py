@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional, Union
+
+import discord
+from bson import ObjectId
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+from database.storage import StorageClient
+from database.write_buffer import PeriodicFlush
+
+if TYPE_CHECKING:
+    from database.user_db import UsersDB
+
+log = logging.getLogger(__name__)
+
+__all__ = ('PearlLedger',)
+
+class PearlLedger:
+    """
+    Histórico (somente inserção) de todas as alterações de pérolas dos usuários.
+
+    O ledger escuta os updates feitos em `UsersDB`: cada `$inc` em `pearls` vira uma entrada com a
+    diferença (`delta`) e cada `$set` vira uma entrada com o valor absoluto (`set`). As entradas ficam
+    em uma fila em memória e são gravadas em lote com `insert_many`, fora do caminho dos comandos.
+
+    Periodicamente, as entradas antigas são compactadas em um snapshot por usuário (`pearl_snapshots`),
+    que guarda o saldo e a última entrada incluída. O saldo de um usuário é o snapshot mais as entradas
+    posteriores a ele (veja `replay`).
+
+    Args:
+        client (`StorageClient`): O cliente do banco de dados.
+        users (`UsersDB`): O banco de dados dos usuários.
+        flush_interval (`float`): Intervalo, em segundos, entre cada gravação das entradas.
+        flush_size (`int`): Quantidade de entradas na fila que força uma gravação imediata.
+        compact_interval (`float`): Intervalo, em segundos, entre cada compactação.
+        retention (`timedelta`): Idade a partir da qual as entradas são compactadas.
+    """
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel([('user', ASCENDING), ('_id', ASCENDING)], name='user_entries'),
+    ]
+
+    def __init__(
+        self,
+        client: StorageClient,
+        users: 'UsersDB',
+        *,
+        flush_interval: float = 5.0,
+        flush_size: int = 1000,
+        compact_interval: float = 86400.0,
+        retention: timedelta = timedelta(days=30)
+    ):
+        self.users = users
+        self.collection = client['global']['pearl_ledger']
+        self.snapshots = client['global']['pearl_snapshots']
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.compact_interval = compact_interval
+        self.retention = retention
+        self._queue: List[dict] = []
+        self._lock = asyncio.Lock()
+        self._last_compaction = time.monotonic()
+        self._scheduler = PeriodicFlush(self.flush, interval=flush_interval, is_full=lambda: len(self._queue) >= self.flush_size, tick=self._tick, name='Ledger')
+        users.listeners.append(self.on_write)
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    async def ensure_indexes(self) -> None:
+        """Cria os índices declarados em `INDEXES`, caso ainda não existam."""
+        await self.collection.create_indexes(self.INDEXES)
+
+    def on_write(self, user_id: int, update: Optional[dict]) -> None:
+        """
+        Registra na fila a alteração de pérolas de um update feito em `UsersDB`.
+
+        Args:
+            user_id (`int`): ID do usuário alterado.
+            update (`Optional[dict]`): O update aplicado, ou `None` se o usuário foi excluído.
+        """
+        if update is None:
+            # O documento foi removido: sem o registro, `replay` continuaria somando o saldo antigo.
+            self._append({'_id': ObjectId(), 'user': user_id, 'set': 0})
+        elif 'pearls' in update.get('$set', {}):
+            self._append({'_id': ObjectId(), 'user': user_id, 'set': update['$set']['pearls']})
+        elif update.get('$inc', {}).get('pearls'):
+            self._append({'_id': ObjectId(), 'user': user_id, 'delta': update['$inc']['pearls']})
+
+    async def flush(self) -> None:
+        """Grava as entradas da fila em um único `insert_many`."""
+        async with self._lock:
+            if not self._queue:
+                return
+            entries, self._queue = self._queue, []
+            try:
+                # Os `_id` são gerados na fila, então reenviar entradas já gravadas só gera erros de chave duplicada.
+                await self.collection.insert_many(entries, ordered=False)
+                log.debug('Ledger: %s entradas gravadas.', len(entries))
+            except Exception as e:
+                written = {error['op']['_id'] for error in (getattr(e, 'details', None) or {}).get('writeErrors', []) if error.get('code') == 11000}
+                pending = [entry for entry in entries if entry['_id'] not in written]
+                log.error('Ledger: falha ao gravar %s entradas, tentando novamente no próximo ciclo.', len(pending), exc_info=True)
+                self._queue[:0] = pending
+
+    async def replay(self, user: Union[discord.Member, discord.User]) -> int:
+        """
+        Reconstrói o saldo de pérolas de um usuário a partir do snapshot e das entradas do ledger.
+
+        As entradas são lidas em ordem com um cursor, sem carregar todo o histórico na memória.
+
+        Args:
+            user (`Union[discord.Member, discord.User]`): O usuário.
+
+        Returns:
+            int: O saldo de pérolas reconstruído.
+        """
+        if any(entry['user'] == user.id for entry in self._queue):
+            await self.flush()
+
+        snapshot = await self.snapshots.find_one({'_id': user.id})
+        balance = snapshot['pearls'] if snapshot else 0
+        query: dict = {'user': user.id}
+        if snapshot and snapshot.get('lastEntry') is not None:
+            query['_id'] = {'$gt': snapshot['lastEntry']}
+
+        async for entry in self.collection.find(query).sort('_id', ASCENDING).batch_size(500):
+            balance = self._apply(balance, entry)
+        return balance
+
+    async def record_balances(self, *, batch_size: int = 1000) -> int:
+        """
+        Grava uma entrada `set` com o saldo atual de cada usuário.
+
+        Usado quando os saldos mudam fora de `UsersDB` (ex: ao restaurar um backup com `database.transfer`),
+        para que `replay` volte a coincidir com o banco de dados dos usuários.
+
+        Args:
+            batch_size (`int`): Quantidade de usuários lidos e entradas gravadas por vez.
+
+        Returns:
+            int: A quantidade de entradas gravadas.
+        """
+        await self.flush()
+        count = 0
+        entries: List[dict] = []
+        async for document in self.users.collection.find({}, {'pearls': 1}).batch_size(batch_size):
+            entries.append({'_id': ObjectId(), 'user': document['_id'], 'set': document.get('pearls', 0)})
+            if len(entries) >= batch_size:
+                await self.collection.insert_many(entries, ordered=False)
+                count += len(entries)
+                entries = []
+        if entries:
+            await self.collection.insert_many(entries, ordered=False)
+            count += len(entries)
+        return count
+
+    async def compact(self, older_than: Optional[timedelta] = None, *, chunk_size: int = 500) -> int:
+        """
+        Junta as entradas mais antigas que `older_than` nos snapshots dos usuários e as remove do ledger.
+
+        Os snapshots guardam a última entrada incluída, então uma compactação interrompida pode ser
+        repetida sem contar nenhuma entrada duas vezes.
+
+        Args:
+            older_than (`Optional[timedelta]`): Idade mínima das entradas compactadas. Padrão: `retention`.
+            chunk_size (`int`): Quantidade de usuários processados por vez.
+
+        Returns:
+            int: A quantidade de entradas removidas.
+        """
+        await self.flush()
+        cutoff = ObjectId.from_datetime(datetime.now(tz=timezone.utc) - (older_than or self.retention))
+        groups: Dict[int, List[dict]] = {}
+        cursor = self.collection.find({'_id': {'$lt': cutoff}}).sort([('user', ASCENDING), ('_id', ASCENDING)]).batch_size(1000)
+        async for entry in cursor:
+            if entry['user'] not in groups and len(groups) >= chunk_size:
+                await self._write_snapshots(groups)
+                groups = {}
+            groups.setdefault(entry['user'], []).append(entry)
+        await self._write_snapshots(groups)
+
+        result = await self.collection.delete_many({'_id': {'$lt': cutoff}})
+        log.debug('Ledger: %s entradas compactadas.', result.deleted_count)
+        return result.deleted_count
+
+    async def close(self) -> None:
+        """Interrompe a tarefa periódica e grava o que ainda estiver na fila."""
+        await self._scheduler.close()
+        await self.flush()
+
+    async def _write_snapshots(self, groups: Dict[int, List[dict]]) -> None:
+        if not groups:
+            return
+        snapshots = {
+            snapshot['_id']: snapshot
+            async for snapshot in self.snapshots.find({'_id': {'$in': list(groups)}})
+        }
+        operations = []
+        for user_id, entries in groups.items():
+            snapshot = snapshots.get(user_id) or {}
+            balance = snapshot.get('pearls', 0)
+            last_entry = snapshot.get('lastEntry')
+            new_entries = [entry for entry in entries if last_entry is None or entry['_id'] > last_entry]
+            if not new_entries:
+                continue
+            for entry in new_entries:
+                balance = self._apply(balance, entry)
+            operations.append(UpdateOne({'_id': user_id}, {'$set': {'pearls': balance, 'lastEntry': new_entries[-1]['_id']}}, upsert=True))
+        if operations:
+            await self.snapshots.bulk_write(operations, ordered=False)
+
+    @staticmethod
+    def _apply(balance: int, entry: dict) -> int:
+        return entry['set'] if 'set' in entry else balance + entry['delta']
+
+    def _append(self, entry: dict) -> None:
+        self._scheduler.start()
+        self._queue.append(entry)
+        if len(self._queue) >= self.flush_size:
+            self._scheduler.flush_soon()
+
+    async def _tick(self) -> None:
+        """Grava a fila e, a cada `compact_interval`, compacta as entradas antigas."""
+        await self.flush()
+        if time.monotonic() - self._last_compaction >= self.compact_interval:
+            self._last_compaction = time.monotonic()
+            try:
+                await self.compact()
+            except Exception:
+                log.error('Ledger: falha ao compactar as entradas.', exc_info=True)
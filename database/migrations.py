@@ -0,0 +1,105 @@
+import logging
+from datetime import datetime, timezone
+from bson import ObjectId
+from pymongo import UpdateOne
+from typing import Awaitable, Callable, List, Tuple
+
+from database.storage import StorageClient, StorageCollection
+
+log = logging.getLogger(__name__)
+
+__all__ = ('MIGRATIONS', 'run_migrations')
+
+Migration = Tuple[int, str, Callable[[StorageClient], Awaitable[None]]]
+
+async def _rename_premium_expiration(client: StorageClient) -> None:
+    """`update_cooldowns` salvava `premium_expiration` sem o alias."""
+    await client['global']['users'].update_many(
+        {'cooldowns.premium_expiration': {'$exists': True}},
+        {'$rename': {'cooldowns.premium_expiration': 'cooldowns.premiumExpiration'}}
+    )
+
+async def _clear_broken_married_status(client: StorageClient) -> None:
+    """O divórcio deixava `marriedStatus` como um objeto com campos nulos, que `UserData` não consegue carregar."""
+    await client['global']['users'].update_many(
+        {'marriedStatus': {'$type': 'object'}, 'marriedStatus.marriedWith': None},
+        {'$set': {'marriedStatus': None}}
+    )
+
+async def _seed_pearl_snapshots(client: StorageClient) -> None:
+    """Cria o snapshot inicial do ledger de pérolas com o saldo atual de cada usuário."""
+    last_entry = ObjectId()
+    snapshots = client['global']['pearl_snapshots']
+    operations = []
+    async for user in client['global']['users'].find({}, {'pearls': 1}).batch_size(1000):
+        operations.append(UpdateOne(
+            {'_id': user['_id']},
+            {'$setOnInsert': {'pearls': user.get('pearls') or 0, 'lastEntry': last_entry}},
+            upsert=True
+        ))
+        if len(operations) >= 1000:
+            await snapshots.bulk_write(operations, ordered=False)
+            operations = []
+    if operations:
+        await snapshots.bulk_write(operations, ordered=False)
+
+_COOLDOWN_FIELDS = ('daily', 'reputation', 'married', 'premiumExpiration')
+
+async def _convert_cooldowns_to_dates(client: StorageClient) -> None:
+    """
+    O `to_dict` antigo salvava os cooldowns como texto ISO, que os índices parciais `cooldowns_*` (só de
+    datas) não enxergam. Converte esses valores para datas em UTC.
+    """
+    users = client['global']['users']
+    query = {'$or': [{f'cooldowns.{field}': {'$type': 'string'}} for field in _COOLDOWN_FIELDS]}
+    operations = []
+    async for user in users.find(query, {'cooldowns': 1}).batch_size(1000):
+        fields = {}
+        for field in _COOLDOWN_FIELDS:
+            value = (user.get('cooldowns') or {}).get(field)
+            if not isinstance(value, str):
+                continue
+            try:
+                date = datetime.fromisoformat(value)
+            except ValueError:
+                log.warning('Cooldown %s inválido no usuário %s: %r. Removendo.', field, user['_id'], value)
+                fields[f'cooldowns.{field}'] = None
+                continue
+            if date.tzinfo is not None:
+                date = date.astimezone(timezone.utc).replace(tzinfo=None)
+            fields[f'cooldowns.{field}'] = date
+        operations.append(UpdateOne({'_id': user['_id']}, {'$set': fields}))
+        if len(operations) >= 1000:
+            await users.bulk_write(operations, ordered=False)
+            operations = []
+    if operations:
+        await users.bulk_write(operations, ordered=False)
+
+# Lista de migrações em ordem. Cada migração deve ser idempotente e nunca deve ser alterada depois de publicada.
+MIGRATIONS: List[Migration] = [
+    (1, 'renomeia cooldowns.premium_expiration', _rename_premium_expiration),
+    (2, 'limpa marriedStatus de divórcios antigos', _clear_broken_married_status),
+    (3, 'cria os snapshots iniciais do ledger de pérolas', _seed_pearl_snapshots),
+    (4, 'converte os cooldowns salvos como texto para datas', _convert_cooldowns_to_dates),
+]
+
+async def run_migrations(client: StorageClient, settings: StorageCollection) -> None:
+    """
+    Aplica as migrações pendentes, registrando a versão atual na coleção de configurações.
+
+    Args:
+        client (`StorageClient`): O cliente do banco de dados.
+        settings (`StorageCollection`): A coleção de configurações, onde a versão é salva.
+    """
+    document = await settings.find_one({'_id': 'migrations'})
+    version = document['version'] if document else 0
+
+    for migration_version, description, migrate in MIGRATIONS:
+        if migration_version <= version:
+            continue
+        log.warning('Aplicando migração %s: %s...', migration_version, description)
+        await migrate(client)
+        await settings.update_one({'_id': 'migrations'}, {'$max': {'version': migration_version}}, upsert=True)
+        version = migration_version
+
+    log.debug('Banco de dados na versão %s.', version)
@@ -1,7 +1,9 @@
 from pydantic.dataclasses import dataclass
 from pydantic import Field, ConfigDict
+from pydantic_core import PydanticUndefined
 
-from typing import Dict, Any, Union
+from datetime import datetime, timezone
+from typing import Dict, Any, Union, Callable, Optional, Tuple, Type, TypeVar, get_args
 
 __all__ = (
     'BaseDataClass',
@@ -13,6 +15,45 @@ model_config = ConfigDict(
     populate_by_name=True
 )
 
+T = TypeVar('T', bound='BaseDataClass')
+
+# (nome, chave no documento, padrão, fábrica do padrão, conversão)
+_DecodeStep = Tuple[str, str, Any, Optional[Callable[[], Any]], Optional[Callable[[Any], Any]]]
+_DECODE_PLANS: Dict[type, Tuple[_DecodeStep, ...]] = {}
+_MISSING = object()
+
+def _parse_datetime(value: Any) -> Any:
+    """Converte datas para UTC sem fuso, como o Motor as retorna, estejam elas salvas como texto ISO ou com fuso."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def _decoder_for(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    """Retorna a conversão necessária para um valor vindo do banco de dados, ou `None` se ele já pode ser usado como está."""
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, BaseDataClass):
+            return candidate.from_document
+        if candidate is datetime:
+            return _parse_datetime
+    return None
+
+def _decode_plan(cls: type) -> Tuple[_DecodeStep, ...]:
+    plan = _DECODE_PLANS.get(cls)
+    if plan is None:
+        plan = _DECODE_PLANS[cls] = tuple(
+            (
+                name,
+                field.alias or name,
+                field.default,
+                field.default_factory,
+                _decoder_for(field.annotation),
+            )
+            for name, field in cls.__pydantic_fields__.items()
+        )
+    return plan
+
 class DataClassMeta(type):
     def __new__(cls, name: str, bases: tuple, dct: Dict[str, Any]) -> type:
         new_cls = super().__new__(cls, name, bases, dct)
@@ -26,6 +67,51 @@ class BaseDataClass(metaclass=DataClassMeta):
     """Modelo base para os modelos Pydantic."""
     model_config = model_config
 
+    @classmethod
+    def field_alias(cls, name: str) -> str:
+        """Retorna o nome do campo como ele é salvo no banco de dados (alias, se houver).
+
+        Raises:
+            ValueError: Se o campo não existir no modelo.
+        """
+        field = cls.__pydantic_fields__.get(name)
+        if field is None:
+            raise ValueError(f'O campo "{name}" não existe em {cls.__name__}.')
+        return field.alias or name
+
+    @classmethod
+    def from_document(cls: Type[T], data: Dict[str, Any]) -> T:
+        """Cria o objeto a partir de um documento salvo pelo próprio bot, sem passar pela validação do Pydantic.
+
+        Os valores do documento são usados como estão (listas e dicionários não são copiados); apenas modelos
+        aninhados e datas são convertidos (datas sempre para UTC sem fuso, como vêm do banco de dados, para
+        que um update aplicado no cache tenha o mesmo tipo de uma leitura). Campos ausentes recebem o valor padrão e chaves
+        desconhecidas são ignoradas. Para dados externos, use o construtor normal.
+
+        Args:
+            data (`Dict[str, Any]`): O documento, com as chaves pelo alias ou pelo nome do campo.
+
+        Returns:
+            T: O objeto criado.
+        """
+        obj = object.__new__(cls)
+        values = obj.__dict__
+        for name, key, default, default_factory, decode in _decode_plan(cls):
+            value = data.get(key, _MISSING)
+            if value is _MISSING:
+                value = data.get(name, _MISSING)
+                if value is _MISSING:
+                    if default is not PydanticUndefined:
+                        values[name] = default
+                    elif default_factory is not None:
+                        values[name] = default_factory()
+                    else:
+                        # Campo obrigatório ausente: a validação completa gera o erro adequado.
+                        return cls(**data)
+                    continue
+            values[name] = value if decode is None or value is None else decode(value)
+        return obj
+
     def to_dict(self, by_alias: bool = True) -> Dict[str, Union[str, int, float, bool, Dict[str, Any], None]]:
         """Converte o objeto para um dicionário, respeitando os aliases se `by_alias` for True."""
         
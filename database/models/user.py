@@ -22,12 +22,12 @@ class Profile(BaseDataClass):
 
 class Cooldowns(BaseDataClass):
     """
-    Gerencia os tempos de espera (cooldowns) do usuário.
+    Gerencia os tempos de espera (cooldowns) do usuário. Cada valor é o momento em que o cooldown termina.
 
     Attributes:
-        daily (`Optional[datetime]`): Cooldown diário.
-        reputation (`Optional[datetime]`): Cooldown de reputação.
-        married (`Optional[datetime]`): Cooldown para se casar novamente após o divorcio.
+        daily (`Optional[datetime]`): Fim do cooldown diário.
+        reputation (`Optional[datetime]`): Fim do cooldown de reputação.
+        married (`Optional[datetime]`): Fim do cooldown para se casar novamente após o divorcio.
         premium_expiration (`Optional[datetime]`): Data de expiração do status premium.
     """
     daily: Optional[datetime] = None
@@ -0,0 +1,141 @@
+import time
+import threading
+from bisect import bisect_left
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from pymongo import monitoring
+
+__all__ = ('CommandMonitor',)
+
+# Limites superiores (em ms) dos intervalos do histograma de latência.
+BUCKETS: Tuple[float, ...] = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, float('inf'))
+
+# Comandos internos do driver que não interessam nas estatísticas.
+IGNORED_COMMANDS = frozenset({'hello', 'ismaster', 'isMaster', 'ping', 'saslStart', 'saslContinue', 'endSessions', 'buildInfo'})
+
+class _Histogram:
+    """Histograma de latência de um comando em uma coleção."""
+    __slots__ = ('buckets', 'count', 'errors', 'total_ms', 'max_ms')
+
+    def __init__(self):
+        self.buckets = [0] * len(BUCKETS)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, duration_ms: float, failed: bool) -> None:
+        self.buckets[bisect_left(BUCKETS, duration_ms)] += 1
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        if failed:
+            self.errors += 1
+
+    def percentile(self, percent: float) -> float:
+        """Estima o percentil pelo limite superior do intervalo onde ele cai."""
+        target = self.count * percent / 100
+        seen = 0
+        for limit, amount in zip(BUCKETS, self.buckets):
+            seen += amount
+            if seen >= target:
+                return min(limit, self.max_ms)
+        return self.max_ms
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'avg_ms': self.total_ms / self.count if self.count else 0.0,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'max_ms': self.max_ms,
+            'buckets': {f'<={limit}': amount for limit, amount in zip(BUCKETS, self.buckets) if amount},
+        }
+
+class CommandMonitor(monitoring.CommandListener):
+    """
+    Coleta a latência de cada comando enviado ao MongoDB, separada por comando e coleção.
+
+    O pymongo chama os métodos deste listener a partir das threads do Motor, por isso todo o estado
+    é protegido por um lock.
+
+    Args:
+        slow_ms (`float`): Comandos a partir desta duração (em ms) entram na amostra de consultas lentas.
+        max_slow_samples (`int`): Quantidade máxima de consultas lentas guardadas.
+    """
+    def __init__(self, slow_ms: float = 100.0, max_slow_samples: int = 50):
+        self.slow_ms = slow_ms
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], _Histogram] = {}
+        self._inflight: Dict[Tuple[Any, int], Tuple[str, dict]] = {}
+        self._slow: Deque[Dict[str, Any]] = deque(maxlen=max_slow_samples)
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name in IGNORED_COMMANDS:
+            return
+        collection = event.command.get('collection') if event.command_name == 'getMore' else event.command.get(event.command_name)
+        namespace = f'{event.database_name}.{collection}' if isinstance(collection, str) else event.database_name
+        with self._lock:
+            self._inflight[(event.connection_id, event.request_id)] = (namespace, event.command)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._record(event, failed=False)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._record(event, failed=True)
+
+    def _record(self, event, *, failed: bool) -> None:
+        duration_ms = event.duration_micros / 1000
+        with self._lock:
+            started = self._inflight.pop((event.connection_id, event.request_id), None)
+            if started is None:
+                return
+            namespace, command = started
+            histogram = self._histograms.get((event.command_name, namespace))
+            if histogram is None:
+                histogram = self._histograms[(event.command_name, namespace)] = _Histogram()
+            histogram.add(duration_ms, failed)
+
+            if duration_ms >= self.slow_ms:
+                self._slow.append({
+                    'command': event.command_name,
+                    'namespace': namespace,
+                    'duration_ms': duration_ms,
+                    'failed': failed,
+                    'at': time.time(),
+                    'detail': repr({k: v for k, v in command.items() if k not in ('lsid', '$clusterTime', 'documents', 'updates')})[:300],
+                })
+
+    def stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Retorna as estatísticas coletadas.
+
+        Args:
+            namespace (`Optional[str]`): Filtra por `banco.coleção` (ex: `global.users`).
+
+        Returns:
+            Dict[str, Any]: As estatísticas por `comando banco.coleção`, as consultas lentas e o tempo de coleta.
+        """
+        with self._lock:
+            commands = {
+                f'{command} {name}': histogram.as_dict()
+                for (command, name), histogram in self._histograms.items()
+                if namespace is None or name == namespace
+            }
+            slow = [sample for sample in self._slow if namespace is None or sample['namespace'] == namespace]
+        return {
+            'since': self.started_at,
+            'commands': commands,
+            'slow': slow,
+        }
+
+    def reset(self) -> None:
+        """Descarta todas as estatísticas coletadas."""
+        with self._lock:
+            self._histograms.clear()
+            self._slow.clear()
+            self.started_at = time.time()
@@ -1,32 +1,55 @@
-from motor.motor_asyncio import AsyncIOMotorClient
-from typing import Literal
+from pymongo import IndexModel, ReturnDocument
+from typing import Literal, List, ClassVar, Optional
 import logging
 
+from database.storage import StorageClient
 from database.models.settings import Settings
 
 log = logging.getLogger(__name__)
 
 class SettingsDB:
-    def __init__(self, client: AsyncIOMotorClient):
+    INDEXES: ClassVar[List[IndexModel]] = [] # Só há consultas por _id
+
+    def __init__(self, client: StorageClient):
         self.collection = client['nayul']['settings']
+        self._cache: Optional[Settings] = None
+        self._version: int = 0 # Incrementado a cada alteração, invalida leituras que estavam em andamento
+
+    async def ensure_indexes(self) -> None:
+        """Cria os índices declarados em `INDEXES`, caso ainda não existam."""
+        if self.INDEXES:
+            await self.collection.create_indexes(self.INDEXES)
 
     async def get_settings(self) -> Settings:
         """
-        Obtém as configurações do bot do banco de dados.
+        Obtém as configurações do bot, do cache ou do banco de dados.
+
+        O documento padrão é criado na primeira leitura, de forma atômica.
 
         Returns:
             Settings: As configurações do bot.
         """
-        data = await self.collection.find_one({'_id': 0})
-        if data is None:
-            default_settings = Settings().to_dict()
-            default_settings['_id'] = 0
-            await self.collection.insert_one(default_settings)
-            log.debug('Configurações padrão inseridas no banco de dados.')
-            return Settings()
-        
+        if self._cache is not None:
+            return self._cache
+
+        version = self._version
+        data = await self.collection.find_one_and_update(
+            {'_id': 0},
+            {'$setOnInsert': {key: value for key, value in Settings().to_dict().items() if key != '_id'}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        settings = Settings.from_document(data)
+        if version == self._version:
+            self._cache = settings
+
         log.debug('Settings: %s', data)
-        return Settings(**data)
+        return settings
+
+    def invalidate(self) -> None:
+        """Descarta as configurações em cache, forçando uma nova leitura do banco de dados."""
+        self._version += 1
+        self._cache = None
 
     async def update_settings(self, *, query: dict) -> None:
         """
@@ -35,7 +58,10 @@ class SettingsDB:
         Args:
             query (`dict`): Os dados a serem atualizados.
         """
-        await self.collection.update_one({'_id': 0}, query, upsert=True)
+        try:
+            await self.collection.update_one({'_id': 0}, query, upsert=True)
+        finally:
+            self.invalidate()
         log.debug('Configurações atualizadas no banco de dados.')
 
     async def update_staffs(self, action: Literal['add', 'remove'], staff_id: int) -> None:
@@ -46,16 +72,10 @@ class SettingsDB:
             action (`Literal['add', 'remove']`): A ação a ser realizada.
             staff_id (`int`): O ID do staff a ser adicionado ou removido.
         """
-        settings = await self.get_settings()
-        settings_dict = settings.to_dict()
-
         match action:
             case 'add':
-                if staff_id not in settings_dict['staffs']:
-                    settings_dict['staffs'].append(staff_id)
+                await self.update_settings(query={'$addToSet': {'staffs': staff_id}})
             case 'remove':
-                if staff_id in settings_dict['staffs']:
-                    settings_dict['staffs'].remove(staff_id)
+                await self.update_settings(query={'$pull': {'staffs': staff_id}})
 
-        await self.update_settings(query={'$set': settings_dict})
-        log.debug('Staff %s: %s', action, staff_id)
\ No newline at end of file
+        log.debug('Staff %s: %s', action, staff_id)
@@ -0,0 +1,114 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sortedcontainers import SortedList
+
+from database.models.skin import ProfileSkin
+
+__all__ = ('SkinCatalog',)
+
+class SkinCatalog:
+    """
+    Catálogo em memória das skins de perfil, indexado por ID, raridade e preço.
+
+    As skins ficam ordenadas por `(preço, ID)` no índice geral e no índice de cada raridade, então
+    qualquer filtro por raridade e/ou faixa de preço é resolvido com uma busca binária e as páginas já
+    saem ordenadas, sem consultas ao banco de dados.
+    """
+    RARITIES: Tuple[int, ...] = (0, 1, 2, 3, 4)
+
+    def __init__(self):
+        self._by_id: Dict[str, ProfileSkin] = {}
+        self._by_price: SortedList = SortedList()
+        self._by_rarity: Dict[int, SortedList] = {rarity: SortedList() for rarity in self.RARITIES}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, skin_id: str) -> bool:
+        return skin_id in self._by_id
+
+    def load(self, skins: Iterable[ProfileSkin]) -> None:
+        """Substitui todo o catálogo pelas skins fornecidas."""
+        self._by_id = {skin.id: skin for skin in skins}
+        self._by_price = SortedList((skin.price, skin.id) for skin in self._by_id.values())
+        self._by_rarity = {
+            rarity: SortedList((skin.price, skin.id) for skin in self._by_id.values() if skin.rarity == rarity)
+            for rarity in self.RARITIES
+        }
+
+    def put(self, skin: ProfileSkin) -> None:
+        """Adiciona ou substitui uma skin no catálogo."""
+        self.remove(skin.id)
+        key = (skin.price, skin.id)
+        self._by_id[skin.id] = skin
+        self._by_price.add(key)
+        self._by_rarity[skin.rarity].add(key)
+
+    def remove(self, skin_id: str) -> Optional[ProfileSkin]:
+        """Remove uma skin do catálogo, retornando-a se ela existia."""
+        skin = self._by_id.pop(skin_id, None)
+        if skin is not None:
+            key = (skin.price, skin.id)
+            self._by_price.remove(key)
+            self._by_rarity[skin.rarity].remove(key)
+        return skin
+
+    def get(self, skin_id: str) -> Optional[ProfileSkin]:
+        """Obtém uma skin pelo ID."""
+        return self._by_id.get(skin_id)
+
+    def all(self) -> List[ProfileSkin]:
+        """Obtém todas as skins, ordenadas por preço."""
+        return [self._by_id[skin_id] for _, skin_id in self._by_price]
+
+    def count(self, *, rarity: Optional[int] = None, min_price: Optional[int] = None, max_price: Optional[int] = None) -> int:
+        """
+        Conta as skins que passam pelos filtros.
+
+        Args:
+            rarity (`Optional[int]`): Filtra pela raridade.
+            min_price (`Optional[int]`): Preço mínimo (inclusivo).
+            max_price (`Optional[int]`): Preço máximo (inclusivo).
+
+        Returns:
+            int: A quantidade de skins.
+        """
+        index, start, stop = self._range(rarity, min_price, max_price)
+        return max(stop - start, 0)
+
+    def page(
+        self,
+        page: int = 0,
+        per_page: int = 10,
+        *,
+        rarity: Optional[int] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None
+    ) -> List[ProfileSkin]:
+        """
+        Obtém uma página das skins que passam pelos filtros, ordenadas por preço.
+
+        Args:
+            page (`int`): O número da página (começando em 0).
+            per_page (`int`): Quantidade de skins por página.
+            rarity (`Optional[int]`): Filtra pela raridade.
+            min_price (`Optional[int]`): Preço mínimo (inclusivo).
+            max_price (`Optional[int]`): Preço máximo (inclusivo).
+
+        Returns:
+            List[ProfileSkin]: As skins da página.
+        """
+        index, start, stop = self._range(rarity, min_price, max_price)
+        start += page * per_page
+        stop = min(stop, start + per_page)
+        if start >= stop:
+            return []
+        return [self._by_id[skin_id] for _, skin_id in index.islice(start, stop)]
+
+    def _range(self, rarity: Optional[int], min_price: Optional[int], max_price: Optional[int]) -> Tuple[SortedList, int, int]:
+        """Retorna o índice a ser usado e as posições de início e fim da faixa de preço nele."""
+        index = self._by_price if rarity is None else self._by_rarity[rarity]
+        start = 0 if min_price is None else index.bisect_left((min_price,))
+        # `(max_price + 1,)` fica antes de qualquer `(max_price + 1, id)`, então inclui todas as skins com `max_price`.
+        stop = len(index) if max_price is None else index.bisect_left((max_price + 1,))
+        return index, start, stop
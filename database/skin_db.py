@@ -1,32 +1,49 @@
-from motor.motor_asyncio import AsyncIOMotorClient
-from typing import Optional, Literal, List
+from pymongo import IndexModel, ASCENDING
+from typing import Optional, Literal, List, ClassVar
 import logging
 
+from database.storage import StorageClient
 from database.models.skin import ProfileSkin
+from database.skin_catalog import SkinCatalog
 
 log = logging.getLogger(__name__)
 
 class SkinsDB:
-    def __init__(self, client: AsyncIOMotorClient):
+    INDEXES: ClassVar[List[IndexModel]] = [
+        IndexModel([('rarity', ASCENDING), ('price', ASCENDING)], name='rarity_price'),
+        IndexModel([('price', ASCENDING)], name='price'),
+    ]
+
+    def __init__(self, client: StorageClient):
         self.collection = client['nayul']['skins']
+        self.catalog = SkinCatalog()
+        self.loaded: bool = False
+
+    async def ensure_indexes(self) -> None:
+        """Cria os índices declarados em `INDEXES`, caso ainda não existam."""
+        await self.collection.create_indexes(self.INDEXES)
+
+    async def load_catalog(self) -> None:
+        """Carrega todas as skins do banco de dados para o catálogo em memória."""
+        data: List[dict] = await self.collection.find().to_list(length=None)
+        self.catalog.load(ProfileSkin.from_document(skin) for skin in data)
+        self.loaded = True
+        log.debug('Catálogo carregado com %s skins.', len(self.catalog))
 
     async def get_skins(self) -> list[ProfileSkin]:
         """
-        Obtém as skins de perfil do banco de dados.
+        Obtém as skins de perfil, ordenadas por preço.
 
         Returns:
             list[ProfileSkin]: As skins de perfil.
         """
-        data: Optional[list[dict]] = await self.collection.find().to_list(length=None)
-        if data is None:
-            log.debug('Nenhuma skin encontrada no banco de dados.')
-            return []
-        log.debug('Skins encontradas: %s', data)
-        return [ProfileSkin(**skin) for skin in data]
+        if not self.loaded:
+            await self.load_catalog()
+        return self.catalog.all()
     
     async def get_skin(self, skin_id: str) -> Optional[ProfileSkin]:
         """
-        Obtém uma skin de perfil do banco de dados.
+        Obtém uma skin de perfil.
 
         Args:
             skin_id (`str`): O ID da skin a ser obtida.
@@ -34,12 +51,38 @@ class SkinsDB:
         Returns:
             ProfileSkin: A skin de perfil.
         """
-        data: Optional[dict] = await self.collection.find_one({'_id': skin_id})
-        if data is None:
+        if not self.loaded:
+            await self.load_catalog()
+        skin = self.catalog.get(skin_id)
+        if skin is None:
             log.debug('Skin não encontrada com o ID: %s', skin_id)
-            return None
-        log.debug('Skin encontrada: %s', data)
-        return ProfileSkin(**data)
+        return skin
+
+    async def get_skins_page(
+        self,
+        page: int = 0,
+        per_page: int = 10,
+        *,
+        rarity: Optional[Literal[0, 1, 2, 3, 4]] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None
+    ) -> List[ProfileSkin]:
+        """
+        Obtém uma página das skins, ordenadas por preço, filtrando por raridade e/ou faixa de preço.
+
+        Args:
+            page (`int`): O número da página (começando em 0).
+            per_page (`int`): Quantidade de skins por página.
+            rarity (`Optional[Literal[0, 1, 2, 3, 4]]`): Filtra pela raridade.
+            min_price (`Optional[int]`): Preço mínimo (inclusivo).
+            max_price (`Optional[int]`): Preço máximo (inclusivo).
+
+        Returns:
+            List[ProfileSkin]: As skins da página.
+        """
+        if not self.loaded:
+            await self.load_catalog()
+        return self.catalog.page(page, per_page, rarity=rarity, min_price=min_price, max_price=max_price)
     
     async def remove_skin(self, skin_id: str) -> None:
         """
@@ -49,6 +92,7 @@ class SkinsDB:
             skin_id (`str`): O ID da skin a ser removida.
         """
         await self.collection.delete_one({'_id': skin_id})
+        self.catalog.remove(skin_id)
         log.debug('Skin removida com o ID: %s', skin_id)
 
     async def add_skin(self, skin_id: str, name: str, rarity: Literal[0, 1, 2, 3, 4], price: int, url: str, description: Optional[str] = None, author: Optional[str] = None) -> None:
@@ -64,7 +108,7 @@ class SkinsDB:
             author (`Optional[str]`): Autor da skin.
             url (`str`): URL da imagem da skin.
         """
-        skin_dict = ProfileSkin(
+        skin = ProfileSkin(
             id=skin_id,
             name=name,
             price=price,
@@ -72,9 +116,11 @@ class SkinsDB:
             description=description,
             author=author,
             url=url
-        ).to_dict()
+        )
+        skin_dict = skin.to_dict()
         await self.collection.insert_one(skin_dict)
-        log.debug('Skin %s adicionada com os dados: %s', skin_dict)
+        self.catalog.put(skin)
+        log.debug('Skin %s adicionada com os dados: %s', skin_id, skin_dict)
 
     async def update_skin(self, skin_id: str, *, name: Optional[str] = None, rarity: Optional[Literal[0, 1, 2, 3, 4]] = None, price: Optional[int] = None, description: Optional[str] = None, author: Optional[str] = None, url: Optional[str] = None,) -> None:
         """
@@ -97,26 +143,24 @@ class SkinsDB:
         if skin_data is None:
             raise ValueError('Skin não encontrada com o ID fornecido.')
 
-        skin_dict = ProfileSkin(
+        skin = ProfileSkin(
             id=skin_data.id,
-            name=name or skin_data.name,
-            price=price or skin_data.price,
-            rarity=rarity or skin_data.rarity,
-            description=description or skin_data.description,
-            author=author or skin_data.author,
-            url=url or skin_data.url
-        ).to_dict()
+            name=name if name is not None else skin_data.name,
+            price=price if price is not None else skin_data.price,
+            rarity=rarity if rarity is not None else skin_data.rarity,
+            description=description if description is not None else skin_data.description,
+            author=author if author is not None else skin_data.author,
+            url=url if url is not None else skin_data.url
+        )
+        skin_dict = skin.to_dict()
 
         await self.collection.update_one({'_id': skin_id}, {'$set': skin_dict})
-        log.debug('Skin %s atualizada com os dados: %s', skin_dict)
+        self.catalog.put(skin)
+        log.debug('Skin %s atualizada com os dados: %s', skin_id, skin_dict)
 
     async def get_all_skins(self) -> List[ProfileSkin]:
-        """Pega todas as skins do banco de dados.
+        """Pega todas as skins, ordenadas por preço.
         Returns:
             List[ProfileSkin]: Lista de todas as skins.
         """
-
-        skins = []
-        async for skin in self.collection.find().to_list(length=None):
-            skins.append(ProfileSkin(**skin))
-        return skins
\ No newline at end of file
+        return await self.get_skins()
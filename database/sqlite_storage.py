@@ -0,0 +1,579 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
+from datetime import datetime
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from bson import ObjectId, json_util
+from pymongo import ASCENDING, DeleteMany, DeleteOne, InsertOne, ReplaceOne, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from pymongo.results import BulkWriteResult, DeleteResult, InsertManyResult, InsertOneResult, UpdateResult
+
+from database.update_ops import apply_update
+
+log = logging.getLogger(__name__)
+
+__all__ = ('SQLiteClient',)
+
+# Datas voltam sem fuso (em UTC), como no Motor com as opções padrão.
+_JSON_OPTIONS = json_util.JSONOptions(json_mode=json_util.JSONMode.RELAXED, tz_aware=False)
+_MISSING = object()
+_TYPES: Dict[str, Tuple[type, ...]] = {
+    'object': (dict,),
+    'array': (list,),
+    'string': (str,),
+    'date': (datetime,),
+    'bool': (bool,),
+    'int': (int,),
+    'long': (int,),
+    'double': (float,),
+    'number': (int, float),
+    'objectId': (ObjectId,),
+    'null': (type(None),),
+}
+
+# `_id` em JSON estendido, convertido pelo SQLite: números comparam como números, textos como textos e
+# ObjectIds (`{"$oid": ...}`) pelo hexadecimal, na mesma ordem do MongoDB dentro de cada tipo.
+_ORDER_KEY = "json_extract(_id, '$')"
+_RANGE_OPERATORS = {'$gt': '>', '$gte': '>=', '$lt': '<', '$lte': '<='}
+
+#---------- Consultas ----------#
+
+def _encode(value: Any) -> str:
+    return json_util.dumps(value, json_options=_JSON_OPTIONS)
+
+def _decode(text: str) -> Any:
+    return json_util.loads(text, json_options=_JSON_OPTIONS)
+
+def _get(document: Any, path: str) -> Any:
+    for part in path.split('.'):
+        if not isinstance(document, dict) or part not in document:
+            return _MISSING
+        document = document[part]
+    return document
+
+def _equals(value: Any, expected: Any) -> bool:
+    if value is _MISSING:
+        return expected is None
+    if isinstance(value, list) and not isinstance(expected, list):
+        return expected in value
+    return value == expected
+
+def _compare(value: Any, operator: str, argument: Any) -> bool:
+    match operator:
+        case '$eq':
+            return _equals(value, argument)
+        case '$ne':
+            return not _equals(value, argument)
+        case '$in':
+            return any(_equals(value, item) for item in argument)
+        case '$nin':
+            return not any(_equals(value, item) for item in argument)
+        case '$exists':
+            return (value is not _MISSING) == bool(argument)
+        case '$type':
+            types = _TYPES[argument]
+            return value is not _MISSING and isinstance(value, types) and not (isinstance(value, bool) and bool not in types)
+        case '$gt' | '$gte' | '$lt' | '$lte':
+            if value is _MISSING or value is None:
+                return False
+            try:
+                if operator == '$gt':
+                    return value > argument
+                if operator == '$gte':
+                    return value >= argument
+                if operator == '$lt':
+                    return value < argument
+                return value <= argument
+            except TypeError:
+                return False
+        case _:
+            raise ValueError(f'Operador de consulta não suportado: {operator}')
+
+def _matches(document: dict, query: Optional[dict]) -> bool:
+    """Verifica se o documento passa pelo filtro (sintaxe do MongoDB)."""
+    for key, condition in (query or {}).items():
+        if key == '$and':
+            if not all(_matches(document, item) for item in condition):
+                return False
+        elif key == '$or':
+            if not any(_matches(document, item) for item in condition):
+                return False
+        elif isinstance(condition, dict) and condition and all(operator.startswith('$') for operator in condition):
+            value = _get(document, key)
+            if not all(_compare(value, operator, argument) for operator, argument in condition.items()):
+                return False
+        elif not _equals(_get(document, key), condition):
+            return False
+    return True
+
+def _project(document: dict, projection: Optional[dict]) -> dict:
+    if not projection:
+        return document
+    included = [path for path, value in projection.items() if value and path != '_id']
+    if not included:
+        for path, value in projection.items():
+            if not value:
+                *parents, key = path.split('.')
+                parent = _get(document, '.'.join(parents)) if parents else document
+                if isinstance(parent, dict):
+                    parent.pop(key, None)
+        return document
+
+    result = {'_id': document['_id']} if projection.get('_id', 1) and '_id' in document else {}
+    for path in included:
+        value = _get(document, path)
+        if value is _MISSING:
+            continue
+        *parents, key = path.split('.')
+        current = result
+        for part in parents:
+            current = current.setdefault(part, {})
+        current[key] = value
+    return result
+
+def _sort(documents: List[dict], spec: List[Tuple[str, int]]) -> None:
+    # Ordenações estáveis, da última chave para a primeira. `None`/ausente vem antes, como no MongoDB.
+    for path, direction in reversed(spec):
+        documents.sort(
+            key=lambda document: (0, 0) if (value := _get(document, path)) in (None, _MISSING) else (1, value),
+            reverse=direction < 0
+        )
+
+def _id_direction(sort: List[Tuple[str, int]]) -> Optional[int]:
+    """Retorna a direção da ordenação se ela for só por `_id` (`0` sem ordenação), ou `None` se não for."""
+    if not sort:
+        return 0
+    if len(sort) == 1 and sort[0][0] == '_id':
+        return sort[0][1]
+    return None
+
+def _is_id_range(condition: Any) -> bool:
+    """Verifica se a condição do `_id` pode ser resolvida com o índice de ordenação (ausente ou só `$gt`/`$gte`/`$lt`/`$lte`)."""
+    return condition is _MISSING or (isinstance(condition, dict) and bool(condition) and set(condition) <= set(_RANGE_OPERATORS))
+
+def _upsert_base(query: dict) -> dict:
+    """Monta o documento inicial de um upsert a partir dos campos de igualdade do filtro."""
+    document: dict = {}
+    for path, condition in query.items():
+        if path.startswith('$') or (isinstance(condition, dict) and any(key.startswith('$') for key in condition)):
+            continue
+        *parents, key = path.split('.')
+        current = document
+        for part in parents:
+            current = current.setdefault(part, {})
+        current[key] = deepcopy(condition)
+    return document
+
+#---------- Cliente ----------#
+
+class _Topology:
+    topology_type_name = 'Single'
+
+class SQLiteClient:
+    """
+    Armazenamento local em um arquivo SQLite (modo WAL), com a mesma API de coleções do Motor.
+
+    Cada coleção é uma tabela com o `_id` como chave primária e o documento em JSON estendido
+    (`bson.json_util`). Consultas por `_id` usam a chave primária, e ordenações e intervalos (`$gt`, `$lt`...)
+    do `_id` usam um índice; as demais percorrem a tabela, o que é adequado para instalações pequenas de
+    um único processo. Os updates reaproveitam `apply_update`.
+
+    Todas as operações rodam em um pool de threads, cada uma com sua própria conexão, sem bloquear o
+    loop de eventos. Escritas usam `BEGIN IMMEDIATE`, então ficam serializadas pelo próprio SQLite.
+
+    Args:
+        path (`str`): Caminho do arquivo do banco de dados.
+        max_workers (`int`): Quantidade de threads (e conexões) do pool.
+    """
+    topology_description = _Topology()
+
+    def __init__(self, path: str, *, max_workers: int = 4):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='sqlite')
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> '_SQLiteDatabase':
+        return _SQLiteDatabase(self, name)
+
+    def close(self) -> None:
+        """Encerra o pool de threads e fecha as conexões."""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Executa `func(conexão, *args)` em uma thread do pool."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, partial(self._call, func, *args))
+
+    def _call(self, func: Callable[..., Any], *args: Any) -> Any:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.execute('PRAGMA busy_timeout=5000')
+            self._local.connection = connection
+            self._local.tables = set()
+            with self._lock:
+                self._connections.append(connection)
+        return func(connection, *args)
+
+class _SQLiteDatabase:
+    def __init__(self, client: SQLiteClient, name: str):
+        self.client = client
+        self.name = name
+
+    def __getitem__(self, name: str) -> 'SQLiteCollection':
+        return SQLiteCollection(self.client, self.name, name)
+
+class SQLiteCursor:
+    """
+    Cursor de `SQLiteCollection.find`.
+
+    Com `batch_size`, sem `limit` e sem outra ordenação além do `_id` (nem outro filtro no `_id` além de
+    `$gt`/`$gte`/`$lt`/`$lte`), a iteração lê a tabela em páginas pelo índice do `_id`, sem carregar todos
+    os documentos na memória; nos demais casos, eles são lidos de uma vez.
+    """
+    def __init__(self, collection: 'SQLiteCollection', query: Optional[dict], projection: Optional[dict]):
+        self._collection = collection
+        self._query = query or {}
+        self._projection = projection
+        self._sort: List[Tuple[str, int]] = []
+        self._limit = 0
+        self._batch_size = 0
+
+    def sort(self, key_or_list: Any, direction: Optional[int] = None) -> 'SQLiteCursor':
+        if isinstance(key_or_list, str):
+            self._sort = [(key_or_list, direction or ASCENDING)]
+        else:
+            self._sort = list(key_or_list)
+        return self
+
+    def batch_size(self, batch_size: int) -> 'SQLiteCursor':
+        self._batch_size = batch_size
+        return self
+
+    def limit(self, limit: int) -> 'SQLiteCursor':
+        self._limit = limit
+        return self
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        direction = _id_direction(self._sort)
+        if not self._batch_size or self._limit or direction is None or not _is_id_range(self._query.get('_id', _MISSING)):
+            for document in await self._fetch():
+                yield document
+            return
+
+        after = None
+        while True:
+            after, documents = await self._collection.client.run(
+                self._collection._find_page, self._query, self._projection, direction, after, self._batch_size
+            )
+            for document in documents:
+                yield document
+            if after is None:
+                return
+
+    async def to_list(self, length: Optional[int] = None) -> List[dict]:
+        documents = await self._fetch()
+        return documents if length is None else documents[:length]
+
+    async def _fetch(self) -> List[dict]:
+        return await self._collection.client.run(self._collection._find, self._query, self._projection, self._sort, self._limit)
+
+class SQLiteCollection:
+    """Uma coleção de `SQLiteClient`. Veja `database.storage.StorageCollection`."""
+    def __init__(self, client: SQLiteClient, database: str, name: str):
+        self.client = client
+        self.name = name
+        self.full_name = f'{database}.{name}'
+        self._table = '"' + self.full_name.replace('"', '""') + '"'
+
+    #---------- API assíncrona ----------#
+
+    def find(self, filter: Optional[dict] = None, projection: Optional[dict] = None, **kwargs: Any) -> SQLiteCursor:
+        return SQLiteCursor(self, filter, projection)
+
+    async def find_one(self, filter: Optional[dict] = None, projection: Optional[dict] = None, **kwargs: Any) -> Optional[dict]:
+        documents = await self.client.run(self._find, filter or {}, projection, [], 1)
+        return documents[0] if documents else None
+
+    async def find_one_and_update(
+        self,
+        filter: dict,
+        update: dict,
+        projection: Optional[dict] = None,
+        *,
+        upsert: bool = False,
+        return_document: bool = ReturnDocument.BEFORE,
+        **kwargs: Any
+    ) -> Optional[dict]:
+        return await self.client.run(self._find_one_and_update, filter, update, projection, upsert, return_document)
+
+    async def insert_one(self, document: dict, **kwargs: Any) -> InsertOneResult:
+        result = await self.bulk_write([InsertOne(document)])
+        return InsertOneResult(result.inserted_ids[0], True)
+
+    async def insert_many(self, documents: Sequence[dict], ordered: bool = True, **kwargs: Any) -> InsertManyResult:
+        result = await self.bulk_write([InsertOne(document) for document in documents], ordered=ordered)
+        return InsertManyResult(result.inserted_ids, True)
+
+    async def update_one(self, filter: dict, update: dict, upsert: bool = False, **kwargs: Any) -> UpdateResult:
+        return self._update_result(await self.bulk_write([UpdateOne(filter, update, upsert=upsert)]))
+
+    async def update_many(self, filter: dict, update: dict, upsert: bool = False, **kwargs: Any) -> UpdateResult:
+        return self._update_result(await self.bulk_write([UpdateMany(filter, update, upsert=upsert)]))
+
+    async def delete_one(self, filter: dict, **kwargs: Any) -> DeleteResult:
+        result = await self.bulk_write([DeleteOne(filter)])
+        return DeleteResult({'n': result.deleted_count}, True)
+
+    async def delete_many(self, filter: dict, **kwargs: Any) -> DeleteResult:
+        result = await self.bulk_write([DeleteMany(filter)])
+        return DeleteResult({'n': result.deleted_count}, True)
+
+    async def bulk_write(self, requests: Sequence[Any], ordered: bool = True, **kwargs: Any) -> '_BulkResult':
+        """
+        Aplica as operações (`InsertOne`, `ReplaceOne`, `UpdateOne`, `UpdateMany`, `DeleteOne`, `DeleteMany`)
+        em uma transação.
+
+        Como no MongoDB, as operações antes de um erro continuam aplicadas, e o erro é lançado como
+        `BulkWriteError` no final (ou logo no primeiro erro, se `ordered`).
+        """
+        result = await self.client.run(self._bulk_write, list(requests), ordered)
+        if result.bulk_api_result['writeErrors']:
+            raise BulkWriteError(result.bulk_api_result)
+        return result
+
+    async def count_documents(self, filter: dict, **kwargs: Any) -> int:
+        return len(await self.client.run(self._find, filter, {'_id': 1}, [], 0))
+
+    async def estimated_document_count(self, **kwargs: Any) -> int:
+        return await self.client.run(self._count)
+
+    async def create_indexes(self, indexes: Sequence[Any], **kwargs: Any) -> List[str]:
+        # Só o `_id` é indexado; os demais índices do MongoDB não se aplicam a este armazenamento.
+        return [index.document['name'] for index in indexes]
+
+    #---------- Execução nas threads ----------#
+
+    def _ensure_table(self, connection: sqlite3.Connection) -> None:
+        tables = self.client._local.tables
+        if self.full_name not in tables:
+            connection.execute(f'CREATE TABLE IF NOT EXISTS {self._table} (_id TEXT PRIMARY KEY, doc TEXT NOT NULL) WITHOUT ROWID')
+            index = '"' + (self.full_name + '._id_order').replace('"', '""') + '"'
+            connection.execute(f'CREATE INDEX IF NOT EXISTS {index} ON {self._table} ({_ORDER_KEY})')
+            tables.add(self.full_name)
+
+    def _rows(self, connection: sqlite3.Connection, query: dict) -> Iterator[Tuple[str, dict]]:
+        """Retorna `(chave, documento)` dos documentos que passam pelo filtro, usando a chave primária quando possível."""
+        self._ensure_table(connection)
+        condition = query.get('_id', _MISSING)
+        if condition is not _MISSING and not isinstance(condition, dict):
+            rows = connection.execute(f'SELECT _id, doc FROM {self._table} WHERE _id = ?', (_encode(condition),)).fetchall()
+        elif isinstance(condition, dict) and set(condition) == {'$in'}:
+            keys = [_encode(value) for value in condition['$in']]
+            rows = []
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows.extend(connection.execute(f'SELECT _id, doc FROM {self._table} WHERE _id IN ({", ".join("?" * len(chunk))})', chunk))
+        elif condition is not _MISSING and _is_id_range(condition):
+            rows = connection.execute(*self._ordered_select(condition, 0)).fetchall()
+        else:
+            rows = connection.execute(f'SELECT _id, doc FROM {self._table}').fetchall()
+
+        for key, text in rows:
+            document = _decode(text)
+            if _matches(document, query):
+                yield key, document
+
+    def _find(self, connection: sqlite3.Connection, query: dict, projection: Optional[dict], sort: List[Tuple[str, int]], limit: int) -> List[dict]:
+        direction = _id_direction(sort)
+        condition = query.get('_id', _MISSING)
+        if direction is None or not _is_id_range(condition):
+            documents = [document for _, document in self._rows(connection, query)]
+            if sort:
+                _sort(documents, sort)
+            if limit:
+                documents = documents[:limit]
+            return [_project(document, projection) for document in documents]
+
+        # Ordenação e intervalo do `_id` resolvidos pelo índice: a leitura para assim que o limite é atingido.
+        self._ensure_table(connection)
+        documents = []
+        for _, text in connection.execute(*self._ordered_select(condition, direction)):
+            document = _decode(text)
+            if _matches(document, query):
+                documents.append(_project(document, projection))
+                if limit and len(documents) >= limit:
+                    break
+        return documents
+
+    def _find_page(
+        self,
+        connection: sqlite3.Connection,
+        query: dict,
+        projection: Optional[dict],
+        direction: int,
+        after: Optional[str],
+        size: int
+    ) -> Tuple[Optional[str], List[dict]]:
+        """Lê até `size` linhas depois da chave `after`, retornando a última chave lida (ou `None` no fim da tabela)."""
+        self._ensure_table(connection)
+        rows = connection.execute(*self._ordered_select(query.get('_id', _MISSING), direction or ASCENDING, after, size)).fetchall()
+        documents = []
+        for _, text in rows:
+            document = _decode(text)
+            if _matches(document, query):
+                documents.append(_project(document, projection))
+        return (rows[-1][0] if len(rows) == size else None), documents
+
+    def _ordered_select(self, condition: Any, direction: int, after: Optional[str] = None, limit: int = 0) -> Tuple[str, list]:
+        """Monta o `SELECT` que usa o índice do `_id` para um intervalo (`condition`), uma ordenação e uma paginação."""
+        clauses, params = [], []
+        if condition is not _MISSING:
+            for operator, value in condition.items():
+                clauses.append(f"{_ORDER_KEY} {_RANGE_OPERATORS[operator]} json_extract(?, '$')")
+                params.append(_encode(value))
+        if after is not None:
+            clauses.append(f"{_ORDER_KEY} {'>' if direction > 0 else '<'} json_extract(?, '$')")
+            params.append(after)
+        sql = f'SELECT _id, doc FROM {self._table}'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        if direction:
+            sql += f" ORDER BY {_ORDER_KEY} {'ASC' if direction > 0 else 'DESC'}"
+        if limit:
+            sql += ' LIMIT ?'
+            params.append(limit)
+        return sql, params
+
+    def _count(self, connection: sqlite3.Connection) -> int:
+        self._ensure_table(connection)
+        return connection.execute(f'SELECT COUNT(*) FROM {self._table}').fetchone()[0]
+
+    @contextmanager
+    def _transaction(self, connection: sqlite3.Connection) -> Iterator[None]:
+        self._ensure_table(connection)
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def _save(self, connection: sqlite3.Connection, key: str, document: dict) -> None:
+        connection.execute(f'UPDATE {self._table} SET doc = ? WHERE _id = ?', (_encode(document), key))
+
+    def _insert(self, connection: sqlite3.Connection, document: dict) -> Any:
+        if '_id' not in document:
+            document['_id'] = ObjectId()
+        try:
+            connection.execute(f'INSERT INTO {self._table} (_id, doc) VALUES (?, ?)', (_encode(document['_id']), _encode(document)))
+        except sqlite3.IntegrityError:
+            raise DuplicateKeyError(f'E11000 duplicate key error collection: {self.full_name} dup key: {{ _id: {document["_id"]!r} }}', 11000)
+        return document['_id']
+
+    def _find_one_and_update(
+        self,
+        connection: sqlite3.Connection,
+        query: dict,
+        update: dict,
+        projection: Optional[dict],
+        upsert: bool,
+        return_document: bool
+    ) -> Optional[dict]:
+        with self._transaction(connection):
+            for key, document in self._rows(connection, query):
+                updated = apply_update(document, update)
+                self._save(connection, key, updated)
+                return _project(updated if return_document == ReturnDocument.AFTER else document, projection)
+
+            if not upsert:
+                return None
+            document = apply_update(_upsert_base(query), update, is_insert=True)
+            self._insert(connection, document)
+            return _project(document, projection) if return_document == ReturnDocument.AFTER else None
+
+    def _bulk_write(self, connection: sqlite3.Connection, requests: List[Any], ordered: bool) -> '_BulkResult':
+        result = {
+            'nInserted': 0, 'nUpserted': 0, 'nMatched': 0, 'nModified': 0, 'nRemoved': 0,
+            'upserted': [], 'writeErrors': [], 'writeConcernErrors': [],
+        }
+        inserted_ids = []
+        with self._transaction(connection):
+            for index, request in enumerate(requests):
+                try:
+                    if isinstance(request, InsertOne):
+                        inserted_ids.append(self._insert(connection, request._doc))
+                        result['nInserted'] += 1
+                    elif isinstance(request, (UpdateOne, UpdateMany)):
+                        matched = 0
+                        for key, document in self._rows(connection, request._filter):
+                            updated = apply_update(document, request._doc)
+                            matched += 1
+                            if updated != document:
+                                self._save(connection, key, updated)
+                                result['nModified'] += 1
+                            if isinstance(request, UpdateOne):
+                                break
+                        result['nMatched'] += matched
+                        if not matched and request._upsert:
+                            document = apply_update(_upsert_base(request._filter), request._doc, is_insert=True)
+                            result['upserted'].append({'index': index, '_id': self._insert(connection, document)})
+                            result['nUpserted'] += 1
+                    elif isinstance(request, ReplaceOne):
+                        for key, document in self._rows(connection, request._filter):
+                            replacement = {'_id': document['_id'], **{k: v for k, v in request._doc.items() if k != '_id'}}
+                            result['nMatched'] += 1
+                            if replacement != document:
+                                self._save(connection, key, replacement)
+                                result['nModified'] += 1
+                            break
+                        else:
+                            if request._upsert:
+                                document = {**_upsert_base(request._filter), **deepcopy(request._doc)}
+                                result['upserted'].append({'index': index, '_id': self._insert(connection, document)})
+                                result['nUpserted'] += 1
+                    elif isinstance(request, (DeleteOne, DeleteMany)):
+                        for key, _ in self._rows(connection, request._filter):
+                            connection.execute(f'DELETE FROM {self._table} WHERE _id = ?', (key,))
+                            result['nRemoved'] += 1
+                            if isinstance(request, DeleteOne):
+                                break
+                    else:
+                        raise ValueError(f'Operação não suportada: {type(request).__name__}')
+                except DuplicateKeyError as e:
+                    result['writeErrors'].append({'index': index, 'code': 11000, 'errmsg': str(e), 'op': getattr(request, '_doc', None)})
+                    if ordered:
+                        break
+        return _BulkResult(result, inserted_ids)
+
+    @staticmethod
+    def _update_result(result: '_BulkResult') -> UpdateResult:
+        upserted = result.upserted_ids.get(0)
+        raw = {'n': result.matched_count + (1 if upserted is not None else 0), 'nModified': result.modified_count}
+        if upserted is not None:
+            raw['upserted'] = upserted
+        return UpdateResult(raw, True)
+
+class _BulkResult(BulkWriteResult):
+    """`BulkWriteResult` com os `_id` inseridos, usados por `insert_one`/`insert_many`."""
+    def __init__(self, bulk_api_result: Dict[str, Any], inserted_ids: List[Any]):
+        super().__init__(bulk_api_result, True)
+        self.inserted_ids = inserted_ids
@@ -0,0 +1,55 @@
+from typing import Any, AsyncIterator, List, Optional, Protocol, Sequence, Tuple, Union
+
+__all__ = (
+    'StorageClient',
+    'StorageDatabase',
+    'StorageCollection',
+    'StorageCursor',
+)
+
+SortSpec = Union[str, List[Tuple[str, int]]]
+
+class StorageCursor(Protocol):
+    """Cursor retornado por `StorageCollection.find`, no formato do cursor do Motor."""
+    def sort(self, key_or_list: SortSpec, direction: Optional[int] = None) -> 'StorageCursor': ...
+    def batch_size(self, batch_size: int) -> 'StorageCursor': ...
+    def __aiter__(self) -> AsyncIterator[dict]: ...
+    async def to_list(self, length: Optional[int]) -> List[dict]: ...
+
+class StorageCollection(Protocol):
+    """
+    Subconjunto da API de coleção do Motor (`AsyncIOMotorCollection`) usado pelos bancos de dados do bot.
+
+    Filtros, updates e projeções seguem a sintaxe do MongoDB; os resultados são os de `pymongo.results`.
+    """
+    name: str
+
+    def find(self, filter: Optional[dict] = None, projection: Optional[dict] = None, **kwargs: Any) -> StorageCursor: ...
+    async def find_one(self, filter: Optional[dict] = None, projection: Optional[dict] = None, **kwargs: Any) -> Optional[dict]: ...
+    async def find_one_and_update(self, filter: dict, update: dict, projection: Optional[dict] = None, **kwargs: Any) -> Optional[dict]: ...
+    async def insert_one(self, document: dict, **kwargs: Any) -> Any: ...
+    async def insert_many(self, documents: Sequence[dict], ordered: bool = True, **kwargs: Any) -> Any: ...
+    async def update_one(self, filter: dict, update: dict, upsert: bool = False, **kwargs: Any) -> Any: ...
+    async def update_many(self, filter: dict, update: dict, upsert: bool = False, **kwargs: Any) -> Any: ...
+    async def delete_one(self, filter: dict, **kwargs: Any) -> Any: ...
+    async def delete_many(self, filter: dict, **kwargs: Any) -> Any: ...
+    async def bulk_write(self, requests: Sequence[Any], ordered: bool = True, **kwargs: Any) -> Any: ...
+    async def count_documents(self, filter: dict, **kwargs: Any) -> int: ...
+    async def estimated_document_count(self, **kwargs: Any) -> int: ...
+    async def create_indexes(self, indexes: Sequence[Any], **kwargs: Any) -> List[str]: ...
+
+class StorageDatabase(Protocol):
+    def __getitem__(self, name: str) -> StorageCollection: ...
+
+class StorageClient(Protocol):
+    """
+    Cliente de armazenamento usado por `UsersDB`, `SkinsDB`, `SettingsDB` e os demais bancos de dados.
+
+    `AsyncIOMotorClient` já segue este formato; `SQLiteClient` é a implementação embutida, sem servidor.
+    Transações (`start_session`) só são usadas quando `topology_description.topology_type_name` indica
+    um replica set ou cluster do MongoDB.
+    """
+    topology_description: Any
+
+    def __getitem__(self, name: str) -> StorageDatabase: ...
+    def close(self) -> None: ...
@@ -0,0 +1,101 @@
+from typing import Dict, Hashable, List, Tuple
+
+__all__ = ('TimerWheel',)
+
+class TimerWheel:
+    """
+    Roda de temporizadores hierárquica: agenda, cancela e dispara chaves em O(1).
+
+    Cada nível é um vetor de slots; o nível 0 tem a resolução de um tick e cada nível acima cobre uma
+    volta inteira do nível abaixo (com os padrões: segundos, minutos, horas e dias). Quando um nível
+    completa uma volta, o slot atual do nível de cima é redistribuído nos níveis de baixo. Expirações
+    além do último nível ficam em uma lista de espera, revisada a cada volta completa da roda.
+
+    Args:
+        resolution (`float`): Duração de um tick, em segundos.
+        slots (`Tuple[int, ...]`): Quantidade de slots de cada nível, do menor para o maior.
+        now (`float`): Timestamp atual, de onde a roda começa a contar.
+    """
+    def __init__(self, resolution: float = 1.0, slots: Tuple[int, ...] = (60, 60, 24, 512), *, now: float = 0.0):
+        self.resolution = resolution
+        self._slots = slots
+        # Quantidade de ticks coberta por um slot de cada nível.
+        self._spans: List[int] = [1]
+        for amount in slots:
+            self._spans.append(self._spans[-1] * amount)
+        self._levels: List[List[Dict[Hashable, int]]] = [[{} for _ in range(amount)] for amount in slots]
+        self._overflow: Dict[Hashable, int] = {}
+        self._where: Dict[Hashable, Dict[Hashable, int]] = {}
+        self._tick = self._to_tick(now)
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._where
+
+    def schedule(self, key: Hashable, expires_at: float) -> None:
+        """
+        Agenda (ou reagenda) uma chave para disparar no timestamp `expires_at`.
+
+        Expirações no passado disparam no próximo `advance`.
+        """
+        self.cancel(key)
+        self._place(key, max(self._to_tick(expires_at), self._tick + 1))
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancela uma chave agendada, retornando `True` se ela existia."""
+        bucket = self._where.pop(key, None)
+        if bucket is None:
+            return False
+        del bucket[key]
+        return True
+
+    def advance(self, now: float) -> List[Hashable]:
+        """
+        Avança a roda até o timestamp `now`.
+
+        Returns:
+            List[Hashable]: As chaves que expiraram, na ordem de expiração.
+        """
+        target = self._to_tick(now)
+        expired: List[Hashable] = []
+        while self._tick < target:
+            self._tick += 1
+            tick = self._tick
+            if tick % self._spans[-1] == 0:
+                pending, self._overflow = self._overflow, {}
+                for key, expires in pending.items():
+                    del self._where[key]
+                    self._place(key, expires)
+            # Do maior nível para o menor, para que uma chave redistribuída possa descer mais de um nível no mesmo tick.
+            for level in range(len(self._slots) - 1, 0, -1):
+                if tick % self._spans[level] == 0:
+                    bucket = self._levels[level][(tick // self._spans[level]) % self._slots[level]]
+                    pending = dict(bucket)
+                    bucket.clear()
+                    for key, expires in pending.items():
+                        del self._where[key]
+                        self._place(key, expires)
+
+            bucket = self._levels[0][tick % self._slots[0]]
+            if bucket:
+                for key in list(bucket):
+                    del self._where[key]
+                expired.extend(bucket)
+                bucket.clear()
+        return expired
+
+    def _to_tick(self, timestamp: float) -> int:
+        return int(timestamp // self.resolution)
+
+    def _place(self, key: Hashable, expires: int) -> None:
+        delta = expires - self._tick
+        for level, amount in enumerate(self._slots):
+            if delta < self._spans[level + 1]:
+                bucket = self._levels[level][(expires // self._spans[level]) % amount]
+                break
+        else:
+            bucket = self._overflow
+        bucket[key] = expires
+        self._where[key] = bucket
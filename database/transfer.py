@@ -0,0 +1,290 @@
+import argparse
+import asyncio
+import gzip
+import io
+import logging
+import os
+import time
+from typing import IO, Dict, List, Literal, Optional, Sequence, Set, Tuple
+
+from bson import json_util
+from pymongo import ReplaceOne
+from pymongo.errors import BulkWriteError
+
+from database.storage import StorageClient, StorageCollection
+
+try:
+    import zstandard
+except ImportError: # Opcional: sem o zstandard, os arquivos são comprimidos com gzip
+    zstandard = None
+
+log = logging.getLogger(__name__)
+
+__all__ = (
+    'COLLECTIONS',
+    'export_collection',
+    'import_collection',
+    'export_database',
+    'import_database',
+)
+
+# Nome do arquivo -> (banco, coleção)
+COLLECTIONS: Dict[str, Tuple[str, str]] = {
+    'users': ('global', 'users'),
+    'skins': ('nayul', 'skins'),
+    'settings': ('nayul', 'settings'),
+    'pearl_ledger': ('global', 'pearl_ledger'),
+    'pearl_snapshots': ('global', 'pearl_snapshots'),
+}
+
+_JSON_OPTIONS = json_util.JSONOptions(json_mode=json_util.JSONMode.RELAXED, tz_aware=False)
+_EXTENSIONS = ('.ndjson.zst', '.ndjson.gz')
+
+#---------- Arquivos ----------#
+
+def _default_extension() -> str:
+    return '.ndjson.zst' if zstandard is not None else '.ndjson.gz'
+
+def _require_zstandard(path: str) -> None:
+    if path.endswith('.zst') and zstandard is None:
+        raise RuntimeError(f'O pacote "zstandard" é necessário para ler ou gravar {path}.')
+
+def _open_writer(path: str, *, zstd: bool) -> IO[bytes]:
+    if zstd:
+        return zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(open(path, 'wb'))
+    return gzip.open(path, 'wb', compresslevel=6)
+
+def _open_reader(path: str) -> IO[bytes]:
+    if path.endswith('.zst'):
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb')))
+    return gzip.open(path, 'rb')
+
+def _read_lines(stream: IO[bytes], amount: int) -> List[bytes]:
+    lines = []
+    while len(lines) < amount:
+        line = stream.readline()
+        if not line:
+            break
+        if line.strip():
+            lines.append(line)
+    return lines
+
+def _find_file(directory: str, name: str) -> Optional[str]:
+    for extension in _EXTENSIONS:
+        path = os.path.join(directory, name + extension)
+        if os.path.exists(path):
+            return path
+    return None
+
+#---------- Exportação e importação ----------#
+
+async def export_collection(collection: StorageCollection, path: str, *, batch_size: int = 1000) -> int:
+    """
+    Exporta uma coleção para um arquivo NDJSON comprimido (um documento em JSON estendido por linha).
+
+    Os documentos são lidos com um cursor em lotes de `batch_size`, e cada lote é comprimido e gravado
+    em uma thread enquanto o próximo é lido, então a memória usada não depende do tamanho da coleção.
+    O arquivo é escrito com um nome temporário e só substitui o destino ao final.
+
+    Args:
+        collection (`StorageCollection`): A coleção exportada.
+        path (`str`): O arquivo de destino (`.ndjson.zst` ou `.ndjson.gz`).
+        batch_size (`int`): Quantidade de documentos por lote.
+
+    Returns:
+        int: A quantidade de documentos exportados.
+    """
+    _require_zstandard(path)
+    temporary = path + '.part'
+    stream = _open_writer(temporary, zstd=path.endswith('.zst'))
+    count = 0
+    lines: List[bytes] = []
+    writing: Optional[asyncio.Future] = None
+    try:
+        async for document in collection.find({}).batch_size(batch_size):
+            lines.append(json_util.dumps(document, json_options=_JSON_OPTIONS).encode() + b'\n')
+            if len(lines) >= batch_size:
+                if writing is not None:
+                    await writing
+                writing = asyncio.ensure_future(asyncio.to_thread(stream.write, b''.join(lines)))
+                count += len(lines)
+                lines = []
+        if writing is not None:
+            await writing
+        if lines:
+            await asyncio.to_thread(stream.write, b''.join(lines))
+            count += len(lines)
+        await asyncio.to_thread(stream.close)
+    except BaseException:
+        if writing is not None and not writing.done():
+            await asyncio.wait([writing])
+        stream.close()
+        os.remove(temporary)
+        raise
+    os.replace(temporary, path)
+    return count
+
+async def import_collection(
+    collection: StorageCollection,
+    path: str,
+    *,
+    chunk_size: int = 1000,
+    parallelism: int = 4,
+    mode: Literal['upsert', 'insert'] = 'upsert'
+) -> int:
+    """
+    Importa um arquivo gerado por `export_collection` para uma coleção.
+
+    O arquivo é lido em blocos de `chunk_size` documentos, e até `parallelism` blocos são gravados ao
+    mesmo tempo; a leitura espera quando esse limite é atingido, então a memória usada também é constante.
+
+    Args:
+        collection (`StorageCollection`): A coleção de destino.
+        path (`str`): O arquivo importado.
+        chunk_size (`int`): Quantidade de documentos por `bulk_write`/`insert_many`.
+        parallelism (`int`): Quantidade máxima de blocos sendo gravados ao mesmo tempo.
+        mode (`Literal['upsert', 'insert']`): `upsert` substitui os documentos com o mesmo `_id` (`ReplaceOne`);
+            `insert` usa `insert_many` e mantém os documentos que já existem.
+
+    Returns:
+        int: A quantidade de documentos lidos do arquivo.
+
+    Raises:
+        BulkWriteError: Se algum bloco falhar (exceto por `_id` duplicado no modo `insert`).
+    """
+    _require_zstandard(path)
+    stream = _open_reader(path)
+    semaphore = asyncio.Semaphore(parallelism)
+    tasks: Set[asyncio.Task] = set()
+    failures: List[BaseException] = []
+    count = 0
+
+    async def write(documents: List[dict]) -> None:
+        try:
+            if mode == 'insert':
+                await collection.insert_many(documents, ordered=False)
+            else:
+                await collection.bulk_write([ReplaceOne({'_id': document['_id']}, document, upsert=True) for document in documents], ordered=False)
+        except BulkWriteError as e:
+            if mode != 'insert' or any(error.get('code') != 11000 for error in e.details.get('writeErrors', [])):
+                failures.append(e)
+        except Exception as e:
+            failures.append(e)
+        finally:
+            semaphore.release()
+
+    try:
+        while not failures:
+            lines = await asyncio.to_thread(_read_lines, stream, chunk_size)
+            if not lines:
+                break
+            documents = [json_util.loads(line, json_options=_JSON_OPTIONS) for line in lines]
+            await semaphore.acquire()
+            task = asyncio.create_task(write(documents))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            count += len(documents)
+        if tasks:
+            await asyncio.wait(tasks)
+    finally:
+        stream.close()
+    if failures:
+        raise failures[0]
+    return count
+
+async def export_database(client: StorageClient, directory: str, *, names: Optional[Sequence[str]] = None, batch_size: int = 1000) -> Dict[str, int]:
+    """
+    Exporta as coleções de `COLLECTIONS` (ou só as de `names`) para `directory`, uma por arquivo e em paralelo.
+
+    Os arquivos são comprimidos com zstd quando o pacote `zstandard` está instalado, ou com gzip.
+
+    Returns:
+        Dict[str, int]: A quantidade de documentos exportados de cada coleção.
+    """
+    os.makedirs(directory, exist_ok=True)
+    names = list(names or COLLECTIONS)
+    extension = _default_extension()
+    counts = await asyncio.gather(*(
+        export_collection(_collection(client, name), os.path.join(directory, name + extension), batch_size=batch_size)
+        for name in names
+    ))
+    return dict(zip(names, counts))
+
+async def import_database(
+    client: StorageClient,
+    directory: str,
+    *,
+    names: Optional[Sequence[str]] = None,
+    chunk_size: int = 1000,
+    parallelism: int = 4,
+    mode: Literal['upsert', 'insert'] = 'upsert'
+) -> Dict[str, int]:
+    """
+    Importa para o banco de dados os arquivos de `directory` gerados por `export_database`.
+
+    Coleções sem arquivo no diretório são ignoradas. Veja `import_collection` para os argumentos.
+
+    Os saldos restaurados em `users` não passam por `UsersDB`, então depois da importação é preciso
+    registrá-los no ledger com `PearlLedger.record_balances` (o comando `restore` e a linha de comando já fazem isso).
+
+    Returns:
+        Dict[str, int]: A quantidade de documentos importados de cada coleção.
+    """
+    counts: Dict[str, int] = {}
+    for name in names or COLLECTIONS:
+        path = _find_file(directory, name)
+        if path is None:
+            log.warning('Nenhum arquivo de %s em %s, ignorando.', name, directory)
+            continue
+        counts[name] = await import_collection(_collection(client, name), path, chunk_size=chunk_size, parallelism=parallelism, mode=mode)
+    return counts
+
+def _collection(client: StorageClient, name: str) -> StorageCollection:
+    if name not in COLLECTIONS:
+        raise ValueError(f'Coleção desconhecida: {name}. Use uma de: {", ".join(COLLECTIONS)}.')
+    database, collection = COLLECTIONS[name]
+    return client[database][collection]
+
+#---------- Linha de comando ----------#
+
+async def _main(args: argparse.Namespace) -> None:
+    from database.client import create_storage_client
+    from database.ledger import PearlLedger
+    from database.user_db import UsersDB
+
+    client = create_storage_client()
+    try:
+        start = time.perf_counter()
+        if args.command == 'export':
+            counts = await export_database(client, args.directory, names=args.collections, batch_size=args.batch_size)
+        else:
+            counts = await import_database(
+                client,
+                args.directory,
+                names=args.collections,
+                chunk_size=args.batch_size,
+                parallelism=args.parallelism,
+                mode='insert' if args.insert else 'upsert'
+            )
+            if 'users' in counts:
+                await PearlLedger(client, UsersDB(client)).record_balances(batch_size=args.batch_size)
+        elapsed = time.perf_counter() - start
+        for name, count in counts.items():
+            print(f'{name}: {count} documentos')
+        print(f'Concluído em {elapsed:.1f}s.')
+    finally:
+        client.close()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='python -m database.transfer',
+        description='Exporta e importa as coleções do bot em arquivos NDJSON comprimidos.'
+    )
+    parser.add_argument('command', choices=('export', 'import'))
+    parser.add_argument('directory', help='Diretório dos arquivos (ex: backups/2024-01-01).')
+    parser.add_argument('-c', '--collections', nargs='+', choices=list(COLLECTIONS), help='Coleções transferidas (padrão: todas).')
+    parser.add_argument('-b', '--batch-size', type=int, default=1000, help='Documentos por lote de leitura ou escrita.')
+    parser.add_argument('-p', '--parallelism', type=int, default=4, help='Lotes gravados ao mesmo tempo na importação.')
+    parser.add_argument('--insert', action='store_true', help='Importa com insert_many, mantendo os documentos existentes.')
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_main(parser.parse_args()))
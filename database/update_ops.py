@@ -0,0 +1,103 @@
+from copy import deepcopy
+from typing import Any, Dict, List, Tuple
+
+__all__ = ('apply_update',)
+
+_MISSING = object()
+
+def _split(document: Dict[str, Any], path: str, *, create: bool) -> Tuple[Any, str]:
+    """
+    Percorre um caminho com pontos (ex: `profile.skins`) e retorna o dicionário pai e a última chave.
+
+    Args:
+        document (`Dict[str, Any]`): O documento a ser percorrido.
+        path (`str`): O caminho com pontos.
+        create (`bool`): Se `True`, cria os dicionários intermediários que não existirem.
+
+    Returns:
+        Tuple[Any, str]: O dicionário pai (ou `None` se não existir) e a última chave do caminho.
+    """
+    *parents, key = path.split('.')
+    current = document
+    for part in parents:
+        child = current.get(part) if isinstance(current, dict) else None
+        if not isinstance(child, dict):
+            if not create:
+                return None, key
+            child = {}
+            current[part] = child
+        current = child
+    return current, key
+
+def _each(value: Any) -> List[Any]:
+    if isinstance(value, dict) and '$each' in value:
+        return list(value['$each'])
+    return [value]
+
+def apply_update(document: Dict[str, Any], update: Dict[str, Dict[str, Any]], *, is_insert: bool = False) -> Dict[str, Any]:
+    """
+    Aplica os operadores de update do MongoDB em uma cópia do documento, sem acessar o banco de dados.
+
+    Suporta `$set`, `$unset`, `$inc`, `$min`, `$max`, `$rename`, `$addToSet`, `$push`, `$pull` (por igualdade)
+    e `$setOnInsert`.
+
+    Args:
+        document (`Dict[str, Any]`): O documento original (não é alterado).
+        update (`Dict[str, Dict[str, Any]]`): O update a ser aplicado. Ex: `{'$inc': {'pearls': 10}}`.
+        is_insert (`bool`): Indica se o documento está sendo criado (aplica o `$setOnInsert`).
+
+    Returns:
+        Dict[str, Any]: O documento atualizado.
+
+    Raises:
+        ValueError: Se o update usar um operador não suportado.
+    """
+    result = deepcopy(document)
+
+    for operator, fields in update.items():
+        if operator == '$setOnInsert' and not is_insert:
+            continue
+
+        for path, value in fields.items():
+            match operator:
+                case '$set' | '$setOnInsert':
+                    parent, key = _split(result, path, create=True)
+                    parent[key] = deepcopy(value)
+                case '$unset':
+                    parent, key = _split(result, path, create=False)
+                    if parent is not None:
+                        parent.pop(key, None)
+                case '$inc':
+                    parent, key = _split(result, path, create=True)
+                    parent[key] = (parent.get(key) or 0) + value
+                case '$min' | '$max':
+                    parent, key = _split(result, path, create=True)
+                    current = parent.get(key)
+                    if current is None or (value < current if operator == '$min' else value > current):
+                        parent[key] = deepcopy(value)
+                case '$rename':
+                    parent, key = _split(result, path, create=False)
+                    if parent is not None and key in parent:
+                        moved = parent.pop(key)
+                        parent, key = _split(result, value, create=True)
+                        parent[key] = moved
+                case '$addToSet':
+                    parent, key = _split(result, path, create=True)
+                    items = parent.get(key) or []
+                    for item in _each(value):
+                        if item not in items:
+                            items.append(deepcopy(item))
+                    parent[key] = items
+                case '$push':
+                    parent, key = _split(result, path, create=True)
+                    parent[key] = (parent.get(key) or []) + deepcopy(_each(value))
+                case '$pull':
+                    if isinstance(value, dict) and any(k.startswith('$') for k in value):
+                        raise ValueError(f'Condição de $pull não suportada: {value}')
+                    parent, key = _split(result, path, create=False)
+                    if parent is not None and isinstance(parent.get(key, _MISSING), list):
+                        parent[key] = [item for item in parent[key] if item != value]
+                case _:
+                    raise ValueError(f'Operador de update não suportado: {operator}')
+
+    return result
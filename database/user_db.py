@@ -1,31 +1,112 @@
 import discord
-from motor.motor_asyncio import AsyncIOMotorClient
-from typing import Optional, Union, Literal, AsyncGenerator, List
+import logging
+from motor.motor_asyncio import AsyncIOMotorClientSession
+from pymongo import UpdateOne, IndexModel, ReturnDocument, ASCENDING, DESCENDING
+from pymongo.errors import CursorNotFound
+from contextlib import asynccontextmanager
+from copy import deepcopy
+from typing import Optional, Union, Literal, AsyncGenerator, AsyncIterator, Callable, ClassVar, Iterable, List, Mapping, Set, Dict
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-from database.models.user import UserData
+from database.models.user import UserData, Cooldowns
+from database.write_buffer import WriteBehindBuffer
+from database.update_ops import apply_update
+from database.cache import TTLCache
+from database.storage import StorageClient
+
+log = logging.getLogger(__name__)
+
+# Documento padrão de um usuário novo, usado no `$setOnInsert` dos upserts.
+_DEFAULT_DOCUMENT = {key: value for key, value in UserData(id=0).to_dict().items() if key != '_id'}
+
+def with_insert_defaults(update: dict) -> dict:
+    """
+    Adiciona ao update um `$setOnInsert` com os valores padrão de `UserData` que o update não altera.
+
+    Assim, quando um upsert cria o documento, ele já nasce completo, sem precisar de uma leitura antes.
+    Caminhos alterados pelo update (ou pais/filhos deles) ficam de fora para não gerar conflito no MongoDB.
+
+    Args:
+        update (`dict`): O update original.
+
+    Returns:
+        dict: O update com o `$setOnInsert`.
+    """
+    touched = [path for operator, fields in update.items() if operator != '$setOnInsert' for path in fields]
+    defaults = {}
+
+    def walk(document: dict, prefix: str) -> None:
+        for key, value in document.items():
+            path = prefix + key
+            if any(other == path or other.startswith(path + '.') for other in touched):
+                if isinstance(value, dict):
+                    walk(value, path + '.') # Só parte do subdocumento é alterada, os outros campos ainda recebem o padrão
+                continue
+            if any(path.startswith(other + '.') for other in touched):
+                continue
+            defaults[path] = value
+
+    walk(_DEFAULT_DOCUMENT, '')
+    if not defaults:
+        return update
+    return {**update, '$setOnInsert': {**defaults, **update.get('$setOnInsert', {})}}
 
 class UsersDB:
-    def __init__(self, client: AsyncIOMotorClient):
+    """
+    Gerencia os dados dos usuários no banco de dados.
+
+    Args:
+        client (`StorageClient`): O cliente do banco de dados (MongoDB ou SQLite).
+        write_behind (`bool`): Se `True`, os updates são acumulados em memória e enviados em lote.
+        flush_interval (`float`): Intervalo, em segundos, entre cada envio do modo write-behind.
+        flush_size (`int`): Quantidade de operações pendentes que força um envio do modo write-behind.
+        cache_size (`int`): Quantidade máxima de usuários no cache de leitura (`0` desativa o cache).
+        cache_ttl (`float`): Tempo, em segundos, que um usuário permanece no cache de leitura.
+    """
+    INDEXES: ClassVar[List[IndexModel]] = [
+        # Usuários banidos (índice parcial: só os documentos com banimento ocupam espaço)
+        IndexModel([('banStatus', ASCENDING)], name='banned', partialFilterExpression={'banStatus': {'$type': 'object'}}),
+        # Rankings
+        IndexModel([('pearls', DESCENDING), ('_id', ASCENDING)], name='ranking_pearls'),
+        IndexModel([('experience', DESCENDING), ('_id', ASCENDING)], name='ranking_experience'),
+        IndexModel([('reputation', DESCENDING), ('_id', ASCENDING)], name='ranking_reputation'),
+        # Expiração dos cooldowns
+        *(
+            IndexModel([(f'cooldowns.{cooldown}', ASCENDING)], name=f'cooldowns_{cooldown}', partialFilterExpression={f'cooldowns.{cooldown}': {'$type': 'date'}})
+            for cooldown in ('daily', 'reputation', 'married', 'premiumExpiration')
+        ),
+    ]
+
+    def __init__(self, client: StorageClient, *, write_behind: bool = False, flush_interval: float = 5.0, flush_size: int = 500,
+                 cache_size: int = 10_000, cache_ttl: float = 300.0):
+        self.client = client
         self.collection = client['global']['users']
+        self.cache: TTLCache[int, UserData] = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self.banned_ids: Set[int] = set()
+        self.listeners: List[Callable[[int, Optional[dict]], None]] = []
+        self.buffer: Optional[WriteBehindBuffer] = None
+        if write_behind:
+            self.buffer = WriteBehindBuffer(self.collection, flush_interval=flush_interval, flush_size=flush_size, prepare=with_insert_defaults)
+
+    async def ensure_indexes(self) -> None:
+        """Cria os índices declarados em `INDEXES`, caso ainda não existam."""
+        await self.collection.create_indexes(self.INDEXES)
 
     async def create_user_account(self, user: Union[discord.Member, discord.User]):
         """
-        Cria uma conta de usuário no banco de dados.
+        Cria uma conta de usuário no banco de dados, caso ela ainda não exista.
 
         Args:
             user (`Union[discord.Member, discord.User]`): O usuário para criar a conta.
         """
-        await self.collection.insert_one(
-            UserData(id=user.id).to_dict()
-        )
+        await self.get_or_create_user(user)
 
     #---------- Get info ----------#
 
     async def get_user(self, user: Union[discord.Member, discord.User]) -> UserData:
         """
-        Obtém os dados de um usuário do banco de dados.
+        Obtém os dados de um usuário, usando o cache de leitura quando possível.
 
         Args:
             user (`Union[discord.Member, discord.User]`): O usuário para obter os dados.
@@ -33,10 +114,116 @@ class UsersDB:
         Returns:
             UserData: Os dados do usuário.
         """
+        user_data = self.cache.get(user.id)
+        if user_data is not None:
+            return user_data
+
+        if self.buffer is not None and self.buffer.has_pending(user.id):
+            await self.buffer.flush()
+
+        token = self.cache.reserve(user.id)
         data: Optional[dict] = await self.collection.find_one({'_id': user.id})
-        if data is None:
-            return UserData(id=user.id)
-        return UserData(**data)
+        user_data = UserData(id=user.id) if data is None else UserData.from_document(data)
+        self.cache.set(user.id, user_data, token)
+        return user_data
+
+    async def get_users(self, users: Iterable[Union[discord.Member, discord.User, int]], *, projection: Optional[dict] = None) -> Dict[int, UserData]:
+        """
+        Obtém os dados de vários usuários com uma única consulta (`$in`), usando o cache de leitura.
+
+        Usuários sem documento recebem os valores padrão, como em `get_user`.
+
+        Args:
+            users (`Iterable[Union[discord.Member, discord.User, int]]`): Os usuários (ou seus IDs).
+            projection (`Optional[dict]`): Campos a serem lidos do banco de dados. Os demais campos ficam com
+                o valor padrão, e o resultado não é guardado no cache.
+
+        Returns:
+            Dict[int, UserData]: Os dados de cada usuário, pelo ID, na ordem recebida.
+        """
+        user_ids = list(dict.fromkeys(user if isinstance(user, int) else user.id for user in users))
+        result: Dict[int, Optional[UserData]] = {user_id: self.cache.get(user_id) for user_id in user_ids}
+        missing = [user_id for user_id, user_data in result.items() if user_data is None]
+        if not missing:
+            return result
+
+        if self.buffer is not None and any(self.buffer.has_pending(user_id) for user_id in missing):
+            await self.buffer.flush()
+
+        tokens = {user_id: self.cache.reserve(user_id) for user_id in missing} if projection is None else {}
+        if projection is not None:
+            projection = {**projection, '_id': 1}
+
+        async for data in self.collection.find({'_id': {'$in': missing}}, projection):
+            result[data['_id']] = UserData.from_document(data)
+
+        for user_id in missing:
+            if result[user_id] is None:
+                result[user_id] = UserData(id=user_id)
+            if projection is None:
+                self.cache.set(user_id, result[user_id], tokens[user_id])
+        return result
+
+    async def get_or_create_user(self, user: Union[discord.Member, discord.User]) -> UserData:
+        """
+        Obtém os dados de um usuário, criando o documento com os valores padrão se ele não existir.
+
+        Resolve em uma única chamada (`find_one_and_update` com `$setOnInsert` e upsert, retornando o documento
+        anterior para saber se ele foi criado).
+
+        Args:
+            user (`Union[discord.Member, discord.User]`): O usuário para obter os dados.
+
+        Returns:
+            UserData: Os dados do usuário.
+        """
+        if self.buffer is not None and self.buffer.has_pending(user.id):
+            await self.buffer.flush()
+
+        token = self.cache.reserve(user.id)
+        data = await self.collection.find_one_and_update(
+            {'_id': user.id},
+            {'$setOnInsert': _DEFAULT_DOCUMENT},
+            upsert=True,
+            return_document=ReturnDocument.BEFORE
+        )
+        created = data is None
+        if created:
+            data = {'_id': user.id, **deepcopy(_DEFAULT_DOCUMENT)}
+        user_data = UserData.from_document(data)
+        self.cache.set(user.id, user_data, token)
+        if created: # Só avisa os ouvintes quando o documento foi criado, já que nada mudou nos demais casos
+            self._notify(user.id, {'$set': dict(_DEFAULT_DOCUMENT)})
+        return user_data
+
+    def is_banned(self, user: Union[discord.Member, discord.User]) -> bool:
+        """
+        Verifica se um usuário está banido usando o índice de banimentos em memória, sem acessar o banco de dados.
+
+        Args:
+            user (`Union[discord.Member, discord.User]`): O usuário a ser verificado.
+
+        Returns:
+            bool: `True` se o usuário estiver banido.
+        """
+        return user.id in self.banned_ids
+
+    async def load_ban_index(self) -> None:
+        """
+        Carrega o índice de banimentos em memória com os IDs de todos os usuários banidos.
+        """
+        cursor = self.collection.find({'banStatus': {'$type': 'object'}}, {'_id': 1})
+        self.banned_ids = {document['_id'] async for document in cursor}
+        log.debug('Índice de banimentos carregado com %s usuários.', len(self.banned_ids))
+
+    def cache_stats(self) -> dict:
+        """
+        Retorna as estatísticas do cache de leitura dos usuários.
+
+        Returns:
+            dict: Tamanho, limite, acertos, falhas e taxa de acerto do cache.
+        """
+        return self.cache.stats()
     
     #---------- Delete Info ----------#
 
@@ -47,7 +234,12 @@ class UsersDB:
         Args:
             user (`Union[discord.Member, discord.User]`): O usuário a ser excluído.
         """
+        if self.buffer is not None:
+            self.buffer.discard(user.id)
+        self.cache.pop(user.id)
+        self.banned_ids.discard(user.id)
         await self.collection.delete_one({'_id': user.id})
+        self._notify(user.id, None)
     
     #---------- Update info ----------#
     
@@ -59,7 +251,69 @@ class UsersDB:
             user (`Union[discord.Member, discord.User`]): O usuário para atualizar os dados.
             query (`dict`): Os dados a serem atualizados.
         """
-        await self.collection.update_one({'_id': user.id}, query)
+        await self._update(user.id, query)
+
+    async def _update(self, user_id: int, update: dict) -> None:
+        """
+        Aplica um update (operadores do MongoDB) no documento do usuário, criando-o se não existir.
+
+        No modo write-behind o update é apenas acumulado no buffer e enviado no próximo lote.
+
+        Args:
+            user_id (`int`): ID do usuário.
+            update (`dict`): O update a ser aplicado. Ex: `{'$inc': {'pearls': 10}}`.
+        """
+        if self.buffer is not None:
+            self.buffer.add(user_id, update)
+        else:
+            await self.collection.update_one({'_id': user_id}, with_insert_defaults(update), upsert=True)
+        self._applied(user_id, update)
+
+    def _applied(self, user_id: int, update: dict) -> None:
+        """Aplica no cache de leitura um update já enviado (ou acumulado) e avisa os ouvintes."""
+        self.cache.patch(user_id, lambda user_data: UserData.from_document(apply_update(user_data.to_dict(), update)))
+        self._notify(user_id, update)
+
+    def _notify(self, user_id: int, update: Optional[dict]) -> None:
+        """
+        Avisa os ouvintes registrados em `listeners` (ex: o ranking) sobre uma alteração em um usuário.
+
+        Args:
+            user_id (`int`): ID do usuário alterado.
+            update (`Optional[dict]`): O update aplicado, ou `None` se o usuário foi excluído.
+        """
+        for listener in self.listeners:
+            try:
+                listener(user_id, update)
+            except Exception:
+                log.error('Erro ao notificar a alteração do usuário %s.', user_id, exc_info=True)
+
+    async def _bulk_write(self, operations: List[UpdateOne], *, user_ids: List[int], session: Optional[AsyncIOMotorClientSession] = None) -> None:
+        """
+        Envia várias operações de update em uma única ida ao banco de dados, na ordem em que foram passadas.
+
+        Args:
+            operations (`List[UpdateOne]`): As operações a serem aplicadas.
+            user_ids (`List[int]`): IDs dos usuários afetados, que são removidos do cache de leitura.
+            session (`Optional[AsyncIOMotorClientSession]`): Sessão da transação, se houver.
+        """
+        if not operations:
+            return
+        if self.buffer is not None:
+            await self.buffer.flush() # Garante que os updates acumulados sejam aplicados antes
+        await self.collection.bulk_write(operations, ordered=True, session=session)
+        for user_id in user_ids:
+            self.cache.pop(user_id)
+
+    async def flush(self) -> None:
+        """Envia os updates pendentes do modo write-behind, se estiver ativo."""
+        if self.buffer is not None:
+            await self.buffer.flush()
+
+    async def close(self) -> None:
+        """Encerra o modo write-behind, enviando os updates pendentes."""
+        if self.buffer is not None:
+            await self.buffer.close()
 
     async def update_ban(self, user: Union[discord.Member, discord.User], banned: bool, banned_by: Optional[int] = None, reason: Optional[str] = None) -> None:
         """
@@ -71,18 +325,20 @@ class UsersDB:
             banned_by (`Optional[int]`): ID do usuário que realizou o banimento.
             reason (`Optional[str]`): Motivo do banimento.
         """
-        user_data = await self.get_user(user)
-        user_dict = user_data.to_dict()
         if banned:
-            user_dict['banStatus'] = {
+            ban_status = {
                 'bannedBy': banned_by,
-                'bannedAt': None if not banned else datetime.now(tz=ZoneInfo('America/Sao_Paulo')).isoformat(),
+                'bannedAt': datetime.now(tz=ZoneInfo('America/Sao_Paulo')).isoformat(),
                 'reason': reason
             }
         else:
-            user_dict['banStatus'] = None
+            ban_status = None
 
-        await self.update_user(user, query={'$set': user_dict})
+        await self._update(user.id, {'$set': {'banStatus': ban_status}})
+        if banned:
+            self.banned_ids.add(user.id)
+        else:
+            self.banned_ids.discard(user.id)
 
     async def update_skin(self, user: Union[discord.Member, discord.User], action: Literal['add', 'remove'], skin: str) -> None:
         """
@@ -93,22 +349,14 @@ class UsersDB:
             acction (`Literal['add', 'remove']`): A ação a ser realizada.
             skin (`str`): A nova skin.
         """
-        
-        user_data = await self.get_user(user)
-        user_dict = user_data.to_dict()
-
         match action:
             case 'add':
-                if skin not in user_dict['profile']['skins']: #Checa se a skin não está na lista de skins do usuário
-                    user_dict['profile']['skins'].append(skin) #Adiciona a skin na lista de skins do usuário
+                await self._update(user.id, {'$addToSet': {'profile.skins': {'$each': ['default', skin]}}}) #Adiciona a skin (e a padrão) se ainda não estiverem na lista
             case 'remove':
-                if skin in user_dict['profile']['skins']: #Checa se a skin está na lista de skins do usuário
-                    user_dict['profile']['skins'].remove(skin) #Remove a skin da lista de skins do usuário
-                    if user_dict['profile']['skin_now'] == skin: #Checa se a skin atual é a mesma que foi removida
-                        user_dict['profile']['skin_now'] = 'default' #Se for, muda a skin atual para a padrão
-
-
-        await self.update_user(user, query={'$set': user_dict})
+                await self._bulk_write([
+                    UpdateOne({'_id': user.id}, {'$pull': {'profile.skins': skin}}), #Remove a skin da lista de skins do usuário
+                    UpdateOne({'_id': user.id, 'profile.skinNow': skin}, {'$set': {'profile.skinNow': 'default'}}) #Se a skin removida era a atual, volta para a padrão
+                ], user_ids=[user.id])
 
     async def update_about_me(self, user: Union[discord.Member, discord.User], about_me: str) -> None:
         """
@@ -118,13 +366,7 @@ class UsersDB:
             user (`Union[discord.Member, discord.User]`): O usuário para atualizar a descrição pessoal.
             about_me (`str`): A nova descrição pessoal.
         """
-
-        user_data = await self.get_user(user)
-        user_dict = user_data.to_dict()
-
-        user_dict['profile']['aboutMe'] = about_me
-
-        await self.update_user(user, query={'$set': user_dict})
+        await self._update(user.id, {'$set': {'profile.aboutMe': about_me}})
 
     async def update_pearls(self, user: Union[discord.Member, discord.User], action: Literal['add', 'remove', 'set'], pearls: int) -> None:
         """
@@ -135,19 +377,13 @@ class UsersDB:
             action (`Literal['add', 'remove', 'set']`): A ação a ser realizada.
             pearls (`int`): A nova quantidade de perólas.
         """
-
-        user_data = await self.get_user(user)
-        user_dict = user_data.to_dict()
-
         match action:
             case 'add':
-                user_dict['pearls'] += pearls
+                await self.increment(user, pearls=pearls)
             case 'remove':
-                user_dict['pearls'] -= pearls
+                await self.increment(user, pearls=-pearls)
             case 'set':
-                user_dict['pearls'] = pearls
-
-        await self.update_user(user, query={'$set': user_dict})
+                await self._update(user.id, {'$set': {'pearls': pearls}})
 
     async def update_experience(self, user: Union[discord.Member, discord.User], action: Literal['add', 'remove'], experience: float) -> None:
         """
@@ -158,17 +394,11 @@ class UsersDB:
             action (`Literal['add', 'remove']`): A ação a ser realizada.
             experience (`float`): A nova experiência.
         """
-
-        user_data = await self.get_user(user)
-        user_dict = user_data.to_dict()
-
         match action:
             case 'add':
-                user_dict['experience'] += experience
+                await self.increment(user, experience=experience)
             case 'remove':
-                user_dict['experience'] -= experience
-
-        await self.update_user(user, query={'$set': user_dict})
+                await self.increment(user, experience=-experience)
 
     async def update_reputation(self, user: Union[discord.Member, discord.User], action: Literal['add', 'remove'], reputation: int) -> None:
         """
@@ -179,17 +409,64 @@ class UsersDB:
             action (`Literal['add', 'remove']`): A ação a ser realizada.
             reputation (`int`): A nova reputação.
         """
-
-        user_data = await self.get_user(user)
-        user_dict = user_data.to_dict()
-
         match action:
             case 'add':
-                user_dict['reputation'] += reputation
+                await self.increment(user, reputation=reputation)
             case 'remove':
-                user_dict['reputation'] -= reputation
+                await self.increment(user, reputation=-reputation)
+
+    async def increment(self, user: Union[discord.Member, discord.User], **fields: Union[int, float]) -> None:
+        """
+        Incrementa campos numéricos de um usuário com um único `$inc` no banco de dados.
+
+        O incremento é feito pelo próprio MongoDB, então comandos simultâneos não perdem atualizações.
+        Caso o usuário ainda não tenha documento, ele é criado (upsert).
 
-        await self.update_user(user, query={'$set': user_dict})
+        Args:
+            user (`Union[discord.Member, discord.User]`): O usuário para atualizar.
+            **fields (`Union[int, float]`): Os campos e os valores a serem somados (use valores negativos para subtrair).
+                Ex: `increment(user, pearls=10, experience=2.5)`.
+
+        Raises:
+            ValueError: Se nenhum campo for fornecido ou se algum campo não existir em `UserData`.
+        """
+        if not fields:
+            raise ValueError('Nenhum campo fornecido para incrementar.')
+
+        await self._update(user.id, {'$inc': {UserData.field_alias(name): value for name, value in fields.items()}})
+
+    async def settle_rewards(self, rewards: Mapping[int, Mapping[str, Union[int, float]]]) -> None:
+        """
+        Aplica as recompensas de vários usuários (ex: no fim de uma partida) em uma única ida ao banco de dados.
+
+        Cada usuário recebe um `$inc`, e todos são enviados juntos em um `bulk_write` não ordenado (ou
+        acumulados no buffer, no modo write-behind). Usuários sem documento são criados.
+
+        Args:
+            rewards (`Mapping[int, Mapping[str, Union[int, float]]]`): Os campos a serem somados por ID do usuário.
+                Ex: `{user_id: {'pearls': 10, 'experience': 5.0}}`.
+
+        Raises:
+            ValueError: Se algum campo não existir em `UserData`.
+        """
+        updates = {}
+        for user_id, fields in rewards.items():
+            increments = {UserData.field_alias(name): value for name, value in fields.items() if value}
+            if increments:
+                updates[user_id] = {'$inc': increments}
+        if not updates:
+            return
+
+        if self.buffer is not None:
+            for user_id, update in updates.items():
+                self.buffer.add(user_id, update)
+        else:
+            await self.collection.bulk_write(
+                [UpdateOne({'_id': user_id}, with_insert_defaults(update), upsert=True) for user_id, update in updates.items()],
+                ordered=False
+            )
+        for user_id, update in updates.items():
+            self._applied(user_id, update)
 
     async def update_cai_uuid(self, user: Union[discord.Member, discord.User], cai_uuid: str) -> None:
         """
@@ -199,20 +476,19 @@ class UsersDB:
             user (`Union[discord.Member, discord.User]`): O usuário para atualizar o cai UUID.
             cai_uuid (`str`): O novo UUID.
         """
-
-        user_data = await self.get_user(user)
-        user_dict = user_data.to_dict()
-
-        user_dict['caiUUID'] = cai_uuid
-
-        await self.update_user(user, query={'$set': user_dict})
+        await self._update(user.id, {'$set': {'caiUUID': cai_uuid}})
 
     async def update_married(self,
                     user: Union[discord.Member, discord.User],
                     married_with: Union[discord.Member, discord.User],
                     married: bool, division_of_assets: Optional[bool] = None) -> None:
         """
-        Atualiza o status de casamento de um usuário no banco de dados.
+        Atualiza o status de casamento dos dois usuários no banco de dados.
+
+        As pérolas dos dois são lidas em uma única consulta e os dois documentos são atualizados em um único
+        `bulk_write`, dentro de uma transação quando o servidor suporta (replica set ou cluster). No divórcio
+        de um casamento com divisão de bens, a partilha das pérolas (`$inc` em cada cônjuge) vai no mesmo
+        `bulk_write` que desfaz o casamento.
 
         Args:
             user (`Union[discord.Member, discord.User]`): O usuário para atualizar as informações de casamento. 
@@ -220,35 +496,67 @@ class UsersDB:
             married (`bool`): Indica se o usuário está casado.
             division_of_assets (`Optional[bool]`): Indica se há divisão de bens no casamento.
         """
-        user_data = await self.get_user(user)
-        user_dict = user_data.to_dict()
-
-        married_with_data = await self.get_user(married_with)
-        married_with_dict = married_with_data.to_dict()
-
-        if married:
-            user_dict['marriedStatus']['marriedWith'] = married_with.id
-            user_dict['marriedStatus']['since'] = datetime.now(tz=ZoneInfo('America/Sao_Paulo'))
-            user_dict['marriedStatus']['divisionOfAssets'] = division_of_assets
-
-            married_with_dict['marriedStatus']['marriedWith'] = user.id
-            married_with_dict['marriedStatus']['since'] = datetime.now(tz=ZoneInfo('America/Sao_Paulo'))
-            married_with_dict['marriedStatus']['divisionOfAssets'] = division_of_assets
-
-            await self.update_shared_pearls(user, married_with)
-
-        else:
-            user_dict['marriedStatus']['marriedWith'] = None
-            user_dict['marriedStatus']['since'] = None
-            user_dict['marriedStatus']['divisionOfAssets'] = None
+        await self.flush()
+        deltas: Dict[int, int] = {}
+        async with self._transaction() as session:
+            if married:
+                pearls = await self._get_pearls([user.id, married_with.id], session=session)
+                since = datetime.now(tz=ZoneInfo('America/Sao_Paulo'))
+                operations = [
+                    UpdateOne({'_id': spouse.id}, with_insert_defaults({'$set': {'marriedStatus': {
+                        'marriedWith': partner.id,
+                        'since': since,
+                        'divisionOfAssets': bool(division_of_assets),
+                        'sharedPearls': sum(pearls.values())
+                    }}}), upsert=True)
+                    for spouse, partner in ((user, married_with), (married_with, user))
+                ]
+            else:
+                deltas = await self._division_of_assets(user, married_with, session=session)
+                operations = []
+                for spouse in (user, married_with):
+                    update: dict = {'$set': {'marriedStatus': None}}
+                    if deltas.get(spouse.id):
+                        update['$inc'] = {'pearls': deltas[spouse.id]}
+                    operations.append(UpdateOne({'_id': spouse.id}, update))
+
+            await self._bulk_write(operations, user_ids=[user.id, married_with.id], session=session)
+
+        self._drop_cached(user.id, married_with.id)
+        for user_id, delta in deltas.items():
+            self._notify(user_id, {'$inc': {'pearls': delta}})
+
+    async def _division_of_assets(self,
+                    user: Union[discord.Member, discord.User],
+                    married_with: Union[discord.Member, discord.User],
+                    *, session: Optional[AsyncIOMotorClientSession] = None) -> Dict[int, int]:
+        """
+        Calcula a partilha das pérolas no divórcio, se o casamento tinha divisão de bens.
 
-            married_with_dict['marriedStatus']['marriedWith'] = None
-            married_with_dict['marriedStatus']['since'] = married
-            married_with_dict['marriedStatus']['divisionOfAssets'] = None
+        As pérolas dos dois são somadas e divididas ao meio (a pérola que sobrar fica com `user`).
 
-        await self.update_user(user, query={'$set': user_dict})
-        await self.update_user(married_with, query={'$set': married_with_dict})
+        Args:
+            user (`Union[discord.Member, discord.User]`): O usuário que pediu o divórcio.
+            married_with (`Union[discord.Member, discord.User]`): O outro cônjuge.
+            session (`Optional[AsyncIOMotorClientSession]`): Sessão da transação, se houver.
 
+        Returns:
+            Dict[int, int]: O `$inc` de pérolas de cada cônjuge (vazio se não houver partilha).
+        """
+        documents = {
+            document['_id']: document
+            async for document in self.collection.find(
+                {'_id': {'$in': [user.id, married_with.id]}}, {'pearls': 1, 'marriedStatus': 1}, session=session
+            )
+        }
+        status = (documents.get(user.id) or {}).get('marriedStatus') or {}
+        if not status.get('divisionOfAssets') or status.get('marriedWith') != married_with.id:
+            return {}
+
+        pearls = {spouse.id: (documents.get(spouse.id) or {}).get('pearls', 0) for spouse in (user, married_with)}
+        total = sum(pearls.values())
+        shares = {user.id: total - total // 2, married_with.id: total // 2}
+        return {user_id: shares[user_id] - pearls[user_id] for user_id in pearls if shares[user_id] != pearls[user_id]}
 
     async def update_shared_pearls(self, user1: Union[discord.Member, discord.User], user2: Union[discord.Member, discord.User], division: bool = False) -> None:
         """
@@ -259,81 +567,169 @@ class UsersDB:
             user2 (`Union[discord.Member, discord.User]`): O segundo usuário.
             division (`bool`): Indica se a divisão de perólas deve ser realizada.
         """
+        await self.flush()
+        async with self._transaction() as session:
+            pearls = await self._get_pearls([user1.id, user2.id], session=session)
+            total_shared_pearls = sum(pearls.values())
 
-        user1_data = await self.get_user(user1)
-        user1_dict = user1_data.to_dict()
-
-        user2_data = await self.get_user(user2)
-        user2_dict = user2_data.to_dict()
+            operations = []
+            for spouse in (user1, user2):
+                if division:
+                    operations.append(UpdateOne({'_id': spouse.id}, {'$set': {'pearls': total_shared_pearls // 2}}))
+                operations.append(UpdateOne(
+                    {'_id': spouse.id, 'marriedStatus': {'$type': 'object'}}, # Só atualiza quem está casado
+                    {'$set': {'marriedStatus.sharedPearls': total_shared_pearls}}
+                ))
 
-        total_shared_pearls = user1_dict['pearls'] + user2_dict['pearls']
-        division_shared_perals = total_shared_pearls // 2
+            await self._bulk_write(operations, user_ids=[user1.id, user2.id], session=session)
 
+        self._drop_cached(user1.id, user2.id)
         if division:
-            await self.update_pearls(user1, 'set', division_shared_perals)
-            await self.update_pearls(user2, 'set', division_shared_perals)
+            for spouse in (user1, user2):
+                self._notify(spouse.id, {'$set': {'pearls': total_shared_pearls // 2}})
 
-        user1_dict['marriedStatus']['sharedPearls'] = total_shared_pearls
-        user2_dict['marriedStatus']['sharedPearls'] = total_shared_pearls
+    def _drop_cached(self, *user_ids: int) -> None:
+        """
+        Remove os usuários do cache de leitura depois que uma transação termina.
+
+        `_bulk_write` já os remove, mas dentro de uma transação isso acontece antes do commit: uma leitura
+        concorrente nesse intervalo guardaria no cache o documento anterior.
+        """
+        for user_id in user_ids:
+            self.cache.pop(user_id)
+
+    async def _get_pearls(self, user_ids: List[int], *, session: Optional[AsyncIOMotorClientSession] = None) -> Dict[int, int]:
+        """
+        Obtém as pérolas de vários usuários em uma única consulta.
 
-        await self.update_user(user1, query={'$set': user1_dict})
-        await self.update_user(user2, query={'$set': user2_dict})
+        Args:
+            user_ids (`List[int]`): IDs dos usuários.
+            session (`Optional[AsyncIOMotorClientSession]`): Sessão da transação, se houver.
+
+        Returns:
+            Dict[int, int]: As pérolas de cada usuário (`0` para quem não tem documento).
+        """
+        pearls = dict.fromkeys(user_ids, 0)
+        async for document in self.collection.find({'_id': {'$in': user_ids}}, {'pearls': 1}, session=session):
+            pearls[document['_id']] = document.get('pearls', 0)
+        return pearls
+
+    @asynccontextmanager
+    async def _transaction(self) -> AsyncIterator[Optional[AsyncIOMotorClientSession]]:
+        """
+        Abre uma transação quando o servidor suporta (replica set ou cluster).
+
+        Em um servidor standalone, transações não existem e as operações são feitas sem sessão.
+
+        Yields:
+            Optional[AsyncIOMotorClientSession]: A sessão da transação, ou `None` se não houver suporte.
+        """
+        if self.client.topology_description.topology_type_name not in ('ReplicaSetWithPrimary', 'Sharded'):
+            yield None
+            return
+
+        async with await self.client.start_session() as session:
+            async with session.start_transaction():
+                yield session
 
     async def update_cooldowns(self, user: Union[discord.Member, discord.User],
                         cooldown: Literal['daily', 'reputation', 'married', 'premium_expiration'],
-                        datetime_now: datetime) -> None:
+                        expires_at: Optional[datetime]) -> None:
         """
         Atualiza os cooldowns de um usuário no banco de dados.
 
+        Cada cooldown guarda o momento em que ele termina (o mesmo significado usado por `CooldownEngine`,
+        que é avisado da alteração); para iniciar um cooldown a partir de uma duração, use `CooldownEngine.set`.
+
         Args:
             user (`Union[discord.Member, discord.User]`): O usuário para atualizar os cooldowns.
             cooldown (`Literal['daily', 'reputation', 'married', 'premium_expiration']`): O cooldown a ser atualizado.
-            timestamp (`datetime`): O novo timestamp do cooldown.
+            expires_at (`Optional[datetime]`): O momento em que o cooldown termina, ou `None` para encerrá-lo.
         """
-        user_data = await self.get_user(user)
-        user_dict = user_data.to_dict()
-        user_dict['cooldowns'][cooldown] = datetime_now
-        await self.update_user(user, query={'$set': user_dict})
+        await self._update(user.id, {'$set': {f'cooldowns.{Cooldowns.field_alias(cooldown)}': expires_at}})
 
     #---------- Get all infos ----------#
 
-    async def get_all_users(self, size: int = 25) -> AsyncGenerator[List[UserData]]:
+    async def get_all_users(self, size: int = 25, *, batch_size: int = 500, projection: Optional[dict] = None) -> AsyncGenerator[List[Union[UserData, dict]], None]:
         """
-        Obtém todos os usuários do banco de dados.
+        Obtém todos os usuários do banco de dados, em páginas.
+
+        Usa um único cursor ordenado por `_id` e, se ele expirar no meio da leitura, continua a partir do
+        último `_id` lido (paginação por intervalo de `_id`, sem `skip`). O custo total é linear e a memória
+        fica limitada ao tamanho do lote.
 
         Args:
             size (`int`): O número de usuários a serem retornados por página.
+            batch_size (`int`): O número de documentos buscados por ida ao banco de dados.
+            projection (`Optional[dict]`): Campos a serem retornados. Se informado, as páginas contêm os
+                documentos crus (`dict`) em vez de `UserData`.
 
         Returns:
-            AsyncGenerator[UserData]: Gerador de usuários.
+            AsyncGenerator[List[Union[UserData, dict]]]: Gerador de páginas de usuários.
         """
-
-        skip = 0
-
-        while True:
-            cursor = self.collection.find().skip(skip).limit(size)
-            page = await cursor.to_list(length=size)
-            if not page:
-                break
-            yield [UserData(**user) for user in page]
+        async for page in self._iter_pages({}, size=size, batch_size=batch_size, projection=projection):
+            yield page
     
-    async def get_all_users_banned(self, size: int = 25) -> AsyncGenerator[List[UserData]]:
+    async def get_all_users_banned(self, size: int = 25, *, batch_size: int = 500, projection: Optional[dict] = None) -> AsyncGenerator[List[Union[UserData, dict]], None]:
         """
-        Obtém todos os usuários banidos do banco de dados.
+        Obtém todos os usuários banidos do banco de dados, em páginas.
 
         Args:
             size (`int`): O número de usuários a serem retornados por página.
+            batch_size (`int`): O número de documentos buscados por ida ao banco de dados.
+            projection (`Optional[dict]`): Campos a serem retornados. Se informado, as páginas contêm os
+                documentos crus (`dict`) em vez de `UserData`.
 
         Returns:
-            AsyncGenerator[UserData]: Gerador de usuários banidos.
+            AsyncGenerator[List[Union[UserData, dict]]]: Gerador de páginas de usuários banidos.
+        """
+        async for page in self._iter_pages({'banStatus': {'$type': 'object'}}, size=size, batch_size=batch_size, projection=projection):
+            yield page
+
+    async def count_users(self, *, banned: bool = False) -> int:
+        """
+        Conta os usuários do banco de dados.
+
+        Args:
+            banned (`bool`): Se `True`, conta apenas os usuários banidos (a partir do índice de banimentos em memória).
+
+        Returns:
+            int: A quantidade de usuários.
+        """
+        if banned:
+            return len(self.banned_ids)
+        await self.flush()
+        return await self.collection.estimated_document_count()
+
+    async def _iter_pages(self, query: dict, *, size: int, batch_size: int, projection: Optional[dict]) -> AsyncGenerator[List[Union[UserData, dict]], None]:
+        """
+        Percorre os documentos que atendem `query` em ordem de `_id`, agrupados em páginas de `size`.
+
+        Args:
+            query (`dict`): O filtro da busca.
+            size (`int`): O número de documentos por página.
+            batch_size (`int`): O número de documentos buscados por ida ao banco de dados.
+            projection (`Optional[dict]`): Campos a serem retornados.
         """
-        skip = 0
+        await self.flush()
+        if projection is not None:
+            projection = {**projection, '_id': 1} # O _id é necessário para continuar a paginação
 
+        page: List[dict] = []
+        last_id = None
         while True:
-            cursor = self.collection.find({'banStatus': {'$ne': None}}).skip(skip).limit(size)
-            page = await cursor.to_list(length=size)
-            if not page:
+            current_query = query if last_id is None else {**query, '_id': {'$gt': last_id}}
+            cursor = self.collection.find(current_query, projection).sort('_id', 1).batch_size(batch_size)
+            try:
+                async for document in cursor:
+                    page.append(document)
+                    last_id = document['_id']
+                    if len(page) >= size:
+                        yield page if projection is not None else [UserData.from_document(user) for user in page]
+                        page = []
                 break
+            except CursorNotFound:
+                log.warning('Cursor de usuários expirou, continuando a partir do _id %s.', last_id)
 
-            yield [UserData(**user) for user in page]
-            skip += size
\ No newline at end of file
+        if page:
+            yield page if projection is not None else [UserData.from_document(user) for user in page]
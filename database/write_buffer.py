@@ -0,0 +1,230 @@
+import asyncio
+import logging
+from copy import deepcopy
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from database.storage import StorageCollection
+
+log = logging.getLogger(__name__)
+
+_MERGEABLE_OPERATORS = {'$inc', '$set'}
+
+def _is_strict_prefix(prefix: str, path: str) -> bool:
+    """Verifica se `prefix` é um caminho pai de `path` (ex: `profile` de `profile.skins`)."""
+    return path.startswith(prefix + '.')
+
+def _merge_update(pending: dict, update: dict) -> bool:
+    """
+    Tenta juntar `update` dentro de `pending` (ambos compostos apenas por `$inc`/`$set`).
+
+    Incrementos no mesmo campo são somados e `$set` mantém o último valor. Um `$set` sobrescreve
+    incrementos pendentes no mesmo campo, e um `$inc` sobre um campo com `$set` pendente soma no valor definido.
+
+    Args:
+        pending (`dict`): O update pendente, alterado no lugar se a junção for possível.
+        update (`dict`): O novo update.
+
+    Returns:
+        bool: `True` se o update foi juntado, `False` se ele precisa de uma operação separada.
+    """
+    merged = deepcopy(pending)
+    merged.setdefault('$inc', {})
+    merged.setdefault('$set', {})
+
+    for path, value in update.get('$set', {}).items():
+        existing = list(merged['$inc']) + list(merged['$set'])
+        if any(_is_strict_prefix(other, path) for other in existing):
+            return False
+        for other in existing:
+            if other == path or _is_strict_prefix(path, other):
+                merged['$inc'].pop(other, None)
+                merged['$set'].pop(other, None)
+        merged['$set'][path] = value
+
+    for path, value in update.get('$inc', {}).items():
+        if path in merged['$set']:
+            if not isinstance(merged['$set'][path], (int, float)):
+                return False
+            merged['$set'][path] += value
+            continue
+        existing = list(merged['$inc']) + list(merged['$set'])
+        if any(_is_strict_prefix(other, path) or _is_strict_prefix(path, other) for other in existing):
+            return False
+        merged['$inc'][path] = merged['$inc'].get(path, 0) + value
+
+    pending.clear()
+    pending.update({operator: fields for operator, fields in merged.items() if fields})
+    return True
+
+class PeriodicFlush:
+    """
+    Agenda os envios de um buffer em memória: um periódico, a cada `interval` segundos, e envios
+    antecipados (um por vez) quando o buffer enche.
+
+    As tarefas criadas ficam guardadas até terminarem, então não são coletadas no meio do envio.
+
+    Args:
+        flush (`Callable[[], Awaitable[None]]`): A função que envia o buffer.
+        interval (`float`): Intervalo, em segundos, entre cada envio periódico.
+        is_full (`Callable[[], bool]`): Indica se o buffer ainda está cheio ao fim de um envio antecipado.
+        tick (`Optional[Callable[[], Awaitable[None]]]`): Executado a cada ciclo no lugar de `flush`
+            (ex: para também fazer uma manutenção periódica).
+        name (`str`): Nome usado nos logs.
+    """
+    def __init__(self, flush: Callable[[], Awaitable[None]], *, interval: float, is_full: Callable[[], bool],
+                 tick: Optional[Callable[[], Awaitable[None]]] = None, name: str = 'Write-behind'):
+        self.flush = flush
+        self.interval = interval
+        self.is_full = is_full
+        self.tick = tick or flush
+        self.name = name
+        self._task: Optional[asyncio.Task] = None
+        self._flushes: Set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        """Inicia a tarefa de envio periódico, caso ainda não esteja rodando."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def flush_soon(self) -> None:
+        """Agenda um envio imediato, caso nenhum esteja em andamento."""
+        if self._flushes:
+            return
+        task = asyncio.create_task(self.flush())
+        self._flushes.add(task)
+        task.add_done_callback(self._flush_done)
+
+    async def close(self) -> None:
+        """Interrompe o envio periódico e espera os envios antecipados em andamento."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._flushes:
+            await asyncio.wait(self._flushes)
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        self._flushes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            log.error('%s: falha no envio antecipado.', self.name, exc_info=task.exception())
+        elif self.is_full():
+            self.flush_soon() # Chegaram mais itens enquanto o envio rodava
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.tick()
+            except Exception:
+                log.error('%s: falha no envio periódico.', self.name, exc_info=True)
+
+class WriteBehindBuffer:
+    """
+    Acumula updates por documento em memória e os envia em lote com um único `bulk_write`.
+
+    Updates compostos apenas por `$inc`/`$set` são juntados com o update pendente do mesmo documento;
+    qualquer outro operador vira uma operação separada, preservando a ordem em que foram feitos.
+
+    Args:
+        collection (`StorageCollection`): A coleção onde os updates serão aplicados.
+        flush_interval (`float`): Intervalo, em segundos, entre cada envio automático.
+        flush_size (`int`): Quantidade de operações pendentes que força um envio imediato.
+        prepare (`Optional[Callable[[dict], dict]]`): Função aplicada em cada update no momento do envio
+            (ex: para adicionar um `$setOnInsert`).
+    """
+    def __init__(self, collection: StorageCollection, *, flush_interval: float = 5.0, flush_size: int = 500,
+                 prepare: Optional[Callable[[dict], dict]] = None):
+        self.collection = collection
+        self.prepare = prepare
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._pending: Dict[int, List[dict]] = {}
+        self._size: int = 0
+        self._in_flight: Set[int] = set() # Documentos do lote sendo enviado agora
+        self._lock = asyncio.Lock()
+        self._scheduler = PeriodicFlush(self.flush, interval=flush_interval, is_full=lambda: self._size >= self.flush_size)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def has_pending(self, document_id: int) -> bool:
+        """Verifica se há updates pendentes para o documento, inclusive no lote que está sendo enviado."""
+        return document_id in self._pending or document_id in self._in_flight
+
+    def add(self, document_id: int, update: dict) -> None:
+        """
+        Adiciona um update ao buffer.
+
+        Args:
+            document_id (`int`): O `_id` do documento.
+            update (`dict`): O update (operadores do MongoDB) a ser aplicado.
+        """
+        self._scheduler.start()
+        updates = self._pending.setdefault(document_id, [])
+        if (
+            updates
+            and set(update) <= _MERGEABLE_OPERATORS
+            and set(updates[-1]) <= _MERGEABLE_OPERATORS
+            and _merge_update(updates[-1], update)
+        ):
+            return
+
+        updates.append(deepcopy(update))
+        self._size += 1
+        if self._size >= self.flush_size:
+            self._scheduler.flush_soon()
+
+    def discard(self, document_id: int) -> None:
+        """Descarta os updates pendentes de um documento (ex: quando ele é excluído)."""
+        self._size -= len(self._pending.pop(document_id, []))
+
+    async def flush(self) -> None:
+        """Envia todos os updates pendentes em um único `bulk_write`."""
+        async with self._lock:
+            if not self._pending:
+                return
+
+            pending, self._pending = self._pending, {}
+            self._size = 0
+            self._in_flight = set(pending)
+            operations = [
+                (document_id, update)
+                for document_id, updates in pending.items()
+                for update in updates
+            ]
+            try:
+                await self.collection.bulk_write(
+                    [
+                        UpdateOne({'_id': document_id}, self.prepare(update) if self.prepare else update, upsert=True)
+                        for document_id, update in operations
+                    ],
+                    ordered=True
+                )
+                log.debug('Write-behind: %s operações enviadas para %s.', len(operations), self.collection.name)
+            except BulkWriteError as e:
+                # Em um bulk ordenado, tudo antes do erro foi aplicado e tudo depois dele não foi.
+                failed = e.details['writeErrors'][0]['index']
+                log.error('Write-behind: operação %s falhou e foi descartada: %s', operations[failed], e.details['writeErrors'][0])
+                self._requeue(operations[failed + 1:])
+            except Exception:
+                log.error('Write-behind: falha ao enviar %s operações, tentando novamente no próximo ciclo.', len(operations), exc_info=True)
+                self._requeue(operations)
+            finally:
+                self._in_flight = set()
+
+    async def close(self) -> None:
+        """Interrompe o envio automático e envia o que ainda estiver pendente."""
+        await self._scheduler.close()
+        await self.flush()
+
+    def _requeue(self, operations: List[tuple]) -> None:
+        """Devolve operações não aplicadas para o início do buffer, antes das mais recentes."""
+        requeued: Dict[int, List[dict]] = {}
+        for document_id, update in operations:
+            requeued.setdefault(document_id, []).append(update)
+        for document_id, updates in self._pending.items():
+            requeued.setdefault(document_id, []).extend(updates)
+        self._pending = requeued
+        self._size = sum(len(updates) for updates in requeued.values())
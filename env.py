@@ -12,6 +12,9 @@ log = logging.getLogger(__name__)
 def _str_to_list_of_ints(value: str) -> List[int]:
     return [int(v.strip()) for v in value.split(',') if v.strip().isdigit()]
 
+def _str_to_bool(value: str) -> bool:
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
 def _validate_required(var_name: str, validator=lambda x: bool(x)) -> str:
     value = os.getenv(var_name)
     if not value or not validator(value):
@@ -28,16 +31,29 @@ class Env:
     # Obrigatórios
     TOKEN: str
     OWNER_IDS: List[int]
-    MONGO: str
+    MONGO: str # Obrigatório apenas com DATABASE_BACKEND='mongo'
     INTERNAL_API: str
 
     # Opcionais (com valores padrão)
     PREFIX: str = ',,'
     GITHUB_TOKEN: Optional[str] = None
     GITHUB_USERNAME: Optional[str] = None
+    DATABASE_BACKEND: str = 'mongo'
+    SQLITE_PATH: str = 'data/nayul.db'
+    USERS_WRITE_BEHIND: bool = False
+    USERS_FLUSH_INTERVAL: float = 5.0
+    USERS_FLUSH_SIZE: int = 500
+    USERS_CACHE_SIZE: int = 10_000
+    USERS_CACHE_TTL: float = 300.0
+    WORDS_COMPACT: bool = False
 
     @classmethod
     def load(cls) -> 'Env':
+        backend = os.getenv('DATABASE_BACKEND', 'mongo').strip().lower()
+        if backend not in ('mongo', 'sqlite'):
+            log.critical(f'[ENV] Erro: DATABASE_BACKEND deve ser "mongo" ou "sqlite", não "{backend}".')
+            sys.exit(1)
+
         return cls(
             TOKEN=_validate_required('TOKEN'),
             GITHUB_TOKEN=os.getenv('GITHUB_TOKEN', None),
@@ -45,7 +61,15 @@ class Env:
             OWNER_IDS=_str_to_list_of_ints(_validate_required('OWNER_IDS')),
             INTERNAL_API=_validate_required('INTERNAL_API'),
             PREFIX=os.getenv('PREFIX', ',,'),
-            MONGO=_validate_required('MONGO')
+            MONGO=_validate_required('MONGO') if backend == 'mongo' else os.getenv('MONGO', ''),
+            DATABASE_BACKEND=backend,
+            SQLITE_PATH=os.getenv('SQLITE_PATH', 'data/nayul.db'),
+            USERS_WRITE_BEHIND=_str_to_bool(os.getenv('USERS_WRITE_BEHIND', 'false')),
+            USERS_FLUSH_INTERVAL=float(os.getenv('USERS_FLUSH_INTERVAL', 5.0)),
+            USERS_FLUSH_SIZE=int(os.getenv('USERS_FLUSH_SIZE', 500)),
+            USERS_CACHE_SIZE=int(os.getenv('USERS_CACHE_SIZE', 10_000)),
+            USERS_CACHE_TTL=float(os.getenv('USERS_CACHE_TTL', 300.0)),
+            WORDS_COMPACT=_str_to_bool(os.getenv('WORDS_COMPACT', 'false'))
         )
 
 ENV = Env.load()
\ No newline at end of file
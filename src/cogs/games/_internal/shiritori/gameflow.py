@@ -4,7 +4,6 @@ import time
 import asyncio
 import random
 import logging
-from unidecode import unidecode
 from datetime import datetime
 from typing import TYPE_CHECKING
 
@@ -12,9 +11,11 @@ if TYPE_CHECKING:
     from .components import MainView
 
 from src import NayulCore
+from src.core.word_manager import normalize_word
 from src.utils.emojis import Emoji
 from .utils import (
     validate_word_shiritori,
+    get_hint,
     get_time_limit,
     get_phase_message,
     update_player_stats,
@@ -94,7 +95,7 @@ async def start_game_shiritori(view: 'MainView', inter: discord.Interaction[Nayu
                         timeout=remaining_time,
                         check=lambda m: m.author == player and m.channel == inter.channel
                     )
-                    word = unidecode(message.content.lower().strip())
+                    word = normalize_word(message.content)
 
                     # Valida se a palavra começa com as duas últimas letras da anterior
                     if previous_word and not word.startswith(previous_word[-2:]):
@@ -137,6 +138,9 @@ async def start_game_shiritori(view: 'MainView', inter: discord.Interaction[Nayu
                         ),
                         color=discord.Color.red()
                     )
+                    hint = get_hint(previous_word, used_words, inter) if previous_word else None
+                    if hint:
+                        embed_timeout.add_field(name='💡 Uma palavra possível era:', value=f'```{hint}```')
                     await message_player.delete()
                     await inter.channel.send(embed=embed_timeout)
                     players.remove(player)
@@ -1,5 +1,5 @@
 import discord
-from typing import TYPE_CHECKING, List, Dict, Literal, Any
+from typing import TYPE_CHECKING, List, Dict, Literal, Any, Optional, Set
 from datetime import datetime
 
 import re
@@ -21,11 +21,29 @@ def configure_player_button(button: 'ConfirmPlayer'):
     button.label = None
     button.emoji = Emoji.check
 
+def has_valid_shape(word: str) -> bool:
+    """Verifica se a palavra tem pelo menos 3 letras e uma vogal entre as duas últimas."""
+    return len(word) >= 3 and re.search(r'[aeiou].$|.[aeiou]$', word) is not None
+
 def validate_word_shiritori(word: str, inter: discord.Interaction[NayulCore]) -> bool:
-    if len(word) < 3 or not re.search(r'[aeiou].$|.[aeiou]$', word):
+    if not has_valid_shape(word):
         return False
     
-    return word in inter.client.word_manager.words_list
+    return inter.client.word_manager.lookup(word) is not None
+
+def get_hint(word: str, used_words: Set[str], inter: discord.Interaction[NayulCore]) -> Optional[str]:
+    """
+    Sorteia uma palavra válida que continuaria a partir de `word`.
+
+    Args:
+        word (`str`): A palavra anterior.
+        used_words (`Set[str]`): Palavras já usadas na partida.
+        inter (`discord.Interaction`): Interação da partida.
+
+    Returns:
+        Optional[str]: A palavra sorteada, ou `None` se não existir nenhuma continuação.
+    """
+    return inter.client.word_manager.random_continuation(word[-2:], exclude=used_words, predicate=has_valid_shape)
 
 def get_time_limit(used_words_count: int) -> int:
     """
@@ -119,4 +137,4 @@ def update_player_stats(
     if action == 'end':
         player_stats['end'] = value if value is not None else datetime.now()
     elif action == 'words_list' and isinstance(value, str):
-        player_stats['words_list'].append(value)
\ No newline at end of file
+        player_stats['words_list'].append(value)
@@ -24,10 +24,11 @@ class ResponseModal(ui.Modal):
         self.add_item(self.guess)
     
     async def on_submit(self, inter: discord.Interaction[NayulCore]):
-        word = self.guess.value.lower() # Pega a resposta do modal e deixa em minúscula
+        # Pega a resposta do modal e a converte para a forma da lista, ignorando acentos (ex: "agua" -> "água")
+        word = inter.client.word_manager.resolve_wordle_guess(self.guess.value) if self.guess.value.isalpha() else None
 
         # Verifica se a resposta não é somente palavras ou se a palavra está na lista
-        if (not word.isalpha()) or (word not in inter.client.word_manager.five_letter_words) or (word not in inter.client.word_manager.words_list):
+        if word is None:
             await inter.response.send_message(f'{Emoji.error} A palavra fornecida não é válida ou não está na lista de palavras permitidas.', ephemeral=True)
             return
         
@@ -2,11 +2,11 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 
-import random
 from typing import Set
 
 from src import NayulCore
 from src.utils import nayul_decorators
+from src.utils.emojis import Emoji
 from ._internal.shiritori import MainView as MainViewShiritori
 from ._internal.wordle import MainView as MainViewWordle
 
@@ -47,7 +47,10 @@ class PlayGames(commands.Cog):
     async def wordle(self, inter: discord.Interaction[NayulCore]):
         """Inicia uma partida de Wordle."""
 
-        word = random.choice(list(self.nayul.word_manager.five_letter_words)) # Pega uma palavra aleatória da lista de palavras
+        word = self.nayul.word_manager.random_answer() # Pega uma palavra aleatória da lista de palavras
+        if word is None:
+            await inter.response.send_message(f'{Emoji.error} A lista de palavras ainda não foi carregada. Tente novamente mais tarde.', ephemeral=True)
+            return
         view = MainViewWordle(inter.user, word, [], inter=inter)
         await inter.response.send_message(view=view)
 
@@ -136,9 +136,9 @@ class GitHubCommands(commands.Cog):
         )
 
         if added:
-            self.nayul.word_manager.five_letter_words.update(added)
+            self.nayul.word_manager.add_wordle_words(added)
         else:
-            self.nayul.word_manager.five_letter_words.difference_update(removed)
+            self.nayul.word_manager.remove_wordle_words(removed)
 
         return added if added else removed
 
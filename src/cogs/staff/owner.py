@@ -1,7 +1,13 @@
+import os
+import time
 import discord
 from discord.ext import commands
 
+from datetime import datetime
+from typing import Optional
+
 from src import NayulCore
+from database.transfer import COLLECTIONS, export_database, import_database
 
 class OwnerCommands(commands.Cog):
     def __init__(self, nayul: NayulCore):
@@ -51,6 +57,79 @@ class OwnerCommands(commands.Cog):
             staffs.append(f'{user.name} - {user.id}')
         await ctx.reply('\n'.join(staffs) or 'Nenhum staff encontrado.', delete_after=120, mention_author=False)
 
+    #-------------------- Database --------------------#
+
+    @commands.command(name='dbstats', description='Mostra a latência do banco de dados.')
+    @commands.is_owner()
+    async def dbstats(self, ctx: commands.Context[NayulCore], namespace: Optional[str] = None):
+        """Mostra a latência dos comandos do MongoDB por coleção, as consultas lentas e os caches."""
+        stats = self.nayul.db.stats(namespace)
+        commands_stats = sorted(stats['commands'].items(), key=lambda item: item[1]['p99_ms'], reverse=True)
+
+        lines = [f'{"comando":<32} {"n":>7} {"err":>4} {"p50":>7} {"p99":>7} {"max":>8}']
+        for name, data in commands_stats[:15]:
+            lines.append(f'{name[:32]:<32} {data["count"]:>7} {data["errors"]:>4} {data["p50_ms"]:>6.1f}ms {data["p99_ms"]:>6.1f}ms {data["max_ms"]:>7.1f}ms')
+
+        cache = stats['users_cache']
+        lines.append('')
+        lines.append(f'Cache de usuários: {cache["size"]}/{cache["maxsize"]} | acertos {cache["hits"]} | falhas {cache["misses"]} | taxa {cache["hit_rate"]:.1%}')
+        lines.append(f'Updates pendentes (write-behind): {stats["users_pending_writes"]}')
+        lines.append(f'Usuários com cooldown ativo: {stats["active_cooldowns"]}')
+        lines.append(f'Entradas do ledger na fila: {stats["ledger_queue"]}')
+
+        if stats['slow']:
+            lines.append('')
+            lines.append('Consultas lentas recentes:')
+            for sample in list(stats['slow'])[-5:]:
+                lines.append(f'- {sample["command"]} {sample["namespace"]} {sample["duration_ms"]:.1f}ms: {sample["detail"][:120]}')
+
+        await ctx.reply(f'Estatísticas desde <t:{int(stats["since"])}:R>:```\n' + '\n'.join(lines)[:1850] + '```', delete_after=120, mention_author=False)
+
+    @commands.command(name='backup', description='Exporta as coleções do banco de dados.')
+    @commands.is_owner()
+    async def backup(self, ctx: commands.Context[NayulCore], *collections: str):
+        """Exporta os usuários, as skins, as configurações e o ledger de pérolas para `backups/<data>` em NDJSON comprimido."""
+        if any(name not in COLLECTIONS for name in collections):
+            await ctx.reply(f'Coleções disponíveis: {", ".join(COLLECTIONS)}.', delete_after=60, mention_author=False)
+            return
+
+        directory = os.path.join('backups', datetime.now().strftime('%Y-%m-%d_%H-%M-%S'))
+        start = time.perf_counter()
+        try:
+            await self.nayul.db.users.flush()
+            await self.nayul.db.ledger.flush()
+            counts = await export_database(self.nayul.db.client, directory, names=collections or None)
+        except Exception as e:
+            await ctx.reply(f'Erro ao exportar o banco de dados: {e}', delete_after=60, mention_author=False)
+            return
+        summary = ', '.join(f'{name}: {count}' for name, count in counts.items())
+        await ctx.reply(f'Backup salvo em `{directory}` em {time.perf_counter() - start:.1f}s ({summary}).', delete_after=120, mention_author=False)
+
+    @commands.command(name='restore', description='Importa as coleções de um backup.')
+    @commands.is_owner()
+    async def restore(self, ctx: commands.Context[NayulCore], directory: str, *collections: str):
+        """Importa um backup gerado com `backup`, substituindo os documentos com o mesmo ID, e recarrega os caches."""
+        if any(name not in COLLECTIONS for name in collections):
+            await ctx.reply(f'Coleções disponíveis: {", ".join(COLLECTIONS)}.', delete_after=60, mention_author=False)
+            return
+        if not os.path.isdir(directory):
+            await ctx.reply(f'Diretório `{directory}` não encontrado.', delete_after=60, mention_author=False)
+            return
+
+        start = time.perf_counter()
+        try:
+            await self.nayul.db.users.flush()
+            await self.nayul.db.ledger.flush()
+            counts = await import_database(self.nayul.db.client, directory, names=collections or None)
+            if 'users' in counts:
+                await self.nayul.db.ledger.record_balances() # Os saldos restaurados passam a ser o ponto de partida do ledger
+            await self.nayul.db.reload()
+        except Exception as e:
+            await ctx.reply(f'Erro ao importar o backup: {e}', delete_after=60, mention_author=False)
+            return
+        summary = ', '.join(f'{name}: {count}' for name, count in counts.items()) or 'nenhum arquivo encontrado'
+        await ctx.reply(f'Backup importado em {time.perf_counter() - start:.1f}s ({summary}).', delete_after=120, mention_author=False)
+
     #-------------------- Cog Manager --------------------#
         
     @commands.group(name='cog')
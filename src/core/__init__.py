@@ -86,6 +86,8 @@ class NayulCore(commands.AutoShardedBot):
     async def close(self):
         """Método chamado quando o bot é fechado."""
         log.info('Desconectando...')
+        if self.db is not None:
+            await self.db.close()
         await self.session.close()
         await super().close()
         log.info('🔴 Bot desconectado.')
\ No newline at end of file
@@ -1,46 +1,451 @@
+import os
+import json
+import random
+import asyncio
 import logging
-from typing import TYPE_CHECKING, Set
+import aiohttp
+from array import array
+from heapq import merge
+from datetime import date, datetime
+from zoneinfo import ZoneInfo
+from functools import lru_cache
+from unidecode import unidecode
+from typing import TYPE_CHECKING, Callable, Collection, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 if TYPE_CHECKING:
     from src import NayulCore
 
 from env import ENV
+from .word_store import WordMap, WordSelection, WordStore
 
 log = logging.getLogger(__name__)
 
+PREFIX_SIZE = 2 # O Shiritori liga as palavras pelas duas últimas letras
+CACHE_DIR = os.path.join('.cache', 'words') # Cópia local das listas, usada quando a API está fora do ar
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=30)
+WORDLE_ENDPOINT = 'words/wordle/pt.txt'
+DAILY_EPOCH = date(2025, 1, 1) # Primeiro dia da agenda de palavras diárias do Termo
+DAILY_SEED = 'nayul-termo'
+DAILY_WINDOW = 365 # Dias em que uma palavra diária não se repete (limitado a 1/3 da lista)
+ALL_WORDS_ENDPOINT = 'words/all/pt.txt'
+
+def _normalize(word: str) -> str:
+    word = word.strip().lower()
+    return word if word.isascii() else unidecode(word)
+
+@lru_cache(maxsize=4096)
+def normalize_word(word: str) -> str:
+    """Deixa a palavra em minúsculas e sem acentos (ex: `Água` -> `agua`), com cache das mais recentes.
+    Args:
+        word (`str`): A palavra digitada.
+    """
+    return _normalize(word)
+
 class WordManager:
     """Classe responsável por gerenciar as palavras do jogo Shiritori."""
 
     def __init__(self):
-        self.words_list: Set[str] = set()
+        self.words_list: Union[Set[str], WordStore] = set()
         self.five_letter_words: Set[str] = set()
+        self._prefixes: Dict[str, Sequence[str]] = {}
+        self._canonical: Mapping[str, str] = {} # Forma sem acentos -> palavra original, só das que têm acento
+        self._answers: Tuple[str, ...] = () # `five_letter_words` ordenada, para sortear em O(1)
+        self._answer_keys: Dict[str, str] = {} # Forma sem acentos -> palavra do Termo
+        self._cycles: Dict[int, Tuple[str, ...]] = {}
+        self._daily: Dict[date, str] = {}
+        self._revalidation: Optional[asyncio.Task] = None
 
     async def load_words(self, nayul: 'NayulCore'):
         """Carrega as palavras do shiritori do bot.
+
+        As listas salvas em disco (`CACHE_DIR`) são usadas imediatamente e revalidadas em segundo plano
+        com GETs condicionais; só as listas sem cópia em disco são baixadas antes do bot iniciar.
         Args:
             nayul (`NayulCore`): Instância do bot.
         """
 
         log.warning('Iniciando configuração das palavras...')
 
-        wordle_words = await self.fetch_words(nayul, 'words/wordle/pt.txt') or set()
-        all_words = await self.fetch_words(nayul, 'words/all/pt.txt') or set()
+        words: Dict[str, Optional[Set[str]]] = {}
+        for endpoint in (WORDLE_ENDPOINT, ALL_WORDS_ENDPOINT):
+            words[endpoint] = await asyncio.to_thread(self._read_cache, endpoint)
+
+        cached = [endpoint for endpoint, value in words.items() if value is not None]
+        for endpoint, value in words.items():
+            if value is None:
+                words[endpoint] = await self.fetch_words(nayul, endpoint)
 
         # Atribui os resultados às variáveis da instância
-        self.words_list = all_words or set()
-        self.five_letter_words = wordle_words or set()
+        await self._apply(words)
         log.info('😄 Lista de palavras carregadas com sucesso.')
 
-    async def fetch_words(self, nayul: 'NayulCore', endpoint: str) -> Set[str]:
+        if cached and (self._revalidation is None or self._revalidation.done()):
+            self._revalidation = asyncio.create_task(self.revalidate(nayul, cached))
+
+    async def revalidate(self, nayul: 'NayulCore', endpoints: Optional[Iterable[str]] = None):
+        """Busca de novo as listas que mudaram na API e substitui as carregadas.
+        Args:
+            nayul (`NayulCore`): Instância do bot.
+            endpoints (`Optional[Iterable[str]]`): Listas revalidadas. Padrão: todas.
+        """
+        words: Dict[str, Optional[Set[str]]] = {}
+        for endpoint in endpoints or (WORDLE_ENDPOINT, ALL_WORDS_ENDPOINT):
+            words[endpoint] = await self.fetch_words(nayul, endpoint)
+        if any(value is not None for value in words.values()):
+            await self._apply(words)
+            log.info('Lista de palavras atualizada a partir da API.')
+
+    async def fetch_words(self, nayul: 'NayulCore', endpoint: str) -> Optional[Set[str]]:
         """Busca as palavras do shiritori do bot.
+
+        Usa o ETag e o Last-Modified da cópia em disco, então a API só envia a lista se ela mudou. Uma
+        lista nova é salva em disco.
         Args:
             nayul (`NayulCore`): Instância do bot.
             endpoint (str): Endpoint da API para buscar as palavras.
+
+        Returns:
+            Optional[Set[str]]: As palavras, ou `None` se a lista não mudou ou a API não respondeu.
+        """
+        metadata = await asyncio.to_thread(self._read_metadata, endpoint)
+        headers = {}
+        if metadata.get('etag'):
+            headers['If-None-Match'] = metadata['etag']
+        if metadata.get('last_modified'):
+            headers['If-Modified-Since'] = metadata['last_modified']
+
+        try:
+            async with nayul.session.get(f'{ENV.INTERNAL_API}/{endpoint}', headers=headers, timeout=FETCH_TIMEOUT) as response:
+                if response.status == 304:
+                    log.debug(f'Lista de palavras {endpoint} sem alterações.')
+                    return
+                if response.status != 200:
+                    log.critical(f'Erro ao acessar a URL: {response.status} {response.url}')
+                    return
+
+                text = await response.text()
+                metadata = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            log.critical(f'Erro ao acessar a API de palavras ({endpoint}): {e!r}')
+            return
+
+        words = self._parse(text)
+        try:
+            await asyncio.to_thread(self._write_cache, endpoint, text, metadata)
+        except OSError:
+            log.error(f'Erro ao salvar a lista de palavras {endpoint} em disco.', exc_info=True)
+        return words
+
+    async def _apply(self, words: Dict[str, Optional[Set[str]]]):
+        """Substitui as listas recebidas (`None` mantém a atual) e reconstrói os índices em uma thread."""
+        all_words = words.get(ALL_WORDS_ENDPOINT)
+        if all_words is not None:
+            self.words_list, self._canonical, self._prefixes = await asyncio.to_thread(self._build_indexes, all_words, ENV.WORDS_COMPACT)
+        wordle_words = words.get(WORDLE_ENDPOINT)
+        if wordle_words is not None:
+            self.five_letter_words = wordle_words
+            self._update_answers()
+
+    def _build_indexes(self, words: Set[str], compact: bool = False) -> Tuple[Union[Set[str], WordStore], Mapping[str, str], Dict[str, Sequence[str]]]:
+        """
+        Monta a lista de palavras, o mapa das formas sem acentos e o índice de prefixos.
+
+        No modo compacto (`WORDS_COMPACT`), a lista é um `WordStore`, e o mapa e o índice guardam só
+        posições dele (`WordSelection`); apenas as formas sem acento que não existem na lista ganham um
+        `WordStore` próprio. Sem ele, as palavras sem acento são reaproveitadas nos três índices.
+
+        Args:
+            words (`Set[str]`): As palavras.
+            compact (`bool`): Usa as estruturas compactas.
+        """
+        if not compact:
+            canonical: Dict[str, str] = {}
+            normalized: Set[str] = set()
+            for word in words:
+                key = _normalize(word)
+                normalized.add(word if key == word else key)
+                # Se a forma sem acentos também é uma palavra (ex: `esta` e `está`), ela mesma é a canônica.
+                # Entre palavras com a mesma forma (ex: `avó` e `avô`), fica a primeira em ordem alfabética,
+                # como no modo compacto.
+                if key != word and key not in words and (key not in canonical or word < canonical[key]):
+                    canonical[key] = word
+            return words, canonical, self._build_prefix_index(normalized)
+
+        store = WordStore(words)
+        plain = array('I')
+        positions: Dict[str, int] = {}
+        for index, word in enumerate(store):
+            key = _normalize(word)
+            if key == word:
+                plain.append(index)
+            elif key not in words:
+                positions.setdefault(key, index)
+        keys = WordStore(positions)
+        canonical_map = WordMap(keys, WordSelection([store], array('I', (positions[key] for key in keys))))
+
+        # As palavras sem acento e as formas sem acento novas não se repetem; juntas e em ordem, formam o índice de prefixos.
+        ordered = merge(((store[index], index) for index in plain), ((key, len(store) + index) for index, key in enumerate(keys)))
+        normalized_words = WordSelection([store, keys], array('I', (position for _, position in ordered)))
+        return store, canonical_map, self._build_prefix_index(normalized_words)
+
+    #---------- Cache em disco ----------#
+
+    @staticmethod
+    def _parse(text: str) -> Set[str]:
+        return {line.strip() for line in text.splitlines() if line.strip()}
+
+    @staticmethod
+    def _cache_path(endpoint: str) -> str:
+        return os.path.join(CACHE_DIR, endpoint.replace('/', '_'))
+
+    def _read_metadata(self, endpoint: str) -> Dict[str, Optional[str]]:
+        path = self._cache_path(endpoint)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path + '.json', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _read_cache(self, endpoint: str) -> Optional[Set[str]]:
+        try:
+            with open(self._cache_path(endpoint), encoding='utf-8') as file:
+                return self._parse(file.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            log.error(f'Erro ao ler a lista de palavras {endpoint} do disco.', exc_info=True)
+            return None
+
+    def _write_cache(self, endpoint: str, text: str, metadata: Dict[str, Optional[str]]):
+        # O arquivo e os metadados são trocados por inteiro, para nunca ficarem pela metade.
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = self._cache_path(endpoint)
+        for target, content in ((path, text), (path + '.json', json.dumps(metadata))):
+            with open(target + '.tmp', 'w', encoding='utf-8') as file:
+                file.write(content)
+            os.replace(target + '.tmp', target)
+
+    #---------- Busca sem acentos ----------#
+
+    def lookup(self, word: str) -> Optional[str]:
+        """
+        Busca uma palavra ignorando acentos e maiúsculas.
+
+        Se várias palavras têm a mesma forma sem acentos (ex: `avó` e `avô`), a forma sem acentos, se
+        existir, ou a primeira em ordem alfabética é retornada.
+
+        Args:
+            word (`str`): A palavra digitada (ex: `agua`).
+
+        Returns:
+            Optional[str]: A palavra como está na lista (ex: `água`), ou `None` se ela não existir.
+        """
+        key = normalize_word(word)
+        if key in self.words_list:
+            return key
+        return self._canonical.get(key)
+
+    def resolve_wordle_guess(self, word: str) -> Optional[str]:
+        """
+        Valida uma tentativa do Termo ignorando acentos.
+
+        A palavra digitada com os acentos certos é sempre aceita; sem eles, ela é buscada pela forma
+        sem acentos na própria lista do Termo (a primeira em ordem alfabética, se houver mais de uma).
+
+        Args:
+            word (`str`): A palavra digitada.
+
+        Returns:
+            Optional[str]: A palavra na forma usada em `five_letter_words`, ou `None` se ela não for aceita.
+        """
+        guess = word.strip().lower()
+        if guess in self.five_letter_words:
+            return guess
+        return self._answer_keys.get(normalize_word(guess))
+
+    #---------- Palavras do Termo ----------#
+
+    def add_wordle_words(self, words: Iterable[str]):
+        """Adiciona palavras à lista do Termo.
+        Args:
+            words (`Iterable[str]`): As palavras adicionadas.
+        """
+        self.five_letter_words.update(words)
+        self._update_answers()
+
+    def remove_wordle_words(self, words: Iterable[str]):
+        """Remove palavras da lista do Termo.
+        Args:
+            words (`Iterable[str]`): As palavras removidas.
+        """
+        self.five_letter_words.difference_update(words)
+        self._update_answers()
+
+    def random_answer(self) -> Optional[str]:
+        """Sorteia, em O(1), uma palavra do Termo (ou `None` se a lista estiver vazia)."""
+        if not self._answers:
+            return None
+        return random.choice(self._answers)
+
+    def daily_answer(self, day: Optional[date] = None) -> Optional[str]:
+        """
+        Obtém a palavra do Termo de um dia, a mesma para todos os jogadores.
+
+        A agenda percorre a lista em ciclos: cada ciclo é uma permutação da lista embaralhada com uma
+        semente fixa, então nenhuma palavra se repete dentro de um ciclo. No início de cada ciclo, as
+        palavras usadas nos últimos `DAILY_WINDOW` dias do ciclo anterior são trocadas com palavras do
+        meio, para que também não se repitam na virada. A palavra de um dia já consultado fica fixa até
+        o bot reiniciar, mesmo que a lista mude.
+
+        Args:
+            day (`Optional[date]`): O dia. Padrão: hoje, no horário de Brasília.
+
+        Returns:
+            Optional[str]: A palavra do dia, ou `None` se a lista estiver vazia.
+        """
+        if not self._answers:
+            return None
+        day = day or datetime.now(tz=ZoneInfo('America/Sao_Paulo')).date()
+        if day not in self._daily:
+            cycle, position = divmod((day - DAILY_EPOCH).days, len(self._answers))
+            self._daily[day] = self._cycle(cycle)[position]
+        return self._daily[day]
+
+    def _update_answers(self):
+        self._answers = tuple(sorted(self.five_letter_words))
+        self._answer_keys = {}
+        for answer in self._answers:
+            self._answer_keys.setdefault(_normalize(answer), answer)
+        self._cycles.clear()
+
+    def _shuffled(self, cycle: int) -> List[str]:
+        order = list(self._answers)
+        random.Random(f'{DAILY_SEED}:{cycle}').shuffle(order)
+        return order
+
+    def _cycle(self, cycle: int) -> Tuple[str, ...]:
+        if cycle in self._cycles:
+            return self._cycles[cycle]
+
+        order = self._shuffled(cycle)
+        # Com a janela em até 1/3 da lista, o meio sempre tem palavras suficientes para as trocas, e o
+        # fim de cada ciclo nunca é alterado (então não depende do ciclo anterior ao anterior).
+        window = min(DAILY_WINDOW, len(order) // 3)
+        if window:
+            recent = set(self._shuffled(cycle - 1)[-window:])
+            middle = [index for index in range(window, len(order) - window) if order[index] not in recent]
+            for index in range(window):
+                if order[index] in recent:
+                    swap = middle.pop()
+                    order[index], order[swap] = order[swap], order[index]
+
+        if len(self._cycles) >= 4:
+            self._cycles.clear()
+        self._cycles[cycle] = tuple(order)
+        return self._cycles[cycle]
+
+    #---------- Índice de prefixos ----------#
+
+    @staticmethod
+    def _build_prefix_index(words: Iterable[str]) -> Dict[str, Sequence[str]]:
+        """Agrupa as palavras (já sem acentos) pelas duas primeiras letras, em tuplas ordenadas (ou visões do `WordStore`/`WordSelection`)."""
+        if isinstance(words, (WordStore, WordSelection)):
+            return words.prefix_ranges(PREFIX_SIZE)
+        groups: Dict[str, List[str]] = {}
+        for word in words:
+            if len(word) >= PREFIX_SIZE:
+                groups.setdefault(word[:PREFIX_SIZE], []).append(word)
+        return {prefix: tuple(sorted(group)) for prefix, group in groups.items()}
+
+    def continuations(self, prefix: str) -> Sequence[str]:
         """
-        async with nayul.session.get(f'{ENV.INTERNAL_API}/{endpoint}') as response:
-            if response.status != 200:
-                log.critical(f'Erro ao acessar a URL: {response.status} {response.url}')
-                return
-                
-            text = await response.text()
-            return {line.strip() for line in text.splitlines() if line.strip()}
\ No newline at end of file
+        Obtém as palavras que começam com um prefixo de duas letras, sem acentos (como são digitadas no Shiritori).
+
+        Args:
+            prefix (`str`): O prefixo (ex: as duas últimas letras da palavra anterior).
+
+        Returns:
+            Sequence[str]: As palavras, em ordem alfabética.
+        """
+        return self._prefixes.get(prefix[:PREFIX_SIZE], ())
+
+    def iter_prefix(self, prefix: str) -> Iterable[str]:
+        """
+        Percorre, em ordem alfabética, as palavras que começam com um prefixo de qualquer tamanho.
+
+        Args:
+            prefix (`str`): O prefixo.
+        """
+        if isinstance(self.words_list, WordStore):
+            return self.words_list.prefix(prefix)
+        if len(prefix) >= PREFIX_SIZE:
+            return (word for word in self.continuations(prefix) if word.startswith(prefix))
+        return sorted(word for word in self.words_list if word.startswith(prefix))
+
+    def has_continuation(
+        self,
+        prefix: str,
+        exclude: Collection[str] = (),
+        predicate: Optional[Callable[[str], bool]] = None
+    ) -> bool:
+        """
+        Verifica se existe alguma palavra, fora de `exclude`, que começa com o prefixo.
+
+        Sem `predicate`, a verificação é O(1) sem `exclude` e, com ele, só as palavras excluídas são
+        percorridas. Com `predicate`, o grupo do prefixo é percorrido até a primeira palavra aceita.
+
+        Args:
+            prefix (`str`): O prefixo de duas letras.
+            exclude (`Collection[str]`): Palavras que não contam (ex: as já usadas na partida).
+            predicate (`Optional[Callable[[str], bool]]`): Condição extra que a palavra deve cumprir,
+                a mesma usada em `random_continuation`.
+        """
+        words = self.continuations(prefix)
+        if predicate is not None:
+            return any(word not in exclude and predicate(word) for word in words)
+        if not exclude:
+            return bool(words)
+        prefix = prefix[:PREFIX_SIZE]
+        used = sum(1 for word in exclude if word[:PREFIX_SIZE] == prefix and self.lookup(word) is not None)
+        return len(words) > used
+
+    def random_continuation(
+        self,
+        prefix: str,
+        exclude: Collection[str] = (),
+        predicate: Optional[Callable[[str], bool]] = None
+    ) -> Optional[str]:
+        """
+        Sorteia uma palavra que começa com o prefixo, usada como dica no Shiritori.
+
+        Tenta alguns sorteios diretos no grupo do prefixo e, se todos caírem em palavras excluídas,
+        percorre o grupo em uma ordem aleatória.
+
+        Args:
+            prefix (`str`): O prefixo de duas letras.
+            exclude (`Collection[str]`): Palavras que não podem ser sorteadas.
+            predicate (`Optional[Callable[[str], bool]]`): Condição extra que a palavra deve cumprir.
+
+        Returns:
+            Optional[str]: A palavra sorteada, ou `None` se não houver nenhuma.
+        """
+        words = self.continuations(prefix)
+        if not words:
+            return None
+
+        def accepted(word: str) -> bool:
+            return word not in exclude and (predicate is None or predicate(word))
+
+        for _ in range(8):
+            word = random.choice(words)
+            if accepted(word):
+                return word
+
+        start = random.randrange(len(words))
+        for index in range(len(words)):
+            word = words[(start + index) % len(words)]
+            if accepted(word):
+                return word
+        return None
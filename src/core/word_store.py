@@ -0,0 +1,259 @@
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union, overload
+
+class WordRange(Sequence[str]):
+    """Visão (sem cópia) de um intervalo contíguo de um `WordStore`."""
+    __slots__ = ('_store', '_start', '_stop')
+
+    def __init__(self, store: 'WordStore', start: int, stop: int):
+        self._store = store
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> Tuple[str, ...]: ...
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, Tuple[str, ...]]:
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('índice fora do intervalo')
+        return self._store[self._start + index]
+
+    def __iter__(self) -> Iterator[str]:
+        blob, offsets = self._store._blob, self._store._offsets
+        for index in range(self._start, self._stop):
+            yield blob[offsets[index]:offsets[index + 1] - 1].decode()
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        index = self._store.index_of(word)
+        return index is not None and self._start <= index < self._stop
+
+class WordStore(Sequence[str]):
+    """
+    Conjunto imutável de palavras guardado em um único bloco de bytes ordenado.
+
+    As palavras ficam ordenadas, em UTF-8, em um único `bytes` (cada uma seguida de `\\n`), com um
+    `array` de offsets indicando onde cada uma começa. Isso evita um objeto `str` e uma entrada de tabela hash por
+    palavra, o que, para uma lista de centenas de milhares de palavras, reduz a memória a uma fração
+    da de um `set`. A ordem dos bytes em UTF-8 é a mesma dos code points, então a busca binária sobre
+    os bytes segue a ordem de `sorted`.
+
+    Uma em cada `BLOCK` palavras fica também em uma lista de âncoras: a busca binária (O(log n)) começa
+    nela, com o `bisect` em C, e termina dentro de um único bloco; na pertinência, o bloco é verificado
+    com um único `bytes.find`. `prefix` devolve as palavras de um
+    prefixo como uma visão (`WordRange`), sem cópias.
+
+    Args:
+        words (`Iterable[str]`): As palavras. Repetições são descartadas.
+    """
+    __slots__ = ('_blob', '_offsets', '_anchors')
+
+    BLOCK = 32
+
+    def __init__(self, words: Iterable[str] = ()):
+        encoded = sorted({word.encode() for word in words})
+        # O `\n` antes de cada palavra permite procurar `\n<palavra>\n` dentro de um bloco.
+        self._blob = b'\n' + b''.join(word + b'\n' for word in encoded)
+        self._offsets = array('I', [1])
+        position = 1
+        for word in encoded:
+            position += len(word) + 1
+            self._offsets.append(position)
+        self._anchors: List[bytes] = encoded[::self.BLOCK]
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> WordRange: ...
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, WordRange]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError('WordStore só aceita fatias contíguas.')
+            return WordRange(self, start, max(start, stop))
+        if index < 0:
+            index += len(self)
+        return self._bytes_at(index).decode()
+
+    def __iter__(self) -> Iterator[str]:
+        blob, offsets = self._blob, self._offsets
+        for index in range(len(self)):
+            yield blob[offsets[index]:offsets[index + 1] - 1].decode()
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        key = word.encode()
+        block = bisect_left(self._anchors, key)
+        if block < len(self._anchors) and self._anchors[block] == key:
+            return True
+        if block == 0:
+            return False
+        start = (block - 1) * self.BLOCK
+        stop = min(block * self.BLOCK, len(self))
+        return self._blob.find(b'\n' + key + b'\n', self._offsets[start] - 1, self._offsets[stop]) != -1
+
+    def __sizeof__(self) -> int:
+        anchors = self._anchors.__sizeof__() + sum(anchor.__sizeof__() for anchor in self._anchors)
+        return object.__sizeof__(self) + self._blob.__sizeof__() + self._offsets.__sizeof__() + anchors
+
+    def index_of(self, word: str) -> Union[int, None]:
+        """Retorna a posição da palavra na ordem do conjunto, ou `None` se ela não existir."""
+        key = word.encode()
+        index = self._lower_bound(key)
+        if index < len(self) and self._bytes_at(index) == key:
+            return index
+        return None
+
+    def prefix(self, prefix: str) -> WordRange:
+        """
+        Obtém as palavras que começam com `prefix`, em ordem.
+
+        Returns:
+            WordRange: Uma visão das palavras, sem cópias.
+        """
+        key = prefix.encode()
+        start = self._lower_bound(key)
+        # O fim do intervalo é a primeira palavra que não começa com o prefixo.
+        stop = bisect_left(range(start, len(self)), True, key=lambda index: not self._bytes_at(index).startswith(key))
+        return WordRange(self, start, start + stop)
+
+    def prefix_ranges(self, size: int) -> Dict[str, WordRange]:
+        """
+        Agrupa as palavras pelos primeiros `size` caracteres em uma única passada.
+
+        Args:
+            size (`int`): Tamanho do prefixo.
+
+        Returns:
+            Dict[str, WordRange]: Prefixo -> visão das palavras com esse prefixo. Palavras menores que
+                `size` ficam de fora.
+        """
+        ranges: Dict[str, WordRange] = {}
+        current, start = None, 0
+        for index, word in enumerate(self):
+            key = word[:size] if len(word) >= size else None
+            if key != current:
+                if current is not None:
+                    ranges[current] = WordRange(self, start, index)
+                current, start = key, index
+        if current is not None:
+            ranges[current] = WordRange(self, start, len(self))
+        return ranges
+
+    def _bytes_at(self, index: int) -> bytes:
+        return self._blob[self._offsets[index]:self._offsets[index + 1] - 1]
+
+    def _lower_bound(self, key: bytes) -> int:
+        """Posição da primeira palavra maior ou igual a `key` (em bytes)."""
+        block = bisect_left(self._anchors, key)
+        if block == 0:
+            return 0
+        # A âncora do bloco anterior é menor que `key`, então a resposta está depois dela.
+        low = (block - 1) * self.BLOCK + 1
+        high = min(block * self.BLOCK, len(self))
+        return low + bisect_left(range(low, high), key, key=self._bytes_at)
+
+class WordSelection(Sequence[str]):
+    """
+    Sequência de palavras escolhidas de um ou mais `WordStore`, guardada só como posições.
+
+    Cada item é um inteiro em um `array('I')`: as posições do primeiro `WordStore` vêm primeiro, as do
+    segundo são somadas ao tamanho do primeiro, e assim por diante. Cada palavra ocupa 4 bytes, em vez
+    de uma cópia da string.
+
+    Args:
+        stores (`Sequence[WordStore]`): Os conjuntos de onde as palavras são lidas.
+        positions (`array`): As posições das palavras, na ordem da sequência.
+    """
+    __slots__ = ('_stores', '_positions')
+
+    def __init__(self, stores: Sequence[WordStore], positions: array):
+        self._stores = tuple(stores)
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> 'WordSelection': ...
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, 'WordSelection']:
+        if isinstance(index, slice):
+            return WordSelection(self._stores, self._positions[index])
+        position = self._positions[index]
+        for store in self._stores:
+            if position < len(store):
+                return store[position]
+            position -= len(store)
+        raise IndexError('posição fora dos conjuntos')
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._positions.__sizeof__()
+
+    def prefix_ranges(self, size: int) -> Dict[str, 'WordSelection']:
+        """Agrupa as palavras (que devem estar em ordem) pelos primeiros `size` caracteres. Veja `WordStore.prefix_ranges`."""
+        ranges: Dict[str, WordSelection] = {}
+        current, start = None, 0
+        for index, word in enumerate(self):
+            key = word[:size] if len(word) >= size else None
+            if key != current:
+                if current is not None:
+                    ranges[current] = self[start:index]
+                current, start = key, index
+        if current is not None:
+            ranges[current] = self[start:]
+        return ranges
+
+class WordMap(Mapping[str, str]):
+    """
+    Mapeamento imutável de palavra para palavra, com as chaves em um `WordStore`.
+
+    O valor da i-ésima chave (na ordem do `WordStore`) é `values[i]`; com um `WordSelection`, os valores
+    são só posições em outro conjunto.
+
+    Args:
+        keys (`WordStore`): As chaves.
+        values (`Sequence[str]`): Os valores, na ordem das chaves.
+    """
+    __slots__ = ('_keys', '_values')
+
+    def __init__(self, keys: WordStore, values: Sequence[str]):
+        self._keys = keys
+        self._values = values
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __getitem__(self, key: str) -> str:
+        index = self._keys.index_of(key) if isinstance(key, str) else None
+        if index is None:
+            raise KeyError(key)
+        return self._values[index]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __sizeof__(self) -> int:
+        return object.__sizeof__(self) + self._keys.__sizeof__() + self._values.__sizeof__()
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        index = self._keys.index_of(key)
+        return default if index is None else self._values[index]
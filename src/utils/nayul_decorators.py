@@ -29,28 +29,30 @@ def check_user_banned():
                 user = inter.author
                 nayul: NayulCore = self.nayul
             
-            user_data = await nayul.db.users.get_user(user)
+            if not nayul.db.users.is_banned(user):
+                return await func(self, inter, *args, **kwargs)
 
-            if user_data.ban_status:
-                if isinstance(inter, discord.Interaction):
-                    banned_at = user_data.ban_status.banned_at
-                    embed = discord.Embed(
-                        title='Você está banido!',
-                        color=Colors.MYSTIC_PURPLE,
-                        description=(
-                            f'Olá {inter.user.mention}, sua conta foi **banida** e não poderá utilizar nenhuma funcionalidade da {self.nayul.user.name}.\n\n'
-                            f'**Banido em:** {format_timestamp(banned_at, "F")} ({format_timestamp(banned_at, "R")})\n'
-                            f'**Motivo:** {user_data.ban_status.reason}\n'
-                        )
-                    ).set_thumbnail(url=inter.user.display_avatar.url)
-                    embed.set_footer(text='Se você acredita que isso é um erro, entre em contato com a equipe do bot.')
-                    await inter.response.send_message(
-                        embed=embed,
-                        ephemeral=True,
-                        allowed_mentions=discord.AllowedMentions.none()
-                    )
-                return
+            # Só carrega os dados completos quando o usuário está banido, para mostrar o motivo e a data
+            if isinstance(inter, discord.Interaction):
+                user_data = await nayul.db.users.get_user(user)
+                if user_data.ban_status is None:
+                    return await func(self, inter, *args, **kwargs)
 
-            return await func(self, inter, *args, **kwargs)
+                banned_at = user_data.ban_status.banned_at
+                embed = discord.Embed(
+                    title='Você está banido!',
+                    color=Colors.MYSTIC_PURPLE,
+                    description=(
+                        f'Olá {inter.user.mention}, sua conta foi **banida** e não poderá utilizar nenhuma funcionalidade da {nayul.user.name}.\n\n'
+                        f'**Banido em:** {format_timestamp(banned_at, "F")} ({format_timestamp(banned_at, "R")})\n'
+                        f'**Motivo:** {user_data.ban_status.reason}\n'
+                    )
+                ).set_thumbnail(url=inter.user.display_avatar.url)
+                embed.set_footer(text='Se você acredita que isso é um erro, entre em contato com a equipe do bot.')
+                await inter.response.send_message(
+                    embed=embed,
+                    ephemeral=True,
+                    allowed_mentions=discord.AllowedMentions.none()
+                )
         return wrapper
     return decorator
\ No newline at end of file
@@ -1,6 +1,6 @@
 import yaml
 from env import ENV
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Union, Literal
 
 class Colors:
@@ -25,7 +25,7 @@ def format_timestamp(date: Union[datetime, int, str], style: Literal['t','T','f'
 	"""Formata o timestamp.
 	Args:
 		date (`Union[datetime, int, str]`): Data a ser formatada.
-			- `datetime`: Objeto datetime.
+			- `datetime`: Objeto datetime (sem fuso, é tratado como UTC).
 			- `int`: Timestamp em segundos.
 			- `str`: Data no formato ISO: "YYYY-MM-DD HH:MM[:SS]".
 		style (`Literal['t','T','f','F','d','D','R']`): Estilo de formatação.
@@ -42,6 +42,8 @@ def format_timestamp(date: Union[datetime, int, str], style: Literal['t','T','f'
 		ValueError: Se o valor `date` não for válido.
 	"""
 	if isinstance(date, datetime):
+		if date.tzinfo is None: # Datas sem fuso vêm do banco de dados, em UTC
+			date = date.replace(tzinfo=timezone.utc)
 		timestamp = date.timestamp()
 	elif isinstance(date, int):
 		timestamp = date
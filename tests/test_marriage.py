@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+# `database` importa o `env`, que exige estas variáveis; os testes usam o SQLite local.
+for name, value in (('TOKEN', 'test'), ('OWNER_IDS', '0'), ('MONGO', 'mongodb://localhost'), ('INTERNAL_API', 'http://localhost')):
+    os.environ.setdefault(name, value)
+
+from database.sqlite_storage import SQLiteClient
+from database.user_db import UsersDB
+
+class DivorceTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.client = SQLiteClient(os.path.join(self.directory.name, 'test.db'))
+        self.users = UsersDB(self.client)
+        self.alice = SimpleNamespace(id=1)
+        self.bob = SimpleNamespace(id=2)
+        await self.users.update_pearls(self.alice, 'set', 101)
+        await self.users.update_pearls(self.bob, 'set', 10)
+
+    async def asyncTearDown(self) -> None:
+        await self.users.close()
+        self.client.close()
+        self.directory.cleanup()
+
+    async def _divorce(self, division_of_assets: bool) -> None:
+        await self.users.update_married(self.alice, self.bob, True, division_of_assets)
+        await self.users.update_married(self.alice, self.bob, False)
+
+    async def test_divorce_splits_pearls(self) -> None:
+        await self._divorce(division_of_assets=True)
+
+        alice = await self.users.get_user(self.alice)
+        bob = await self.users.get_user(self.bob)
+        self.assertEqual((alice.pearls, bob.pearls), (56, 55))
+        self.assertIsNone(alice.married_status)
+        self.assertIsNone(bob.married_status)
+
+        # O cache e o banco de dados devem concordar.
+        self.users.cache.clear()
+        self.assertEqual((await self.users.get_user(self.alice)).pearls, 56)
+        self.assertEqual((await self.users.get_user(self.bob)).pearls, 55)
+
+    async def test_divorce_without_division_keeps_pearls(self) -> None:
+        await self._divorce(division_of_assets=False)
+
+        self.users.cache.clear()
+        alice = await self.users.get_user(self.alice)
+        bob = await self.users.get_user(self.bob)
+        self.assertEqual((alice.pearls, bob.pearls), (101, 10))
+        self.assertIsNone(alice.married_status)
+
+if __name__ == '__main__':
+    unittest.main()